@@ -0,0 +1,85 @@
+# #############################################################################
+#
+#  printBenchmark.py - developer tool: time radio log pdf generation (no printing)
+#   from synthetic entries, and check the page-sized chunking used by
+#   radiologPrint.buildRadioLogPrintTables
+#
+#   usage: python printBenchmark.py [entryCount ...]   (default 1000 5000 20000)
+#
+#   for each entry count, prints the generation time, and the number of pages
+#   compared to the number of chunks; each chunk should fill exactly one page,
+#   so more pages than chunks means a row height estimate (getPrintRowHeight)
+#   was too low: reportlab then splits that chunk itself, and the page break
+#   after it leaves a nearly blank page
+#
+#  http://github.com/ncssar/radiolog
+#
+# #############################################################################
+
+import os
+import sys
+import time
+import tempfile
+from reportlab.platypus import Table
+from radiologPrint import logRenderContext,getRadioLogPrintRows,buildRadioLogPrintTables,getRadioLogDocTemplate,renderRadioLogSection
+
+# synthetic entries: a mix of one-line and wrapping messages and locations, across 20 teams
+def getBenchmarkRows(entryCount):
+	rows=[]
+	t0=time.time()
+	for n in range(entryCount):
+		msg='benchmark message '+str(n)
+		if n%3==0:
+			msg+=' with enough text to wrap onto a second line in the message column'
+		if n%17==0:
+			msg+='; and a longer report that wraps onto a third line, which is common for clue and subject located messages'*2
+		loc='39 12.345N  120 54.321W' if n%5==0 else ''
+		rows.append([time.strftime('%H%M',time.localtime(t0+n*60)),'FROM','Team '+str(n%20+1),msg,loc,'Working',t0+n*60,'','','','operator'])
+	return rows
+
+def benchmarkRadioLogPrint(entryCounts,benchmarkDir):
+	rows=getBenchmarkRows(max(entryCounts))
+	allOk=True
+	for useOperatorLogin in [False,True]:
+		for entryCount in entryCounts:
+			pdfName=os.path.join(benchmarkDir,'benchmark_'+str(entryCount)+'.pdf')
+			start=time.perf_counter()
+			doc=getRadioLogDocTemplate(pdfName)
+			context=logRenderContext('Radio Log',1,'Benchmark','Benchmark','',useOperatorLogin) # no logo
+			context.setDocTemplate(doc)
+			flowables=buildRadioLogPrintTables(getRadioLogPrintRows(rows[0:entryCount],context),context)
+			chunkCount=len([f for f in flowables if isinstance(f,Table)]) # before build, which consumes the list
+			doc.build(flowables,onFirstPage=context.drawHeaderFooter,onLaterPages=context.drawHeaderFooter)
+			sec=time.perf_counter()-start
+			ok=doc.page==chunkCount
+			allOk=allOk and ok
+			print(f'{entryCount:6d} entries{" (operator column)" if useOperatorLogin else ""}: {sec:6.2f} sec ({1000*sec/entryCount:.2f} msec per entry); {doc.page} pages, {chunkCount} chunks{"" if ok else "  ** EXTRA PAGES **"}')
+	return allOk
+
+# team logs: several multi-page teams, each rendered the same way as an all-team-logs print
+def checkTeamLogs(benchmarkDir,entryCount=3000,teamCount=5):
+	rows=getBenchmarkRows(entryCount)
+	allOk=True
+	for k in range(teamCount):
+		team='Team '+str(k+1)
+		teamRows=[row for row in rows if row[2]==team]
+		pdfName=os.path.join(benchmarkDir,'team'+str(k+1)+'.pdf')
+		[pdfName,pageCount]=renderRadioLogSection([pdfName,team,teamRows,1,False,'Benchmark','Benchmark',''])
+		# same chunking again, just to count the chunks
+		doc=getRadioLogDocTemplate(os.path.join(benchmarkDir,'tmp.pdf'))
+		context=logRenderContext('Team: '+team,1,'Benchmark','Benchmark','',False)
+		context.setDocTemplate(doc)
+		chunkCount=len([f for f in buildRadioLogPrintTables(getRadioLogPrintRows(teamRows,context),context) if isinstance(f,Table)])
+		ok=pageCount==chunkCount
+		allOk=allOk and ok
+		print(f'{team}: {len(teamRows)} entries; {pageCount} pages, {chunkCount} chunks{"" if ok else "  ** EXTRA PAGES **"}')
+	return allOk
+
+if __name__=='__main__':
+	entryCounts=[int(arg) for arg in sys.argv[1:]] or [1000,5000,20000]
+	benchmarkDir=os.path.join(tempfile.gettempdir(),'radiolog_printBenchmark')
+	os.makedirs(benchmarkDir,exist_ok=True)
+	print('writing pdfs to '+benchmarkDir)
+	ok=benchmarkRadioLogPrint(entryCounts,benchmarkDir)
+	ok=checkTeamLogs(benchmarkDir) and ok
+	sys.exit(0 if ok else 1)
@@ -326,12 +326,18 @@ import json
 import threading
 import webbrowser
 import queue
+import heapq
+import hashlib
+import multiprocessing
+import concurrent.futures
+import logging.handlers
 from reportlab.lib import colors,utils
 from reportlab.lib.pagesizes import letter,landscape,portrait
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Image, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Image, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet,ParagraphStyle
 from reportlab.lib.units import inch
 from PyPDF2 import PdfReader,PdfWriter
+from radiologPrint import logRenderContext,getRadioLogPrintRows,buildRadioLogPrintTables,getRadioLogDocTemplate,renderRadioLogSection,initPrintWorker,printWorkerLogHandler
 from FingerTabs import *
 from pygeodesy import Datums,ellipsoidalBase,dms
 from difflib import SequenceMatcher
@@ -354,10 +360,15 @@ def jd(j):
     except Exception as e:
         logging.info(f'exception while printing json "{j}": {e}')
 
+# print worker processes (see renderRadioLogSections) run this module again when they start, since the
+#  spawn start method (the only one on Windows) loads the main module in each new process; they only
+#  need radiologPrint, so skip the command line, logging setup and ui file rebuilds there
+isPrintWorker=__name__=='__mp_main__' or '--multiprocessing-fork' in sys.argv # the latter for the frozen executable
+
 # process command-line arguments
 develMode=False
 noSend=False
-if len(sys.argv)>1:
+if len(sys.argv)>1 and not isPrintWorker:
 	for arg in sys.argv[1:]:
 		if arg.lower()=="-devel":
 			develMode=True
@@ -444,11 +455,17 @@ for n in range (1,13):
 
 teamStatusDict={}
 teamFSFilterDict={}
-teamTimersDict={}
+# teamLastContactDict: key=extTeamName  val=epoch seconds of last contact, or -1 if the team should never time out;
+#  elapsed time is derived on demand with getTeamSecondsSinceContact, so it stays correct even if the GUI thread stalls
+teamLastContactDict={}
 teamCreatedTimeDict={}
 
 versionDepth=5 # how many backup versions to keep; see _saveWorker
 
+# clue dates are written to the clue log with this explicit format (rather than the locale-dependent '%x'),
+#  so that they can be read back the same way by the session search index regardless of locale
+clueDateFormat='%m/%d/%y'
+
 #752 - change continueSec to a config file option, default=20
 # continueSec=20
 holdSec=20
@@ -748,7 +765,8 @@ def setLogHandlers(dir=None):
 		force=True
 	)
 
-setLogHandlers()
+if not isPrintWorker:
+	setLogHandlers()
 
 # redirect stderr to stdout here by overriding excepthook
 # from https://stackoverflow.com/a/16993115/3577105
@@ -785,25 +803,26 @@ qtQrcDir=os.path.join(installDir,qtQrcSubDir)
 qtRcPyDir=os.path.join(installDir,qtRcPySubDir)
 iconsDir=os.path.join(installDir,iconsSubDir)
 
-# rebuild all _ui.py files from .ui files in the same directory as this script as needed
-#   NOTE - this will overwrite any edits in _ui.py files
-for ui in glob.glob(os.path.join(qtDesignerDir,'*.ui')):
-	uipy=os.path.join(qtUiPyDir,os.path.basename(ui).replace('.ui','_ui.py'))
-	if not (os.path.isfile(uipy) and os.path.getmtime(uipy) > os.path.getmtime(ui)):
-		cmd='pyuic5 -o '+uipy+' '+ui
-		logging.info('Building GUI file from '+os.path.basename(ui)+':')
-		logging.info('  '+cmd)
-		os.system(cmd)
-
-# rebuild all _rc.py files from .qrc files in the same directory as this script as needed
-#   NOTE - this will overwrite any edits in _rc.py files
-for qrc in glob.glob(os.path.join(qtQrcDir,'*.qrc')):
-	rcpy=os.path.join(qtRcPyDir,os.path.basename(qrc).replace('.qrc','_rc.py'))
-	if not (os.path.isfile(rcpy) and os.path.getmtime(rcpy) > os.path.getmtime(qrc)):
-		cmd='pyrcc5 -o '+rcpy+' '+qrc
-		logging.info('Building Qt Resource file from '+os.path.basename(qrc)+':')
-		logging.info('  '+cmd)
-		os.system(cmd)
+if not isPrintWorker:
+	# rebuild all _ui.py files from .ui files in the same directory as this script as needed
+	#   NOTE - this will overwrite any edits in _ui.py files
+	for ui in glob.glob(os.path.join(qtDesignerDir,'*.ui')):
+		uipy=os.path.join(qtUiPyDir,os.path.basename(ui).replace('.ui','_ui.py'))
+		if not (os.path.isfile(uipy) and os.path.getmtime(uipy) > os.path.getmtime(ui)):
+			cmd='pyuic5 -o '+uipy+' '+ui
+			logging.info('Building GUI file from '+os.path.basename(ui)+':')
+			logging.info('  '+cmd)
+			os.system(cmd)
+
+	# rebuild all _rc.py files from .qrc files in the same directory as this script as needed
+	#   NOTE - this will overwrite any edits in _rc.py files
+	for qrc in glob.glob(os.path.join(qtQrcDir,'*.qrc')):
+		rcpy=os.path.join(qtRcPyDir,os.path.basename(qrc).replace('.qrc','_rc.py'))
+		if not (os.path.isfile(rcpy) and os.path.getmtime(rcpy) > os.path.getmtime(qrc)):
+			cmd='pyrcc5 -o '+rcpy+' '+qrc
+			logging.info('Building Qt Resource file from '+os.path.basename(qrc)+':')
+			logging.info('  '+cmd)
+			os.system(cmd)
 
 # define simple-subclasses here so they can be used during import of pyuic5-compiled _ui.py files
 class CustomPlainTextEdit(QPlainTextEdit):
@@ -884,6 +903,204 @@ def normName(name):
 def buildObjSS(objectName,style):
 	return '#'+objectName+' { '+style+' }'
 
+def getTeamSecondsSinceContact(extTeamName):
+	t=teamLastContactDict.get(extTeamName,None)
+	if t is None:
+		return 0
+	if t<0: # never times out
+		return -1
+	return int(time.time()-t)
+
+# throb the background of a widget (blue->white) with a property animation; Qt advances
+#  all running animations from its single shared animation timer, instead of the previous
+#  chain of 25 single-shot timers per throb; the animation is a child of the widget, so it
+#  is stopped and deleted along with the widget (#333)
+def throbWidget(widget):
+	anim=getattr(widget,'throbAnimation',None)
+	if anim is None:
+		anim=QVariantAnimation(widget)
+		anim.setStartValue(QColor(0,0,255))
+		anim.setEndValue(QColor(255,255,255))
+		anim.setDuration(375) # same as the previous 25 steps of 15 msec
+		anim.valueChanged.connect(lambda color:setWidgetBackground(widget,color))
+		widget.throbAnimation=anim
+	anim.stop()
+	anim.start()
+
+def setWidgetBackground(widget,color):
+	widget.palette.setColor(QPalette.Background,color)
+	widget.setPalette(widget.palette)
+
+# central font service: one shared QFont per role ('table' for the radio log tables, 'menu' for menus and
+#  tab pages, 'limited' for fixed-range text), with cached metrics; widgets get these fonts with setFont,
+#  which only relayouts and repaints (when visible), unlike setStyleSheet which re-polishes the widget (#259);
+#  setPointSize returns True only if the size actually changed, so callers can skip invalidating anything
+#  that depends on that font
+class fontService():
+	def __init__(self):
+		self.fontDict={}
+		self.metricsDict={}
+
+	def getFont(self,role):
+		if role not in self.fontDict:
+			self.fontDict[role]=QFont()
+		return self.fontDict[role]
+
+	def getMetrics(self,role):
+		if role not in self.metricsDict:
+			self.metricsDict[role]=QFontMetrics(self.getFont(role))
+		return self.metricsDict[role]
+
+	def setPointSize(self,role,size):
+		font=self.getFont(role)
+		if font.pointSize()==size:
+			return False
+		font.setPointSize(size)
+		self.metricsDict.pop(role,None)
+		return True
+
+# parseRawFix - the 4-element list of strings for convertCoords, from an origLocString as stored in
+#  radioLog (the raw fix joined with '|'); None if it is not a valid fix, same checks as fsParse
+def parseRawFix(origLocString):
+	parts=origLocString.split('|')
+	if len(parts)!=4:
+		return None
+	try:
+		float(parts[0])
+		float(parts[2])
+	except ValueError:
+		return None
+	if parts[1] not in ['N','S'] or parts[3] not in ['W','E']:
+		return None
+	return parts
+
+# coordinate conversion service, for convertCoords: converts a raw fix (4-element list of strings, as
+#  described at convertCoords) once into all of the requested formats for a datum - one pygeodesy object per
+#  fix and datum, and one UTM object shared by all UTM and USNG formats - and memoizes each result, keyed by
+#  the raw strings, the datum, and the format, since parked radios send the same fix over and over;
+#  only conversions that are not already in the cache are logged; thread-safe, since fixes are converted
+#  in the GUI thread and log locations can be re-projected in a background thread
+class coordinateService():
+	maxCacheSize=20000 # oldest results are dropped first
+
+	def __init__(self):
+		self.lock=threading.Lock()
+		self.cache={} # key = (raw tuple,datum,format); value = converted coordinates
+		self.hitCount=0
+		self.missCount=0
+
+	def getDatumKey(self,targetDatum): # 'NAD27' and 'NAD27 CONUS' are synonyms here
+		return 'NAD27' if 'NAD27' in targetDatum else 'WGS84'
+
+	def convert(self,coords,targetDatum,targetFormat):
+		return self.convertAll(coords,targetDatum,[targetFormat])[targetFormat]
+
+	# convertAll - returns a dict: key = format; value = converted coordinates
+	def convertAll(self,coords,targetDatum,targetFormats):
+		if not isinstance(coords,(list,tuple)):
+			return {targetFormat:"INVALID INPUT FORMAT - MUST BE A LIST" for targetFormat in targetFormats}
+		raw=tuple(coords)
+		datum=self.getDatumKey(targetDatum)
+		rvals={}
+		missingFormats=[]
+		with self.lock:
+			for targetFormat in targetFormats:
+				key=(raw,datum,targetFormat)
+				if key in self.cache:
+					rvals[targetFormat]=self.cache[key]
+					self.hitCount+=1
+				else:
+					missingFormats.append(targetFormat)
+		if missingFormats:
+			logging.info("convertCoords: targetDatum="+datum+" targetFormats="+str(missingFormats)+" coords="+str(coords))
+			converted=self.compute(raw,datum,missingFormats)
+			with self.lock:
+				self.missCount+=len(missingFormats)
+				for targetFormat in missingFormats:
+					self.cache[(raw,datum,targetFormat)]=converted[targetFormat]
+				while len(self.cache)>self.maxCacheSize:
+					del self.cache[next(iter(self.cache))]
+			rvals.update(converted)
+		# D.dList values are lists; return copies so that callers can't change the cached values
+		return {targetFormat:(list(rval) if isinstance(rval,list) else rval) for [targetFormat,rval] in rvals.items()}
+
+	# convertBatch - convert many fixes at once; returns a list of convertAll dicts, in the same order
+	#  as coordsList; identical fixes in the list are only looked up or converted once
+	def convertBatch(self,coordsList,targetDatum,targetFormats):
+		resultDict={}
+		rvals=[]
+		for coords in coordsList:
+			key=tuple(coords) if isinstance(coords,(list,tuple)) else coords
+			if key not in resultDict:
+				resultDict[key]=self.convertAll(coords,targetDatum,targetFormats)
+			rvals.append(dict(resultDict[key]))
+		return rvals
+
+	def compute(self,raw,datum,targetFormats):
+		latDeg=int(raw[0][0:2]) # first two numbers are degrees
+		latMin=float(raw[0][2:]) # remainder is minutes
+		lonDeg=int(raw[2][0:3]) # first three numbers are degrees
+		lonMin=float(raw[2][3:]) # remainder is minutes
+		# add decimal portion of degrees here, before changing sign for hemisphere
+		latDd=latDeg+latMin/60
+		lonDd=lonDeg+lonMin/60
+		if raw[1]=="S":
+			latDd=-latDd # invert if needed
+		if raw[3]=="W":
+			lonDd=-lonDd # invert if needed
+		# UTM Zone calculation no longer needed since pygeodesy does it internally - left here as a comment for reference
+		# targetUTMZone=math.floor((lonDd+180)/6)+1 # from http://stackoverflow.com/questions/9186496, since -120.0000deg should be zone 11, not 10
+
+		# 1. create a LLEB object from the input coordinate pair
+		g=ellipsoidalBase.LatLonEllipsoidalBase(latDd,lonDd,datum=Datums.WGS84)
+
+		# 2. convert/reproject datum if needed
+		if datum=='NAD27':
+			g=g.toDatum(Datums.NAD27)
+
+		# 3. build each requested format
+		utm=None
+		rvals={}
+		for targetFormat in targetFormats:
+			if utm is None and ('UTM' in targetFormat or 'USNG' in targetFormat):
+				utm=g.toUtm() # fewer formatting options exist for utm objects; build the strings from components
+			rvals[targetFormat]=self.format(g,utm,targetFormat)
+		return rvals
+
+	def format(self,g,utm,targetFormat):
+		# desired accuracy / digits of precision - these match caltopo, except for seconds
+		# at 39 degrees north,
+		# 0.00001 degree latitude = 1.11 meters
+		# 0.001 minute latutude = 1.85 meters
+		# 0.1 second latitude = 3.08 meters
+		# (longitude lengths are about 78% as much as latitude, at 39 degrees north)
+		if targetFormat=="D.dList":
+			return [g.lat,g.lon]
+		if targetFormat=="D.d°":
+			return g.toStr(dms.F_D,joined='  ',prec=-5)
+		if targetFormat=="D° M.m'":
+			return g.toStr(dms.F_DM,joined='  ',prec=-3,s_D="° ",s_M="'")
+		if targetFormat=="D° M' S.s\"":
+			return g.toStr(dms.F_DMS,joined='  ',prec=-1,s_D="° ",s_M="' ",s_S='"')
+		if 'UTM' in targetFormat or 'USNG' in targetFormat:
+			eStr="{0:07d}".format(round(utm.easting))
+			nStr="{0:07d}".format(round(utm.northing))
+			zone=utm.zone # utm zone
+			band=utm.band # latitude band
+			if 'FULL' in targetFormat.upper():
+				if 'SHORT' in targetFormat.upper():
+					return "{}{} {} {}".format(zone,band,eStr,nStr)
+				else:
+					return "{}{} {} {}   {} {}".format(zone,band,eStr[0:2],eStr[2:],nStr[0:2],nStr[2:])
+			if '7x7' in targetFormat:
+				if 'SHORT' in targetFormat.upper():
+					return "{} {}".format(eStr,nStr)
+				else:
+					return "{} {}   {} {}".format(eStr[0:2],eStr[2:],nStr[0:2],nStr[2:])
+			if targetFormat in ["UTM 5x5","USNG 5x5"]:
+				return "{}  {}".format(eStr[2:],nStr[2:])
+		return "INVALID - UNKNOWN OUTPUT FORMAT REQUESTED"
+
 #529 - specify a hardcoded global stylesheet to be applied to every dialog class;
 #  setting the top level style sheet when there is a lot of data can cause big delay:
 #  setting the top level stylesheet resulted in 10 second delay for ~300 entries
@@ -972,6 +1189,9 @@ class MyWindow(QDialog,Ui_Dialog):
 	_sig_clueReportMessageBoxFromThread=pyqtSignal(str)
 	_sig_processEventsFromThread=pyqtSignal()
 	_sig_clueLogMessageBoxFromThread=pyqtSignal(str)
+	_sig_reprojectBatchFromThread=pyqtSignal(object)
+	_sig_printProgressFromThread=pyqtSignal(int,int)
+	_sig_reprojectDoneFromThread=pyqtSignal(object)
 	# _sig_caltopoCreateCTSCB=pyqtSignal(bool)
 
 	def __init__(self,parent):
@@ -1124,6 +1344,11 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.setAttribute(Qt.WA_DeleteOnClose)
 		self.loadFlag=False # set this to true during load, to prevent save on each newEntry
 		self.totalEntryCount=0 # rotate backups after every 5 entries; see newEntryWidget.accept
+		self.lastBackupRotationCount=-5 # totalEntryCount at the last backup rotation; -5 so the first save also rotates
+		self.newEntryPostPending=False # see scheduleNewEntryPost
+		self.newEntryPostTeamList=[]
+		self.newEntryPostEntryList=[]
+		self.newEntryPostCount=0
 		
 		# set the team table palette - copied from main table compiled _ui.py
 		self.teamTablePalette = QPalette()
@@ -1165,6 +1390,12 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.ui.teamTabsMoreButton.setIcon(self.teamTabsMoreButtonIcon)
 		self.ui.teamTabsMoreButton.setIconSize(QtCore.QSize(20, 20))
 		self.teamTabsMoreButtonIsBlinking=False
+		# team timeouts are deadline events rather than per-second counters; each tick only processes
+		#  teams that changed, teams whose deadline has passed, and teams that are currently blinking
+		#  teamTimeoutDeadlines: heap of (deadline,extTeamName,lastContact); stale entries are skipped when popped
+		self.teamTimeoutDeadlines=[]
+		self.teamTabsDirtySet=set()
+		self.teamTabsActiveSet=set()
 		self.CCD1List=['KW-'] # if needed, KW- is appended to CCD1List after loading from config file
 
 		self.findDialog=findDialog(self)
@@ -1183,8 +1414,12 @@ class MyWindow(QDialog,Ui_Dialog):
 		# self.findDialogAnimation.setDuration(150)
 		# self.findDialogIsVisible=False # .isVisible would always return True; it's just slid left when 'hidden'
 
-		self.menuFont=QFont()
-		self.menuFont.setPointSize(14)
+		self.fonts=fontService()
+		self.coordService=coordinateService() # see convertCoords
+		self.menuFont=self.fonts.getFont('menu') # the same QFont object; its size is set in fontsChanged
+		self.fonts.setPointSize('menu',14)
+		self.teamTablesNeedingRedraw=set() # team table views whose column widths and row heights need to be recalculated when next shown
+		self.teamTablesNeedingRowResize=set() # team table views whose row heights need to be recalculated when next shown
 		self.toolTipFontSize=14
 
 		self.callsignCompletionWordList=['Relay','Transport']
@@ -1335,6 +1570,13 @@ class MyWindow(QDialog,Ui_Dialog):
 			rlInitText+=' '+usedCluesText
 		self.radioLog=[[time.strftime("%H%M"),'','',rlInitText,'','',time.time(),'','','',''],
 			['','','','','','',1e10,'','','','']] # 1e10 epoch seconds will keep the blank row at the bottom when sorted
+		self.radioLogSearchIndex=logSearchIndex() # for findDialog; updated by newEntry and by amended entries
+		self.radioLogSearchIndex.update(self.radioLog[0])
+		self.radioLogTeamIndex=teamEntryIndex() # for amendEntry, newEntryProcessTeam, and printing; updated by newEntry and by amended entries
+		self.radioLogOpPeriodIndex=opPeriodIndex() # for printing; updated by newEntry and by amended entries
+		self.radioLogOpPeriodIndex.update(self.radioLog[0])
+		self.radioLogPrintWatermarks=printWatermarkIndex() # for continuation printing; updated by newEntry and by amended entries
+		self.radioLogPrintWatermarks.update(self.radioLog[0])
 		logging.info('Initial entry: '+rlInitText)
 
 		self.clueLog=[]
@@ -1469,6 +1711,15 @@ class MyWindow(QDialog,Ui_Dialog):
 		
 ##		self.newEntryDialogList=[]
 		self.blinkToggle=0
+		# team tab styling is state-diff-driven: setStyleSheet causes a re-polish and relayout
+		#  even if the style is unchanged, so only call it when the visual state of a tab changes
+		#  teamTabStyleSheetCache: key=(styleObjectName,styleKey)  val=compiled style sheet string
+		#  teamTabVisualStateCache: key=(status,blinkToggle,timeoutLevel,hold,fsFilter)  val=(styleKey,strikeOut)
+		#  teamTabAppliedStateDict: key=extTeamName  val=[button,styleKey,strikeOut] as last applied
+		self.teamTabStyleSheetCache={}
+		self.teamTabVisualStateCache={}
+		self.teamTabAppliedStateDict={}
+		self.teamTabRestyleCount=0 # number of tab restyles during the most recent updateTeamTimers tick
 		# font size is constrained to min and max for several items
 		self.minLimitedFontSize=8
 		self.maxLimitedFontSize=20
@@ -1520,7 +1771,28 @@ class MyWindow(QDialog,Ui_Dialog):
 		#  when we could defer and just do one resize at the end of all the resizes
 ##		self.ui.tableView.horizontalHeader().sectionResized.connect(self.ui.tableView.resizeRowsToContents)
 		self.columnResizedFlag=False
+		# row heights are only recalculated when something that affects them has changed (column widths,
+		#  fonts); the timer coalesces all the sectionResized signals from a drag or a redraw into one pass
+		self.rowResizeTimer=QTimer(self)
+		self.rowResizeTimer.setSingleShot(True)
+		self.rowResizeTimer.setInterval(100)
+		self.rowResizeTimer.timeout.connect(self.resizeRowsToContentsIfNeeded)
+		self.rowHeightCache={} # key = (column,cell text,column width); value = row height needed for that cell; see resizeRowsFromCache
+		self.rowsNeedingResizeDict={} # key = table view; value = set of row numbers whose heights are stale; see resizeVisibleRows
+		self.resizingVisibleRows=False
 		self.ui.tableView.horizontalHeader().sectionResized.connect(self.setColumnResizedFlag)
+		# team table views are built when first shown, and released after not being shown for a while;
+		#  see materializeTeamTable and releaseIdleTeamTables
+		self.teamTableLastShownDict={} # key = team table view; value = time it was last shown
+		self.teamTableReleaseSec=1800
+		self.teamTableReleaseTimer=QTimer(self)
+		self.teamTableReleaseTimer.timeout.connect(self.releaseIdleTeamTables)
+		self.teamTableReleaseTimer.start(60000)
+		# window geometry is checked (and saved) shortly after the window is moved or resized
+		self.geometryCheckTimer=QTimer(self)
+		self.geometryCheckTimer.setSingleShot(True)
+		self.geometryCheckTimer.setInterval(1000)
+		self.geometryCheckTimer.timeout.connect(self.checkForResize)
 		self.ui.tableView.horizontalHeader().setMinimumSectionSize(10) # allow tiny column for operator initials
 
 		self.nonRadioClueDialogIsOpen=False
@@ -1645,25 +1917,48 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.teamNotesSaveThread=threading.Thread(target=self._teamNotesSaveWorker,args=(self.teamNotesSaveEvent,),daemon=True,name='teamNotesSaveThread')
 		self.teamNotesSaveThread.start()
 
-		# threads that create PDFs (and sending those PDFs to the printer)
-
-		self.clueReportClueData=None
-		self.clueReportEvent=threading.Event()
-		self.clueReportThread=threading.Thread(target=self._clueReportWorker,args=(self.clueReportEvent,),daemon=True,name='clueReportThread')
-		self.clueReportThread.start()
-
-		self.clueLogOpPeriod=None
+		# thread that creates PDFs (and sends those PDFs to the printer): print requests are queued as jobs,
+		#  so that a request made while another one is printing is not lost; see printJobQueue
 		self.clueLogNeedsPrintLock=threading.Lock()
-		self.clueLogEvent=threading.Event()
-		self.clueLogThread=threading.Thread(target=self._clueLogWorker,args=(self.clueLogEvent,),daemon=True,name='clueLogThread')
-		self.clueLogThread.start()
-
-		self.printLogOpPeriod=None
-		self.printLogTeams=False
+		self.clueReportTemplate=None # [[file name,modified time],template page]; see getClueReportTemplatePage
+		self.printProcessCount=max(1,min(4,(os.cpu_count() or 1)-1)) # worker processes for rendering team logs; see renderRadioLogSections
+		self.printPool=None # started on the first all-team-logs print; see getPrintPool
+		self.printPoolLogListener=None
+		self.printPoolLock=threading.Lock()
+		self.printLogProgress=[0,0] # [sections rendered,total sections] for the current team logs print
+		self.printProgressBox=None # shown while team log sections are rendered; see printProgressFromThread
 		self.radioLogNeedsPrintLock=threading.Lock()
-		self.printLogEvent=threading.Event()
-		self.printLogThread=threading.Thread(target=self._printLogWorker,args=(self.printLogEvent,),daemon=True,name='printLogThread')
-		self.printLogThread.start()
+		self.printJobs=printJobQueue()
+		self.printJobThreadList=[] # one per kind of print job; see _printJobWorker
+		for kind in printJobQueue.kinds:
+			thread=threading.Thread(target=self._printJobWorker,args=(kind,),daemon=True,name=kind+'PrintThread')
+			thread.start()
+			self.printJobThreadList.append(thread)
+
+		# thread that re-projects the locations already in radioLog and clueLog when the datum or
+		#  coordinate format is changed; see reproject
+		self.reprojectTarget=None # [datum,coordFormat]
+		self.clueRawFixDict={} # key = id(clue row); value = [clue row,origLocString]; see _reprojectWorker
+		self.reprojectBatchSize=250
+		self.reprojecting=False
+		self.reprojectEvent=threading.Event()
+		self.reprojectThread=threading.Thread(target=self._reprojectWorker,args=(self.reprojectEvent,),daemon=True,name='reprojectThread')
+		self.reprojectThread.start()
+
+		# cross-session search index over all radiolog and clue log csv files in the working dir(s);
+		#  maintained in the background, only re-reading new or changed files; see searchSessions
+		self.sessionSearchIndexDirName='radiolog_sessionSearchIndex' # one json file per indexed csv file
+		self.sessionSearchIndex=logSearchIndex() # updated in place, one file at a time, under sessionSearchLock
+		self.sessionSearchFileDict={} # key = csv file name; value = dict of file info, records, and the rows in sessionSearchIndex
+		self.sessionSearchLock=threading.Lock()
+		self.sessionSearchIndexLoaded=False # True once the stored per-file index has been read
+		self.sessionSearchIndexTime=0
+		self.sessionSearchDialog=None # created on first use; see sessionSearchDialogShow
+		self.sessionSearchIndexing=False
+		self.sessionSearchIndexEvent=threading.Event()
+		self.sessionSearchIndexThread=threading.Thread(target=self._sessionSearchIndexWorker,args=(self.sessionSearchIndexEvent,),daemon=True,name='sessionSearchIndexThread')
+		self.sessionSearchIndexThread.start()
+		QTimer.singleShot(30000,self.sessionSearchIndexEvent.set) # don't compete with startup
 
 		##########################
 		### END file thread setup
@@ -1681,14 +1976,6 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.teamTimer.timeout.connect(self.updateClock)
 		self.teamTimer.start(1000)
 
-		self.slowTimer=QTimer(self)
-		self.slowTimer.timeout.connect(self.checkForResize)
-		self.slowTimer.start(5000)
-
-		self.fastTimer=QTimer(self)
-		self.fastTimer.timeout.connect(self.resizeRowsToContentsIfNeeded)
-		self.fastTimer.start(100)
-
 # 		self.ui.tabWidget.insertTab(0,QWidget(),'TEAMS:')
 # ##		self.ui.tabWidget.setStyleSheet("font-size:12px")
 # 		self.ui.tabWidget.setTabEnabled(0,False)
@@ -1697,11 +1984,20 @@ class MyWindow(QDialog,Ui_Dialog):
 
 		self.ui.tabWidget.setContextMenuPolicy(Qt.CustomContextMenu)
 		self.ui.tabWidget.customContextMenuRequested.connect(self.tabContextMenu)
+		self.ui.tabWidget.currentChanged.connect(self.teamTabChanged)
 
 		self.newEntryWindow=newEntryWindow(self) # create the window but don't show it until needed
 		# self.NEWFlags=Qt.WindowTitleHint|Qt.WindowStaysOnTopHint
 		# self.newEntryWindow.setWindowFlags(self.NEWFlags)
 		self.newEntryWindow.setWindowFlags(Qt.WindowTitleHint)
+		self.teamTimer.timeout.connect(self.newEntryWindow.tick)
+
+		# pool of pre-built (but not yet activated) newEntryWidgets, so that openNewEntry doesn't
+		#  need to wait for a full widget build; refilled one widget at a time in idle time
+		self.newEntryWidgetPool=[]
+		self.newEntryWidgetPoolSize=3
+		self.newEntryWidgetPoolRefillPending=False
+		self.scheduleNewEntryWidgetPoolRefill(2000)
 
 		self.newEntryWindowHiddenPopup=QMessageBox(QMessageBox.NoIcon,'Pending entry','A new entry / clue report / subject-located report is pending, but its window lost focus and may be hidden.\n\nYou can leave this reminder window open, and move it out of the way if needed, while you work in whatever window took focus.',
 					QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
@@ -1763,6 +2059,9 @@ class MyWindow(QDialog,Ui_Dialog):
 		self._sig_clueReportMessageBoxFromThread.connect(self.clueReportMessageBoxFromThread)
 		self._sig_processEventsFromThread.connect(self.processEventsFromThread)
 		self._sig_clueLogMessageBoxFromThread.connect(self.clueLogMessageBoxFromThread)
+		self._sig_reprojectBatchFromThread.connect(self.reprojectBatch)
+		self._sig_printProgressFromThread.connect(self.printProgressFromThread)
+		self._sig_reprojectDoneFromThread.connect(self.reprojectDone)
 		# self._sig_caltopoCreateCTSCB.connect(self.caltopoCreateCTSCB_mainThread)
 
 		# # thread/queue/signal mechanism for radio markers, similar to the mechanism for requests in caltopo_python
@@ -1791,7 +2090,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.ui.tableView.setCurrentIndex(QModelIndex())
 		self.ui.tableView.clearFocus() # to get rid of dotted focus box around cell 0,0
 		for teamTable in self.ui.tableViewList:
-			if not isinstance(teamTable,str): # 'dummy' is the default initial entry
+			if teamTable and not isinstance(teamTable,str): # 'dummy' is the default initial entry; None if not built yet
 				teamTable.setCurrentIndex(QModelIndex())
 				teamTable.clearFocus()
 
@@ -1835,27 +2134,32 @@ class MyWindow(QDialog,Ui_Dialog):
 		except Exception as e:
 			logging.error(f'  Could not check for new version: {e}')
 
+	# all .csv files in the places where sessions are saved; used by getSessions and by the session search index
+	def getWorkingDirCsvFiles(self):
+		logging.info('gs0')
+		csvFiles=glob.glob(self.firstWorkingDir+'/*/*.csv') # files nested in session dirs
+		logging.info('gs1')
+		# backwards compatibility: also list csv files saved flat in the working dir
+		csvFiles+=glob.glob(self.firstWorkingDir+'/*.csv')
+		logging.info('gs2')
+
+		# backwards compatibility: look in the old working directory too
+		#  copied code from radiolog.py before #522 dir structure overhaul;
+		#  could consider removing this in the future, since it grabs all .csv
+		#  files from ~\Documents
+		oldWD=os.path.join(os.getenv('HOMEPATH','C:\\Users\\Default'),'Documents')
+		if oldWD[1]!=":":
+			oldWD=os.getenv('HOMEDRIVE','C:')+oldWD
+
+		logging.info('gs3')
+		csvFiles+=glob.glob(oldWD+'/*.csv')
+		return csvFiles
+
 	def getSessions(self,sort='chronological',reverse=False,omitCurrentSession=False,fromCsvFile=None,maxFilesToCheck=999):
 		if fromCsvFile:
 			sortedCsvFiles=[fromCsvFile]
 		else:
-			logging.info('gs0')
-			csvFiles=glob.glob(self.firstWorkingDir+'/*/*.csv') # files nested in session dirs
-			logging.info('gs1')
-			# backwards compatibility: also list csv files saved flat in the working dir
-			csvFiles+=glob.glob(self.firstWorkingDir+'/*.csv')
-			logging.info('gs2')
-
-			# backwards compatibility: look in the old working directory too
-			#  copied code from radiolog.py before #522 dir structure overhaul;
-			#  could consider removing this in the future, since it grabs all .csv
-			#  files from ~\Documents
-			oldWD=os.path.join(os.getenv('HOMEPATH','C:\\Users\\Default'),'Documents')
-			if oldWD[1]!=":":
-				oldWD=os.getenv('HOMEDRIVE','C:')+oldWD
-
-			logging.info('gs3')
-			csvFiles+=glob.glob(oldWD+'/*.csv')
+			csvFiles=self.getWorkingDirCsvFiles()
 			logging.info('gs4')
 
 			csvFiles=[f for f in csvFiles if '_clueLog' not in f and '_fleetsync' not in f and '_bak' not in f and '_fsLog' not in f] # only show 'base' radiolog csv files
@@ -1982,6 +2286,160 @@ class MyWindow(QDialog,Ui_Dialog):
 		else:
 			return rval # return the whole list of dicts
 
+	def _sessionSearchIndexWorker(self,event):
+		while True:
+			event.wait()
+			event.clear()
+			self.sessionSearchIndexing=True
+			try:
+				self.updateSessionSearchIndex()
+			except Exception as e:
+				logging.info('ERROR during session search index update: '+str(e))
+			finally:
+				self.sessionSearchIndexing=False
+
+	# updateSessionSearchIndex - the index is stored as one json file per csv file, so that a pass only
+	#  rewrites the files for csv files that are new or changed (usually just the current session's csv files);
+	#  the in-memory index is updated the same way, by removing and re-adding the records of each changed file
+	def updateSessionSearchIndex(self):
+		t0=time.time()
+		indexDir=os.path.join(self.firstWorkingDir,self.sessionSearchIndexDirName)
+		if not os.path.isdir(indexDir):
+			os.makedirs(indexDir)
+		if not self.sessionSearchIndexLoaded:
+			for indexFileName in glob.glob(os.path.join(indexDir,'*.json')):
+				try:
+					with open(indexFileName,'r') as f:
+						j=json.load(f)
+					if j.get('version')==2:
+						self.setSessionSearchFile(j['fileName'],j['fileInfo'])
+				except Exception as e:
+					logging.info('session search index file '+indexFileName+' could not be read; it will be rebuilt: '+str(e))
+			self.sessionSearchIndexLoaded=True
+		csvFiles=[f for f in self.getWorkingDirCsvFiles() if '_fleetsync' not in f and '_bak' not in f and '_fsLog' not in f]
+		readCount=0
+		for fileName in csvFiles:
+			try:
+				st=os.stat(fileName)
+			except OSError:
+				continue
+			prev=self.sessionSearchFileDict.get(fileName,None)
+			if prev and prev['mtime']==st.st_mtime and prev['size']==st.st_size:
+				continue
+			fileInfo=self.readSessionSearchFile(fileName,st)
+			indexFileName=self.getSessionSearchIndexFileName(indexDir,fileName)
+			tmpFileName=indexFileName+'.tmp'
+			with open(tmpFileName,'w') as f:
+				json.dump({'version':2,'fileName':fileName,'fileInfo':fileInfo},f)
+			os.replace(tmpFileName,indexFileName) # so that an interrupted write can't corrupt the index
+			self.setSessionSearchFile(fileName,fileInfo)
+			readCount+=1
+		removedFileNames=set(self.sessionSearchFileDict.keys())-set(csvFiles)
+		for fileName in removedFileNames:
+			indexFileName=self.getSessionSearchIndexFileName(indexDir,fileName)
+			if os.path.isfile(indexFileName):
+				os.remove(indexFileName)
+			self.setSessionSearchFile(fileName,None)
+		self.sessionSearchIndexTime=time.time()
+		logging.info('session search index updated: '+str(len(self.sessionSearchFileDict))+' files ('+str(readCount)+' read, '+str(len(removedFileNames))+' removed), '+str(len(self.sessionSearchIndex.entryDict))+' entries, '+str(round(time.time()-t0,2))+' sec')
+
+	def getSessionSearchIndexFileName(self,indexDir,fileName):
+		return os.path.join(indexDir,hashlib.md5(fileName.encode()).hexdigest()+'.json')
+
+	# setSessionSearchFile - replace the indexed records of one csv file (or remove them, if fileInfo is None)
+	def setSessionSearchFile(self,fileName,fileInfo):
+		with self.sessionSearchLock:
+			prev=self.sessionSearchFileDict.pop(fileName,None)
+			if prev:
+				for row in prev['rows']:
+					self.sessionSearchIndex.remove(row)
+			if fileInfo is None:
+				return
+			# same layout as radioLog rows, through the sec column, followed by the source file and line number
+			fileInfo['rows']=[[t,to_from,team,message,'','',sec,fileName,lineNumber] for [t,to_from,team,message,sec,lineNumber] in fileInfo['records']]
+			for row in fileInfo['rows']:
+				self.sessionSearchIndex.update(row)
+			self.sessionSearchFileDict[fileName]=fileInfo
+
+	# readSessionSearchFile - returns a dict of file info and searchable records for one radiolog or clue log csv file;
+	#  each record is [time,to_from,team,message,epoch sec (or None),csv line number]
+	def readSessionSearchFile(self,fileName,st):
+		kind='clueLog' if '_clueLog' in fileName else 'radioLog'
+		fileInfo={'mtime':st.st_mtime,'size':st.st_size,'kind':kind,'incidentName':None,'records':[]}
+		try:
+			with open(fileName,'r') as csvFile:
+				csvReader=csv.reader(csvFile)
+				for row in csvReader:
+					if not row:
+						continue
+					if csvReader.line_num==1 and kind=='radioLog' and '## Radio Log data file' not in row[0]:
+						break # not a radiolog data file; keep the (empty) entry so it isn't read again until it changes
+					if row[0].startswith('#'):
+						if not fileInfo['incidentName'] and '## Incident Name:' in row[0]:
+							fileInfo['incidentName']=': '.join(row[0].split(': ')[1:]).rstrip() # provide for spaces and ': ' in incident name
+						continue
+					if kind=='radioLog' and len(row)>6:
+						try:
+							sec=float(row[6])
+						except:
+							sec=None
+						fileInfo['records'].append([row[0],row[1],row[2],row[3],sec,csvReader.line_num])
+					elif kind=='clueLog' and len(row)>4:
+						# clueLog columns: number,description,team,time,date,...
+						message=row[1]
+						if row[0]:
+							message='CLUE#'+row[0]+': '+row[1]
+						try:
+							sec=time.mktime(time.strptime(row[4]+' '+row[3],clueDateFormat+' %H%M'))
+						except:
+							sec=None
+						fileInfo['records'].append([row[3],'',row[2],message,sec,csvReader.line_num])
+		except Exception as e:
+			logging.info('could not read '+fileName+' for the session search index: '+str(e))
+		return fileInfo
+
+	# searchSessions - search all radiolog and clue log entries from all sessions in the working dir(s);
+	#  all arguments are optional; text uses the same matching as findDialog; team is compared by extTeamName;
+	#  startSec and endSec are epoch seconds; incidentName is a case-insensitive partial match;
+	#  returns a list of dicts, each including the source csv file name and line number
+	def searchSessions(self,text='',team=None,startSec=None,endSec=None,incidentName=None,maxResults=1000):
+		# refresh in the background if it's been a while; this search uses the current index
+		if not self.sessionSearchIndexing and time.time()-self.sessionSearchIndexTime>60:
+			self.sessionSearchIndexEvent.set()
+		with self.sessionSearchLock:
+			if text.strip():
+				rows=self.sessionSearchIndex.search(text)
+			else:
+				rows=sorted([entry[0] for entry in self.sessionSearchIndex.entryDict.values()],key=lambda row:row[6] or 0)
+			fileDict=dict(self.sessionSearchFileDict)
+		extTeamName=getExtTeamName(team) if team else None
+		rval=[]
+		for row in rows:
+			fileInfo=fileDict.get(row[7],{})
+			if incidentName and incidentName.lower() not in (fileInfo.get('incidentName') or '').lower():
+				continue
+			if (startSec or endSec) and row[6] is None:
+				continue
+			if startSec and row[6]<startSec:
+				continue
+			if endSec and row[6]>endSec:
+				continue
+			if extTeamName and getExtTeamName(row[2])!=extTeamName:
+				continue
+			rval.append({
+				'incidentName':fileInfo.get('incidentName'),
+				'kind':fileInfo.get('kind'),
+				'fileName':row[7],
+				'lineNumber':row[8],
+				'time':row[0],
+				'to_from':row[1],
+				'team':row[2],
+				'message':row[3],
+				'sec':row[6]})
+			if len(rval)>=maxResults:
+				break
+		return rval
+
 	# Build a nested list of radiolog session data from any sessions in the last n days;
 	#  each list element is [incident_name,last_op#,last_clue#,filename_base]
 	#  then let the user choose from these, or choose to start a new incident
@@ -2255,6 +2713,17 @@ class MyWindow(QDialog,Ui_Dialog):
 			configErr+="ERROR: specified tab group '"+str(self.tabGroups)+"' is not a list.  Using the default tabGroups group list.\n\n"
 			self.tabGroups=defaultTabGroups
 
+		# compile the tab group regular expressions once here, rather than every time the tabs are grouped;
+		#  each callsign is only classified once (see getTabGroup), so clear those results too
+		self.tabGroupRegexList=[] # [group name,compiled regex]
+		for grp in self.tabGroups:
+			try:
+				# account for leading 'z_' and any zeros introduced by getExtTeamName
+				self.tabGroupRegexList.append([grp[0],re.compile(grp[1].replace("^","^z_0*").replace("Team ","Team"),re.IGNORECASE)])
+			except Exception as e:
+				configErr+="ERROR: specified tab group '"+str(grp)+"' is not a valid [name,regular expression] pair: "+str(e)+".  This group will not be used.\n\n"
+		self.tabGroupDict={} # key = extTeamName; value = group name
+
 		if not self.continuedIncidentWindowDays.isdigit():
 			configErr+="ERROR: continuedIncidentWindowDays value must be an integer.  Will use 4 days for this session.\n\n"
 			self.continuedIncidentWindowDays=4
@@ -2280,15 +2749,116 @@ class MyWindow(QDialog,Ui_Dialog):
 
 	def setColumnResizedFlag(self):
 		self.columnResizedFlag=True
+		if not self.rowResizeTimer.isActive():
+			self.rowResizeTimer.start()
 
 	def resizeRowsToContentsIfNeeded(self):
 		if self.columnResizedFlag and not self.loadFlag:
 			self.columnResizedFlag=False
-			self.ui.tableView.resizeRowsToContents()
+			self.resizeRowsFromCache(self.ui.tableView)
 			self.ui.tableView.scrollToBottom()
-			for n in self.ui.tableViewList[1:]:
-				n.resizeRowsToContents()
-		
+			# only the team table that is currently shown needs to be done now; see teamTabChanged
+			current=self.ui.tabWidget.currentIndex()
+			for i in range(1,len(self.ui.tableViewList)):
+				if not self.ui.tableViewList[i]: # not built yet
+					continue
+				if i==current:
+					self.resizeRowsFromCache(self.ui.tableViewList[i])
+				else:
+					self.teamTablesNeedingRowResize.add(self.ui.tableViewList[i])
+		elif self.columnResizedFlag: # try again after load or redraw is done
+			self.rowResizeTimer.start()
+
+	# resizeRowsFromCache - same result as resizeRowsToContents, for the rows that are shown: all rows are marked
+	#  as stale, then only the rows in view are measured now; the rest are measured as they are scrolled into view
+	def resizeRowsFromCache(self,view):
+		model=view.model()
+		if model is None:
+			return
+		if not getattr(view,'resizeVisibleRowsConnected',False):
+			view.verticalScrollBar().valueChanged.connect(functools.partial(self.resizeVisibleRows,view))
+			view.verticalScrollBar().rangeChanged.connect(functools.partial(self.resizeVisibleRows,view)) # e.g. the view got taller
+			model.rowsInserted.connect(functools.partial(self.shiftRowsNeedingResize,view,1))
+			model.rowsRemoved.connect(functools.partial(self.shiftRowsNeedingResize,view,-1))
+			view.resizeVisibleRowsConnected=True
+		self.rowsNeedingResizeDict[view]=set(range(model.rowCount()))
+		self.resizeVisibleRows(view)
+
+	# shiftRowsNeedingResize - keep the stale row numbers in step with rows that are inserted or removed above them
+	def shiftRowsNeedingResize(self,view,sign,parent,first,last):
+		rows=self.rowsNeedingResizeDict.get(view,None)
+		if not rows:
+			return
+		count=last-first+1
+		if sign>0:
+			self.rowsNeedingResizeDict[view]=set([r if r<first else r+count for r in rows])
+		else:
+			self.rowsNeedingResizeDict[view]=set([r if r<first else r-count for r in rows if r<first or r>last])
+
+	# resizeVisibleRows - measure the stale rows that are in view; each cell's height is only measured (by the
+	#  delegate, same as resizeRowsToContents) the first time that text is seen in that column at that width;
+	#  rows whose height is already correct are left alone
+	def resizeVisibleRows(self,view,*args):
+		rows=self.rowsNeedingResizeDict.get(view,None)
+		if not rows or self.resizingVisibleRows:
+			return
+		model=view.model()
+		if model is None:
+			self.rowsNeedingResizeDict.pop(view,None)
+			return
+		self.resizingVisibleRows=True # setRowHeight can scroll the view, which calls this again
+		try:
+			if len(self.rowHeightCache)>50000: # don't let it grow without bound, e.g. after many column width changes
+				self.rowHeightCache={}
+			option=view.viewOptions()
+			if view.wordWrap(): # same as resizeRowsToContents; otherwise wrapped text is measured as one line
+				option.features|=QStyleOptionViewItem.WrapText
+			columns=[c for c in range(model.columnCount()) if not view.isColumnHidden(c)]
+			widths=[view.columnWidth(c) for c in columns]
+			delegates=[view.itemDelegateForColumn(c) or view.itemDelegate() for c in columns]
+			grid=1 if view.showGrid() else 0
+			header=view.verticalHeader()
+			for attempt in range(3): # resized rows change which rows are in view
+				first=max(view.rowAt(0),0)
+				last=view.rowAt(view.viewport().height()-1)
+				if last<0:
+					last=model.rowCount()-1
+				visibleRows=[r for r in range(first,last+1) if r in rows]
+				if not visibleRows:
+					break
+				for r in visibleRows:
+					rows.discard(r)
+					h=0
+					for n in range(len(columns)):
+						index=model.index(r,columns[n])
+						key=(columns[n],index.data(),widths[n])
+						cellHeight=self.rowHeightCache.get(key,None)
+						if cellHeight is None:
+							option.rect=QRect(0,0,widths[n],view.rowHeight(r))
+							cellHeight=delegates[n].sizeHint(option,index).height()
+							self.rowHeightCache[key]=cellHeight
+						h=max(h,cellHeight)
+					h=max(h+grid,header.sectionSizeHint(r))
+					if view.rowHeight(r)!=h:
+						view.setRowHeight(r,h)
+		finally:
+			self.resizingVisibleRows=False
+
+	# teamTabChanged - do any redrawing that was deferred while this team table was not shown
+	def teamTabChanged(self,i):
+		view=self.materializeTeamTable(i)
+		if not view:
+			return
+		self.teamTableLastShownDict[view]=time.time()
+		if view in self.teamTablesNeedingRedraw:
+			self.teamTablesNeedingRedraw.discard(view)
+			self.teamTablesNeedingRowResize.add(view)
+			self.redrawTables(i)
+		if view in self.teamTablesNeedingRowResize:
+			self.teamTablesNeedingRowResize.discard(view)
+			self.resizeRowsFromCache(view)
+			view.scrollToBottom()
+
 	def fsMuteBlink(self,state):
 		if state=="on":
 			self.ui.incidentNameLabel.setText("FleetSync Muted")
@@ -2837,9 +3407,14 @@ class MyWindow(QDialog,Ui_Dialog):
 					validated=validated and nstr in ['N','S'] and wstr in ['W','E']
 					if validated:
 						logging.info("Valid location string:'"+origLocString+"'")
-						formattedLocString=self.convertCoords(locList,self.datum,self.coordFormat)
+						if self.coordService.getDatumKey(self.datum)=='WGS84': # the display format and lat/lon are both WGS84: convert once
+							converted=self.coordService.convertAll(locList,self.datum,[self.coordFormat,"D.dList"])
+							formattedLocString=converted[self.coordFormat]
+							[lat,lon]=converted["D.dList"]
+						else:
+							formattedLocString=self.convertCoords(locList,self.datum,self.coordFormat)
+							[lat,lon]=self.convertCoords(locList,targetDatum="WGS84",targetFormat="D.dList")
 						logging.info("Formatted location string:'"+formattedLocString+"'")
-						[lat,lon]=self.convertCoords(locList,targetDatum="WGS84",targetFormat="D.dList")
 						logging.info("WGS84 lat="+str(lat)+"  lon="+str(lon))
 						if valid=='A': # don't update the locator if valid=='V'
 							# sarsoft requires &id=FLEET:<fleet#>-<deviceID>
@@ -3039,63 +3614,68 @@ class MyWindow(QDialog,Ui_Dialog):
 		found=False
 		widget=None
 		logging.info(f'checking for existing open new entry tabs: fleet={fleet} dev={dev} callsign="{callsign}" continueSec={self.continueSec}')
-		for widget in newEntryWidget.instances:
+		# #452 - do a case-insensitive and spaces-removed comparison, in case Sar 1 and SAR 1 both exist, or trans 1 and Trans 1 and TRANS1, etc.
+		#  only 'FROM' entries with a matching callsign or device are candidates; use the registry
+		#  rather than checking every open widget; keep them in creation order, same as instances
+		candidates=newEntryWidget.fromCallsignDict.get(callsign.lower().replace(' ',''),[])+newEntryWidget.fromDeviceDict.get((fleet,dev),[])
+		candidates=sorted(set(candidates),key=lambda w:w.registrySeq)
+		for widget in candidates:
 			logging.info(f'checking against existing widget: fleet={widget.fleet} dev={widget.dev} to_from={widget.ui.to_fromField.currentText()} team="{widget.ui.teamField.text()}" lastModAge={widget.lastModAge}')
-			# #452 - do a case-insensitive and spaces-removed comparison, in case Sar 1 and SAR 1 both exist, or trans 1 and Trans 1 and TRANS1, etc.
 			#742 - don't open a new entry if the existing new entry widget has a child clue or subject dialog open
 			# if widget.ui.to_fromField.currentText()=="FROM" and widget.ui.teamField.text().lower().replace(' ','')==callsign.lower().replace(' ','') and widget.lastModAge<continueSec:
-			if widget.ui.to_fromField.currentText()=="FROM" and (widget.ui.teamField.text().lower().replace(' ','')==callsign.lower().replace(' ','') or (widget.fleet==fleet and widget.dev==dev)):
-				if widget.lastModAge<self.continueSec:
-					logging.info("  new entry widget is already open from this device or callsign within the 'continue time'")
-					found='continue'
-				elif widget.childDialogs:
-					logging.info('  new entry widget is already open that has child dialog/s (clue or subject located)')
-					found='child'
-				if found:
+			if widget.lastModAge<self.continueSec:
+				logging.info("  new entry widget is already open from this device or callsign within the 'continue time'")
+				found='continue'
+			elif widget.childDialogs:
+				logging.info('  new entry widget is already open that has child dialog/s (clue or subject located)')
+				found='child'
+			if found:
 ##				widget.timer.start(newEntryDialogTimeoutSeconds*1000) # reset the timeout
-				# found=True
-				# logging.info("  new entry widget is already open from this callsign within the 'continue time'; not opening a new one")
-					prevLocString=widget.ui.radioLocField.toPlainText()
-					# if previous location string was blank, always overwrite;
-					#  if previous location string was not blank, only overwrite if new location is valid
-					# logging.info('t1: prevLocString='+str(prevLocString)+'  formattedLocString='+str(formattedLocString))
-					# 753 - fix the logic that determines whether update should be attempted
-					if formattedLocString!='' and formattedLocString not in ['BAD DATA','NO FIX','WARNING','UNDEFINED','INVALID']:
-						datumFormatString="("+self.datum+"  "+self.coordFormat+")"
-						if widget.relayed:
-							logging.info("location strings not updated because the message is relayed")
-							widget.radioLocTemp=formattedLocString
-							widget.datumFormatTemp=datumFormatString
-						else:
-							logging.info("location strings updated because the message is not relayed")
-							widget.ui.radioLocField.setText(formattedLocString)
-							widget.ui.datumFormatLabel.setText(datumFormatString)
-							widget.formattedLocString=formattedLocString
-							widget.origLocString=origLocString
-					# #509: populate radio location field in any child dialogs that have that field (clue or subject located)
-					for child in widget.childDialogs:
-						logging.info('  new entry widget for '+str(callsign)+' has a child dialog; attempting to update radio location in that dialog')
+			# found=True
+			# logging.info("  new entry widget is already open from this callsign within the 'continue time'; not opening a new one")
+				prevLocString=widget.ui.radioLocField.toPlainText()
+				# if previous location string was blank, always overwrite;
+				#  if previous location string was not blank, only overwrite if new location is valid
+				# logging.info('t1: prevLocString='+str(prevLocString)+'  formattedLocString='+str(formattedLocString))
+				# 753 - fix the logic that determines whether update should be attempted
+				if formattedLocString!='' and formattedLocString not in ['BAD DATA','NO FIX','WARNING','UNDEFINED','INVALID']:
+					datumFormatString="("+self.datum+"  "+self.coordFormat+")"
+					if widget.relayed:
+						logging.info("location strings not updated because the message is relayed")
+						widget.radioLocTemp=formattedLocString
+						widget.datumFormatTemp=datumFormatString
+					else:
+						logging.info("location strings updated because the message is not relayed")
+						widget.ui.radioLocField.setText(formattedLocString)
+						widget.ui.datumFormatLabel.setText(datumFormatString)
+						widget.formattedLocString=formattedLocString
+						widget.origLocString=origLocString
+				# #509: populate radio location field in any child dialogs that have that field (clue or subject located)
+				for child in widget.childDialogs:
+					logging.info('  new entry widget for '+str(callsign)+' has a child dialog; attempting to update radio location in that dialog')
+					try:
+						# need to account for widgets that have .toPlainText() method (in clueDialog)
+						#  and widgets that have .text() method (in subjectLocatedDialog)
 						try:
-							# need to account for widgets that have .toPlainText() method (in clueDialog)
-							#  and widgets that have .text() method (in subjectLocatedDialog)
-							try:
-								prevLocString=child.ui.radioLocField.toPlainText()
-							except:
-								prevLocString=child.ui.radioLocField.text()
-							#  only populate with the radio location of the first call - don't keep updating with subsequent calls
-							#  (could be changed in the future if needed - basically, should the report include the radio coords of
-							#   the first call of the report, or of the last call of a continued conversation before the report is saved?)
-							# 753 - confirmed the decision to only keep the first valid location; clean up the logic
-							if prevLocString=='' and formattedLocString!='' and formattedLocString not in ['BAD DATA','NO FIX','WARNING','UNDEFINED','INVALID']:
-								child.ui.radioLocField.setText(formattedLocString)
+							prevLocString=child.ui.radioLocField.toPlainText()
 						except:
-							pass
-					break # to preserve 'widget' variable for use below
+							prevLocString=child.ui.radioLocField.text()
+						#  only populate with the radio location of the first call - don't keep updating with subsequent calls
+						#  (could be changed in the future if needed - basically, should the report include the radio coords of
+						#   the first call of the report, or of the last call of a continued conversation before the report is saved?)
+						# 753 - confirmed the decision to only keep the first valid location; clean up the logic
+						if prevLocString=='' and formattedLocString!='' and formattedLocString not in ['BAD DATA','NO FIX','WARNING','UNDEFINED','INVALID']:
+							child.ui.radioLocField.setText(formattedLocString)
+					except:
+						pass
+				break # to preserve 'widget' variable for use below
+		if not found: # same as the previous full scan: 'widget' is the last widget in the list, if any
+			widget=newEntryWidget.instances[-1] if newEntryWidget.instances else None
 		#750 reset team timer here, regardless of whether a new entry is opened
 		#  but only if the the team's timer already exists, to prevent error in updateTeamTimers
 		extTeamName=getExtTeamName(callsign)
-		if extTeamName in teamTimersDict:
-			teamTimersDict[extTeamName]=0
+		if extTeamName in teamLastContactDict:
+			self.setTeamLastContact(extTeamName)
 		if fleet and dev:
 			fsResult=found # False or 'continue' or 'child'
 			resultSuffix=''
@@ -3640,7 +4220,10 @@ class MyWindow(QDialog,Ui_Dialog):
 
 	def fsBuildTeamFilterDict(self):
 		for extTeamName in teamFSFilterDict:
-			teamFSFilterDict[extTeamName]=self.fsGetTeamFilterStatus(extTeamName)
+			fsFilter=self.fsGetTeamFilterStatus(extTeamName)
+			if fsFilter!=teamFSFilterDict[extTeamName]:
+				teamFSFilterDict[extTeamName]=fsFilter
+				self.teamTabsDirtySet.add(extTeamName)
 					
 	def fsBuildTooltip(self):
 		filteredHtml=""
@@ -4071,130 +4654,17 @@ class MyWindow(QDialog,Ui_Dialog):
 	#          (W along with a positive LonString means the lon value is actually negative)
 	#          12034.5678 W  --> -120deg 34.5678min
 	#   targetDatum - 'WGS84' or 'NAD27' or 'NAD27 CONUS' (the last two are synonyms in this usage)
+	#   conversions are memoized; see coordinateService
 	def convertCoords(self,coords,targetDatum,targetFormat):
-		logging.info("convertCoords called: targetDatum="+targetDatum+" targetFormat="+targetFormat+" coords="+str(coords))
-		if isinstance(coords,list):
-			latDeg=int(coords[0][0:2]) # first two numbers are degrees
-			latMin=float(coords[0][2:]) # remainder is minutes
-			lonDeg=int(coords[2][0:3]) # first three numbers are degrees
-			lonMin=float(coords[2][3:]) # remainder is minutes
-			# add decimal portion of degrees here, before changing sign for hemisphere
-			latDd=latDeg+latMin/60
-			lonDd=lonDeg+lonMin/60
-			if coords[1]=="S":
-				latDeg=-latDeg # invert if needed
-				latDd=-latDd
-			if coords[3]=="W":
-				lonDeg=-lonDeg # invert if needed
-				lonDd=-lonDd
-			# UTM Zone calculation no longer needed since pygeodesy does it internally - left here as a comment for reference
-			# targetUTMZone=math.floor((lonDd+180)/6)+1 # from http://stackoverflow.com/questions/9186496, since -120.0000deg should be zone 11, not 10
-		else:
-			return("INVALID INPUT FORMAT - MUST BE A LIST")
-
-		# 1. create a LLEB object from the input coordinate pair
-		g=ellipsoidalBase.LatLonEllipsoidalBase(latDd,lonDd,datum=Datums.WGS84)
-
-		# 2. convert/reproject datum if needed
-		if 'NAD27' in targetDatum:
-			g=g.toDatum(Datums.NAD27)
+		return self.coordService.convert(coords,targetDatum,targetFormat)
 
-		# 3. return the requested format
-		# desired accuracy / digits of precision - these match caltopo, except for seconds
-		# at 39 degrees north,
-		# 0.00001 degree latitude = 1.11 meters
-		# 0.001 minute latutude = 1.85 meters
-		# 0.1 second latitude = 3.08 meters
-		# (longitude lengths are about 78% as much as latitude, at 39 degrees north)
-		if targetFormat=="D.dList":
-			return [g.lat,g.lon]
-		if targetFormat=="D.d°":
-			return g.toStr(dms.F_D,joined='  ',prec=-5)
-		if targetFormat=="D° M.m'":
-			return g.toStr(dms.F_DM,joined='  ',prec=-3,s_D="° ",s_M="'")
-		if targetFormat=="D° M' S.s\"":
-			return g.toStr(dms.F_DMS,joined='  ',prec=-1,s_D="° ",s_M="' ",s_S='"')
-		if 'UTM' in targetFormat or 'USNG' in targetFormat:
-			g=g.toUtm() # fewer formatting options exist for utm objects; build the strings from components below
-			eStr="{0:07d}".format(round(g.easting))
-			nStr="{0:07d}".format(round(g.northing))
-			zone=g.zone # utm zone
-			band=g.band # latitude band
-			if 'FULL' in targetFormat.upper():
-				if 'SHORT' in targetFormat.upper():
-					return "{}{} {} {}".format(zone,band,eStr,nStr)
-				else:
-					return "{}{} {} {}   {} {}".format(zone,band,eStr[0:2],eStr[2:],nStr[0:2],nStr[2:])
-			if '7x7' in targetFormat:
-				if 'SHORT' in targetFormat.upper():
-					return "{} {}".format(eStr,nStr)
-				else:
-					return "{} {}   {} {}".format(eStr[0:2],eStr[2:],nStr[0:2],nStr[2:])
-			if targetFormat in ["UTM 5x5","USNG 5x5"]:
-				return "{}  {}".format(eStr[2:],nStr[2:])
-		return "INVALID - UNKNOWN OUTPUT FORMAT REQUESTED"
-
-	def printLogHeaderFooter(self,canvas,doc,opPeriod="",teams=False):
-		formNameText="Radio Log"
-		if teams:
-			if isinstance(teams,str):
-				formNameText="Team: "+teams
-			else:
-				formNameText="Team Radio Logs"
-		canvas.saveState()
-		styles = getSampleStyleSheet()
-		img=None
-		if os.path.isfile(self.printLogoFileName):
-			logging.info("valid logo file "+self.printLogoFileName)
-			imgReader=utils.ImageReader(self.printLogoFileName)
-			imgW,imgH=imgReader.getSize()
-			imgAspect=imgH/float(imgW)
-			img=Image(self.printLogoFileName,width=0.54*inch/float(imgAspect),height=0.54*inch)
-			headerTable=[
-					[img,self.agencyNameForPrint,"Incident: "+self.incidentName,formNameText+" - Page "+str(canvas.getPageNumber())],
-					["","","Operational Period: "+str(opPeriod),"Printed: "+time.strftime("%a %b %d, %Y  %H:%M")]]
-			t=Table(headerTable,colWidths=[x*inch for x in [0.8,4.2,2.5,2.5]],rowHeights=[x*inch for x in [0.3,0.3]])
-			t.setStyle(TableStyle([('FONT',(1,0),(1,1),'Helvetica-Bold'),
-										  ('FONT',(2,0),(3,0),'Helvetica-Bold'),
-								   ('FONTSIZE',(1,0),(1,1),18),
-										  ('SPAN',(0,0),(0,1)),
-										  ('SPAN',(1,0),(1,1)),
-										  ('LEADING',(1,0),(1,1),20),
-										  ('TOPADDING',(1,0),(1,0),0),
-										  ('BOTTOMPADDING',(1,1),(1,1),4),
-		 						('VALIGN',(0,0),(-1,-1),"MIDDLE"),
-								 ('ALIGN',(1,0),(1,-1),"CENTER"),
-										  ('ALIGN',(0,0),(0,1),"CENTER"),
-										  ('BOX',(0,0),(-1,-1),2,colors.black),
-										  ('BOX',(2,0),(-1,-1),2,colors.black),
-										  ('INNERGRID',(2,0),(3,1),0.5,colors.black)]))
-		else:
-			headerTable=[
-					[img,self.agencyNameForPrint,"Incident: "+self.incidentName,formNameText+" - Page "+str(canvas.getPageNumber())],
-					["","","Operational Period: ","Printed: "+time.strftime("%a %b %d, %Y  %H:%M")]]
-			t=Table(headerTable,colWidths=[x*inch for x in [0.0,5,2.5,2.5]],rowHeights=[x*inch for x in [0.3,0.3]])
-			t.setStyle(TableStyle([('FONT',(1,0),(1,1),'Helvetica-Bold'),
-								   ('FONT',(2,0),(3,0),'Helvetica-Bold'),
-								   ('FONTSIZE',(1,0),(1,1),18),
-										  ('SPAN',(0,0),(0,1)),
-										  ('SPAN',(1,0),(1,1)),
-										  ('LEADING',(1,0),(1,1),20),
-		 						('VALIGN',(1,0),(-1,-1),"MIDDLE"),
-								 ('ALIGN',(1,0),(1,-1),"CENTER"),
-										  ('BOX',(0,0),(-1,-1),2,colors.black),
-										  ('BOX',(2,0),(-1,-1),2,colors.black),
-										  ('INNERGRID',(2,0),(3,1),0.5,colors.black)]))
-		w,h=t.wrapOn(canvas,doc.width,doc.height)
+	def printLogHeaderFooter(self,canvas,doc,context):
+		context.drawHeaderFooter(canvas,doc)
 # 		self.logMsgBox.setInformativeText("Generating page "+str(canvas.getPageNumber()))
 		# QCoreApplication.processEvents()
 		self._sig_processEventsFromThread.emit()
 		logging.info("Page number:"+str(canvas.getPageNumber()))
-		logging.info("Height:"+str(h))
-		logging.info("Pagesize:"+str(doc.pagesize))
-		t.drawOn(canvas,doc.leftMargin,doc.pagesize[1]-h-0.5*inch) # enforce a 0.5 inch top margin regardless of paper size
-##		canvas.grid([x*inch for x in [0,0.5,1,1.5,2,2.5,3,3.5,4,4.5,5,5.5,6,6.5,7,7.5,8,8.5,9,9.5,10,10.5,11]],[y*inch for y in [0,0.5,1,1.5,2,2.5,3,3.5,4,4.5,5,5.5,6,6.5,7,7.5,8,8.5]])
 		logging.info("done drawing printLogHeaderFooter canvas")
-		canvas.restoreState()
 		logging.info("end of printLogHeaderFooter")
 
 	def printPDF(self,pdfName): # only called from within a background thread
@@ -4218,330 +4688,418 @@ class MyWindow(QDialog,Ui_Dialog):
 	# optonal argument 'teams': if True, generate one pdf of all individual team logs;
 	#  so, this function should be called once to generate the overall log pdf, and
 	#  again with teams=True to generate team logs pdf
-	# if 'teams' is an array of team names, just print those team log(s)
-	def printLog(self,opPeriod,teams=False):
-		logging.info(f'printLog called: opPeriod={opPeriod}  teams={teams}')
-		self.printLogOpPeriod=opPeriod
-		self.printLogTeams=teams
-		self.printLogEvent.set()
-
-	def _printLogWorker(self,event):
+	# if 'teams' is an array of team names, just print those team log(s) - one print job per team
+	# optional argument 'continuation': if True, only print the entries that were added or amended since
+	#  the previous print of the same log; see printWatermarkIndex
+	# returns the print job id (or list of ids); see printJobQueue
+	def printLog(self,opPeriod,teams=False,continuation=False):
+		logging.info(f'printLog called: opPeriod={opPeriod}  teams={teams}  continuation={continuation}')
+		if isinstance(teams,list):
+			return [self.printJobs.submit(('radioLog',int(opPeriod),str(team),bool(continuation))) for team in teams]
+		if not isinstance(teams,str):
+			teams=bool(teams)
+		return self.printJobs.submit(('radioLog',int(opPeriod),teams,bool(continuation)))
+
+	# _printJobWorker - generates and prints PDFs for one kind of print job ('clueReport','clueLog' or 'radioLog'):
+	#  takes that kind of job from printJobs, oldest first, and records each job's completion status; there is
+	#  one of these threads per kind, so that a clue report prints right away even while a long radio log
+	#  print is running; a job method returning False means the PDF could not be generated
+	def _printJobWorker(self,kind):
 		while True:
-			logging.info('_printLogWorker: waiting for event...')
-			event.wait()
-			logging.info('_printLogWorker: event received; beginning file save operations...')
-			event.clear()
-
-			self.logPrinting=True
+			logging.info('_printJobWorker: waiting for a '+kind+' print job...')
+			[jobId,job]=self.printJobs.get(kind)
+			logging.info('_printJobWorker: starting print job '+str(jobId)+': '+str(job))
+			status='done'
 			try:
-				opPeriod=int(self.printLogOpPeriod)
-				teams=self.printLogTeams
-				# pdfName=self.firstWorkingDir+"\\"+self.pdfFileName
-				pdfName=os.path.join(self.sessionDir,self.pdfFileName)
-				teamFilterList=[""] # by default, print print all entries; if teams=True, add a filter for each team
-				msgAdder=""
+				if job[0]=='clueReport':
+					result=self._clueReportJob([list(clueData) for clueData in job[1]])
+				elif job[0]=='clueLog':
+					result=self._clueLogJob(job[1])
+				else:
+					result=self._printLogJob(job[1],job[2],job[3])
+				if result is False:
+					status='failed'
+			except Exception as e:
+				logging.error(f'_printJobWorker: exception caught in order to keep the thread alive: {e}')
+				status='failed'
+			finally:
+				self.printJobs.taskDone(jobId,status)
+				logging.info('_printJobWorker: print job '+str(jobId)+' '+status)
+
+	def _printLogJob(self,opPeriod,teams,continuation=False):
+		self.logPrinting=True
+		try:
+			# pdfName=self.firstWorkingDir+"\\"+self.pdfFileName
+			pdfName=os.path.join(self.sessionDir,self.pdfFileName)
+			teamFilterList=[""] # by default, print print all entries; if teams=True, add a filter for each team
+			msgAdder=""
+			if teams:
+				if isinstance(teams,str):
+					pdfName=pdfName.replace('.pdf','_'+teams.replace(' ','_').replace('.','_')+'.pdf')
+					msgAdder=" for "+teams
+					teamFilterList=[teams]
+				else:
+					pdfName=pdfName.replace('.pdf','_teams.pdf')
+					msgAdder=" for individual teams"
+					teamFilterList=[]
+					for team in self.allTeamsList:
+						if team!="dummy":
+							teamFilterList.append(team)
+			logging.info("teamFilterList="+str(teamFilterList))
+			pdfName=pdfName.replace('.pdf','_OP'+str(opPeriod)+'.pdf')
+			watermarkKey=(opPeriod,teams)
+			watermark=self.radioLogPrintWatermarks.getWatermark(watermarkKey)
+			changeCount=self.radioLogPrintWatermarks.changeCount # entries changed after this will be in the next continuation
+			if continuation and not watermark:
+				logging.info('this log has not been printed yet; printing the full log instead of a continuation')
+				continuation=False
+			if continuation:
+				if watermark[0]==changeCount:
+					logging.info('no entries have been added or amended since the previous print'+msgAdder+'; no continuation will be printed')
+					return
+				pdfName=pdfName.replace('.pdf','_cont'+str(len(watermark[2]))+'.pdf')
+				msgAdder+=" (continuation)"
+			elif watermark and watermark[0]==changeCount:
+				# nothing has changed since this log was last printed: reprint the full document,
+				#  assembled from the earlier print and its continuations, instead of generating it again
+				assembledPdfName=self.assembleRadioLogSections(pdfName,watermark[2])
+				if assembledPdfName:
+					logging.info("no changes since the previous print; reprinting "+assembledPdfName)
+					self.printPDF(assembledPdfName)
+					with self.radioLogNeedsPrintLock:
+						self.radioLogNeedsPrint=False
+					return
+			logging.info("generating radio log pdf: "+pdfName)
+			try:
+				f=open(pdfName,"wb")
+			except:
+				msg=f'PDF could not be generated:\n\n{pdfName}\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.'
+				logging.warning(msg)
+				self._sig_blockingMessageBoxFromThread.emit(msg)
+				# self.printLogErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+pdfName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.",
+				# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+				# self.printLogErrMsgBox.show()
+				# self.printLogErrMsgBox.raise_()
+				# self.printLogErrMsgBox.exec_()
+				return False
+			else:
+				f.close()
+	# 		self.logMsgBox=QMessageBox(QMessageBox.Information,"Printing","Generating PDF"+msgAdder+"; will send to default printer automatically; please wait...",
+	# 							QMessageBox.Abort,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+	# 		self.logMsgBox.setInformativeText("Initializing...")
+	# 		self.logMsgBox.show()
+	# 		QTimer.singleShot(5000,self.logMsgBox.close)
+			# QCoreApplication.processEvents()
+			self._sig_processEventsFromThread.emit()
+			# work from a copy of radioLog, since entries can be added while printing;
+			#  find the rows of the requested operational period once, from the OP index,
+			#  then each team's rows from the team index, instead of walking the entire log per team
+			radioLog=list(self.radioLog)
+			[opRanges,opStartRowIndices]=self.radioLogOpPeriodIndex.getRanges(radioLog,opPeriod)
+			teamRowsList=[] # [team,rows]
+			for team in teamFilterList:
+				if team=="":
+					rowIndices=[n for [start,end] in opRanges for n in range(start,end)]
+				else:
+					rowIndices=set(opStartRowIndices)
+					for row in self.radioLogTeamIndex.getEntries(team)[:]:
+						n=findRowIndex(radioLog,row)
+						for [start,end] in opRanges:
+							if start<=n<end:
+								rowIndices.add(n)
+								break
+					rowIndices=sorted(rowIndices)
+				if continuation:
+					rowIndices=[n for n in rowIndices if self.radioLogPrintWatermarks.getChange(radioLog[n])>watermark[0]]
+					if not rowIndices: # nothing new for this team
+						continue
+	##			if teams and opPeriod==1: # if request op period = 1, include 'Radio Log Begins' in all team tables
+	##				radioLogPrint.append(self.radioLog[0])
+				teamRowsList.append([team,[radioLog[n][:] for n in rowIndices]])
+			if continuation and not teamRowsList:
+				logging.info('no entries in operational period '+str(opPeriod)+' have been added or amended since the previous print'+msgAdder)
+				os.remove(pdfName)
+				self.radioLogPrintWatermarks.setWatermark(watermarkKey,[changeCount]+watermark[1:])
+				return
+			pageCount=False # from renderRadioLogSections; False means render as one document below
+			# all team logs: render each team's table as a separate section (in worker processes if possible),
+			#  then merge the sections in order, so the layout is the same wherever the sections are rendered
+			if teams is True and not continuation:
+				pageCount=self.renderRadioLogSections(pdfName,teamRowsList,opPeriod)
+			if not pageCount:
+				doc=getRadioLogDocTemplate(pdfName)
+				formNameText="Radio Log"
 				if teams:
-					if isinstance(teams,list):
-						# recursively call this function for each team in list of teams
-						for team in teams:
-							self.printLog(opPeriod,team)
-					elif isinstance(teams,str):
-						pdfName=pdfName.replace('.pdf','_'+teams.replace(' ','_').replace('.','_')+'.pdf')
-						msgAdder=" for "+teams
-						teamFilterList=[teams]
+					if isinstance(teams,str):
+						formNameText="Team: "+teams
 					else:
-						pdfName=pdfName.replace('.pdf','_teams.pdf')
-						msgAdder=" for individual teams"
-						teamFilterList=[]
-						for team in self.allTeamsList:
-							if team!="dummy":
-								teamFilterList.append(team)
-				logging.info("teamFilterList="+str(teamFilterList))
-				pdfName=pdfName.replace('.pdf','_OP'+str(opPeriod)+'.pdf')
-				logging.info("generating radio log pdf: "+pdfName)
-				try:
-					f=open(pdfName,"wb")
-				except:
-					msg=f'PDF could not be generated:\n\n{pdfName}\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.'
-					logging.warning(msg)
-					self._sig_blockingMessageBoxFromThread.emit(msg)
-					# self.printLogErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+pdfName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.",
-					# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-					# self.printLogErrMsgBox.show()
-					# self.printLogErrMsgBox.raise_()
-					# self.printLogErrMsgBox.exec_()
-					# return
-					continue # don't use return in an endless loop worker - it will end the loop which will end the thread
-				else:
-					f.close()
-		# 		self.logMsgBox=QMessageBox(QMessageBox.Information,"Printing","Generating PDF"+msgAdder+"; will send to default printer automatically; please wait...",
-		# 							QMessageBox.Abort,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-		# 		self.logMsgBox.setInformativeText("Initializing...")
-				# note the topMargin is based on what looks good; you would think that a 0.6 table plus a 0.5 hard
-				# margin (see t.drawOn above) would require a 1.1 margin here, but, not so.
-				doc = SimpleDocTemplate(pdfName, pagesize=landscape(letter),leftMargin=0.5*inch,rightMargin=0.5*inch,topMargin=1.03*inch,bottomMargin=0.5*inch) # or pagesize=letter
-		# 		self.logMsgBox.show()
-		# 		QTimer.singleShot(5000,self.logMsgBox.close)
-				# QCoreApplication.processEvents()
-				self._sig_processEventsFromThread.emit()
+						formNameText="Team Radio Logs"
+				firstPageNumber=1
+				if continuation:
+					formNameText+=" (continued)"
+					firstPageNumber=watermark[1]+1
+				context=logRenderContext(formNameText,opPeriod,self.agencyNameForPrint,self.incidentName,self.printLogoFileName,self.useOperatorLogin,firstPageNumber=firstPageNumber)
+				context.setDocTemplate(doc)
 				elements=[]
-				for team in teamFilterList:
-					extTeamNameLower=getExtTeamName(team).lower()
-					radioLogPrint=[]
-					styles = getSampleStyleSheet()
-					styles.add(ParagraphStyle(
-						name='operator',
-						parent=styles['Normal'],
-						backColor='lightgrey'
-						))
-					headers=MyTableModel.header_labels[0:6]
-					if self.useOperatorLogin:
-						operatorImageFile=os.path.join(iconsDir,'user_icon_80px.png')
-						if os.path.isfile(operatorImageFile):
-							logging.info('operator image file found: '+operatorImageFile)
-							headers.append(Image(operatorImageFile,width=0.16*inch,height=0.16*inch))
-						else:
-							logging.info('operator image file not found: '+operatorImageFile)
-							headers.append('Op.')
-					radioLogPrint.append(headers)
-		##			if teams and opPeriod==1: # if request op period = 1, include 'Radio Log Begins' in all team tables
-		##				radioLogPrint.append(self.radioLog[0])
-					entryOpPeriod=1 # update this number when 'Operational Period <x> Begins' lines are found
-		##			hits=False # flag to indicate whether this team has any entries in the requested op period; if not, don't make a table for this team
-					for row in self.radioLog:
-						opStartRow=False
-		##				logging.info("message:"+row[3]+":"+str(row[3].split()))
-						if row[3].startswith("Radio Log Begins:"):
-							opStartRow=True
-						if row[3].startswith("Operational Period") and row[3].split()[3] == "Begins:":
-							opStartRow=True
-							entryOpPeriod=int(row[3].split()[2])
-						# #523: handled continued incidents
-						if row[3].startswith('Radio Log Begins - Continued incident'):
-							opStartRow=True
-							entryOpPeriod=int(row[3].split(': Operational Period ')[1].split()[0])
-		##				logging.info("desired op period="+str(opPeriod)+"; this entry op period="+str(entryOpPeriod))
-						if entryOpPeriod == opPeriod:
-							if team=="" or extTeamNameLower==getExtTeamName(row[2]).lower() or opStartRow: # filter by team name if argument was specified
-								style=styles['Normal']
-								if 'RADIO OPERATOR LOGGED IN' in row[3]:
-									style=styles['operator']
-								printRow=[row[0],row[1],row[2],Paragraph(row[3],style),Paragraph(row[4],styles['Normal']),Paragraph(row[5],styles['Normal'])]
-								if self.useOperatorLogin:
-									if len(row)>10:
-										printRow.append(row[10])
-									else:
-										printRow.append('')
-								radioLogPrint.append(printRow)
-		##						hits=True
-					if not teams:
+				for [team,rows] in teamRowsList:
+					radioLogPrint=getRadioLogPrintRows(rows,context)
+					if not teams and not continuation:
 						# #523: avoid exception	
 						try:
 							radioLogPrint[1][4]=self.datum
 						except:
 							logging.info('Nothing to print for specified operational period '+str(opPeriod))
-							# return
-							continue # don't use return in an endless loop worker - it will end the loop which will end the thread
+							continue
 					logging.info("length:"+str(len(radioLogPrint)))
-					if not teams or len(radioLogPrint)>2: # don't make a table for teams that have no entries during the requested op period
-						if self.useOperatorLogin:
-							colWidths=[x*inch for x in [0.5,0.6,1.25,5.2,1.25,0.9,0.3]]
-						else:
-							colWidths=[x*inch for x in [0.5,0.6,1.25,5.5,1.25,0.9]]
-						t=Table(radioLogPrint,repeatRows=1,colWidths=colWidths)
-						t.setStyle(TableStyle([('FONT',(0,0),(-1,-1),'Helvetica'),
-												('FONT',(0,0),(-1,1),'Helvetica-Bold'),
-												('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
-											('BOX', (0,0), (-1,-1), 2, colors.black),
-											('BOX', (0,0), (-1,0), 2, colors.black)]))
-						elements.append(t)
-						if teams and team!=teamFilterList[-1]: # don't add a spacer after the last team - it could cause another page!
-							elements.append(Spacer(0,0.25*inch))
-				doc.build(elements,onFirstPage=functools.partial(self.printLogHeaderFooter,opPeriod=opPeriod,teams=teams),onLaterPages=functools.partial(self.printLogHeaderFooter,opPeriod=opPeriod,teams=teams))
-		# 		self.logMsgBox.setInformativeText("Finalizing and Printing...")
-				self.printPDF(pdfName)
-				with self.radioLogNeedsPrintLock:
-					self.radioLogNeedsPrint=False
+					if not teams or continuation or len(radioLogPrint)>2: # don't make a table for teams that have no entries during the requested op period
+						# a spacer between teams; it is left out at the top of a page, so it can't cause another page
+						elements+=buildRadioLogPrintTables(radioLogPrint,context,spaceBefore=0.25*inch if teams else 0)
+				doc.build(elements,onFirstPage=functools.partial(self.printLogHeaderFooter,context=context),onLaterPages=functools.partial(self.printLogHeaderFooter,context=context))
+				pageCount=doc.page
+	# 		self.logMsgBox.setInformativeText("Finalizing and Printing...")
+			self.printPDF(pdfName)
+			with self.radioLogNeedsPrintLock:
+				self.radioLogNeedsPrint=False
+			if continuation:
+				self.radioLogPrintWatermarks.setWatermark(watermarkKey,[changeCount,watermark[1]+pageCount,watermark[2]+[pdfName]])
+			else:
+				self.radioLogPrintWatermarks.setWatermark(watermarkKey,[changeCount,pageCount,[pdfName]])
+
+			if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
+				logging.info("copying radio log pdf"+msgAdder+" to "+self.secondWorkingDir)
+				shutil.copy(pdfName,self.secondWorkingDir)
+		finally: # clear the flag even if there was an early exit
+			self.logPrinting=False
+
+	# renderRadioLogSections - render each team's log (that has entries during the op period) to a separate
+	#  section pdf, then merge the sections into pdfName in team order (regardless of the order they finish in),
+	#  with each team starting on a new page; sections are rendered in a pool of worker processes when there is
+	#  more than one section and more than one cpu to spare, since reportlab layout is CPU-bound and would
+	#  otherwise hold the GIL for the whole job, or in this thread otherwise (or if the pool fails), using the
+	#  same renderRadioLogSection, so the document is the same either way; progress is sent to the main thread
+	#  with _sig_printProgressFromThread; returns the page count, or False if there are no sections or the
+	#  sections could not be rendered or merged, so the caller can render the log as one document instead
+	def renderRadioLogSections(self,pdfName,teamRowsList,opPeriod):
+		sections=[]
+		for [team,rows] in teamRowsList:
+			if len(rows)>1: # don't make a table for teams that have no entries during the requested op period
+				sectionPdfName=pdfName.replace('.pdf','_section'+str(len(sections))+'.pdf')
+				sections.append([sectionPdfName,team,rows,opPeriod,self.useOperatorLogin,self.agencyNameForPrint,self.incidentName,self.printLogoFileName])
+		if len(sections)==0:
+			return False
+		results=[None]*len(sections)
+		def sectionRendered(k):
+			self.printLogProgress[0]+=1
+			self._sig_printProgressFromThread.emit(self.printLogProgress[0],len(sections))
+			logging.info('rendered team log section '+str(self.printLogProgress[0])+' of '+str(len(sections))+': '+sections[k][1]+' ('+str(results[k][1])+' page(s))')
+		self.printLogProgress=[0,len(sections)]
+		self._sig_printProgressFromThread.emit(0,len(sections))
+		try:
+			pooled=False
+			if self.printProcessCount>1 and len(sections)>1:
+				try:
+					pool=self.getPrintPool()
+					futureDict={pool.submit(renderRadioLogSection,sections[k]):k for k in range(len(sections))}
+					for future in concurrent.futures.as_completed(futureDict):
+						k=futureDict[future]
+						results[k]=future.result()
+						sectionRendered(k)
+					pooled=True
+				except Exception as e:
+					logging.warning('could not render team logs in worker processes; rendering in this thread instead: '+str(e))
+					self.shutdownPrintPool() # so the next print starts a new pool
+					results=[None]*len(sections)
+					self.printLogProgress=[0,len(sections)]
+					self._sig_printProgressFromThread.emit(0,len(sections))
+			if not pooled:
+				for k in range(len(sections)):
+					results[k]=renderRadioLogSection(sections[k])
+					sectionRendered(k)
+			outputPDF=PdfWriter()
+			for [sectionPdfName,pageCount] in results:
+				for page in PdfReader(sectionPdfName).pages:
+					outputPDF.add_page(page)
+			with open(pdfName,'wb') as out_pdf:
+				outputPDF.write(out_pdf)
+		except Exception as e:
+			logging.warning('could not render team log sections; rendering as one document instead: '+str(e))
+			return False
+		finally:
+			self._sig_printProgressFromThread.emit(len(sections),len(sections)) # done; closes the progress box
+			for section in sections:
+				if os.path.isfile(section[0]):
+					os.remove(section[0])
+		return len(outputPDF.pages)
+
+	# getPrintPool - the print worker processes are started on the first all-team-logs print, then kept for
+	#  the rest of the session, so that they only start (and load radiologPrint) once; their log records come
+	#  back through a queue to this process's log handlers, so that they are in the session log file
+	def getPrintPool(self):
+		with self.printPoolLock:
+			if not self.printPool:
+				logQueue=multiprocessing.Queue()
+				self.printPoolLogListener=logging.handlers.QueueListener(logQueue,printWorkerLogHandler())
+				self.printPoolLogListener.start()
+				self.printPool=concurrent.futures.ProcessPoolExecutor(max_workers=self.printProcessCount,initializer=initPrintWorker,initargs=(logQueue,))
+				logging.info('started the print worker pool: '+str(self.printProcessCount)+' processes')
+			return self.printPool
+
+	def shutdownPrintPool(self):
+		with self.printPoolLock:
+			if self.printPool:
+				self.printPool.shutdown(wait=False,cancel_futures=True)
+				self.printPool=None
+			if self.printPoolLogListener:
+				self.printPoolLogListener.stop()
+				self.printPoolLogListener=None
+
+	# printProgressFromThread - runs in the main thread: show how many team log sections have been rendered
+	def printProgressFromThread(self,done,total):
+		if done>=total:
+			if self.printProgressBox:
+				self.printProgressBox.close()
+				self.printProgressBox=None
+			return
+		if not self.printProgressBox:
+			self.printProgressBox=QProgressDialog("Generating team radio logs...",None,0,total,self)
+			self.printProgressBox.setWindowTitle("Printing")
+			self.printProgressBox.setWindowFlags(Qt.WindowTitleHint|Qt.Dialog|Qt.WindowStaysOnTopHint)
+			self.printProgressBox.setMinimumDuration(0)
+			self.printProgressBox.show()
+		self.printProgressBox.setMaximum(total)
+		self.printProgressBox.setValue(done)
+		self.printProgressBox.setLabelText("Generating team radio logs: "+str(done)+" of "+str(total)+" teams done...")
+
+	# assembleRadioLogSections - the full document for a log that was printed and then continued:
+	#  the earlier pdfs (full print, then each continuation) in order; returns the pdf name to print,
+	#  or None if any of the earlier pdfs is missing or can't be read, so the caller can generate it again
+	def assembleRadioLogSections(self,pdfName,sectionPdfNames):
+		if not all(os.path.isfile(sectionPdfName) for sectionPdfName in sectionPdfNames):
+			return None
+		if len(sectionPdfNames)==1:
+			return sectionPdfNames[0]
+		assembledPdfName=pdfName.replace('.pdf','_assembled.pdf')
+		try:
+			outputPDF=PdfWriter()
+			for sectionPdfName in sectionPdfNames:
+				for page in PdfReader(sectionPdfName).pages:
+					outputPDF.add_page(page)
+			with open(assembledPdfName,'wb') as out_pdf:
+				outputPDF.write(out_pdf)
+		except Exception as e:
+			logging.warning('could not assemble '+assembledPdfName+'; generating it again instead: '+str(e))
+			return None
+		return assembledPdfName
 
-				if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
-					logging.info("copying radio log pdf"+msgAdder+" to "+self.secondWorkingDir)
-					shutil.copy(pdfName,self.secondWorkingDir)
-			except Exception as e:
-				logging.error(f'_printLogWorker: outer exception caught in order to keep the thread alive: {e}')
-			finally: # clear the flag even if there was an early exit
-				self.logPrinting=False
-
-	def printTeamLogs(self,opPeriod):
-		self.printLog(opPeriod,teams=True)
-
-	def printClueLogHeaderFooter(self,canvas,doc,opPeriod=""):
-		canvas.saveState()
-		styles = getSampleStyleSheet()
-		img=None
-		if os.path.isfile(self.printLogoFileName):
-			imgReader=utils.ImageReader(self.printLogoFileName)
-			imgW,imgH=imgReader.getSize()
-			imgAspect=imgH/float(imgW)
-			img=Image(self.printLogoFileName,width=0.54*inch/float(imgAspect),height=0.54*inch)
-			headerTable=[
-					[img,self.agencyNameForPrint,"Incident: "+self.incidentName,"Clue Log - Page "+str(canvas.getPageNumber())],
-					["","","Operational Period: "+str(opPeriod),"Printed: "+time.strftime("%a %b %d, %Y  %H:%M")]]
-			t=Table(headerTable,colWidths=[x*inch for x in [0.8,4.2,2.5,2.5]],rowHeights=[x*inch for x in [0.3,0.3]])
-			t.setStyle(TableStyle([('FONT',(1,0),(1,1),'Helvetica-Bold'),
-								   ('FONTSIZE',(1,0),(1,1),18),
-										  ('SPAN',(0,0),(0,1)),
-										  ('SPAN',(1,0),(1,1)),
-										  ('LEADING',(1,0),(1,1),20),
-										  ('TOPADDING',(1,0),(1,0),0),
-										  ('BOTTOMPADDING',(1,1),(1,1),4),
-		 						('VALIGN',(0,0),(-1,-1),"MIDDLE"),
-								 ('ALIGN',(1,0),(1,-1),"CENTER"),
-										  ('ALIGN',(0,0),(0,1),"CENTER"),
-										  ('BOX',(0,0),(-1,-1),2,colors.black),
-										  ('BOX',(2,0),(-1,-1),2,colors.black),
-										  ('INNERGRID',(2,0),(3,1),0.5,colors.black)]))
-		else:
-			headerTable=[
-					[img,self.agencyNameForPrint,"Incident: "+self.incidentName,"Clue Log - Page "+str(canvas.getPageNumber())],
-					["","","Operational Period: "+str(opPeriod),"Printed: "+time.strftime("%a %b %d, %Y  %H:%M")]]
-			t=Table(headerTable,colWidths=[x*inch for x in [0.0,5,2.5,2.5]],rowHeights=[x*inch for x in [0.3,0.3]])
-			t.setStyle(TableStyle([('FONT',(1,0),(1,1),'Helvetica-Bold'),
-								   ('FONTSIZE',(1,0),(1,1),18),
-										  ('SPAN',(0,0),(0,1)),
-										  ('SPAN',(1,0),(1,1)),
-										  ('LEADING',(1,0),(1,1),20),
-		 						('VALIGN',(1,0),(-1,-1),"MIDDLE"),
-								 ('ALIGN',(1,0),(1,-1),"CENTER"),
-										  ('BOX',(0,0),(-1,-1),2,colors.black),
-										  ('BOX',(2,0),(-1,-1),2,colors.black),
-										  ('INNERGRID',(2,0),(3,1),0.5,colors.black)]))
-		w,h=t.wrapOn(canvas,doc.width,doc.height)
+	def printTeamLogs(self,opPeriod,continuation=False):
+		return self.printLog(opPeriod,teams=True,continuation=continuation)
+
+	def printClueLogHeaderFooter(self,canvas,doc,context):
+		context.drawHeaderFooter(canvas,doc)
 # 		self.clueLogMsgBox.setInformativeText("Generating page "+str(canvas.getPageNumber()))
 		QCoreApplication.processEvents()
 		logging.info("Page number:"+str(canvas.getPageNumber()))
-		logging.info("Height:"+str(h))
-		logging.info("Pagesize:"+str(doc.pagesize))
-		t.drawOn(canvas,doc.leftMargin,doc.pagesize[1]-h-0.5*inch) # enforce a 0.5 inch top margin regardless of paper size
 		logging.info("done drawing printClueLogHeaderFooter canvas")
-##		canvas.grid([x*inch for x in [0,0.5,1,1.5,2,2.5,3,3.5,4,4.5,5,5.5,6,6.5,7,7.5,8,8.5,9,9.5,10,10.5,11]],[y*inch for y in [0,0.5,1,1.5,2,2.5,3,3.5,4,4.5,5,5.5,6,6.5,7,7.5,8,8.5]])
-		canvas.restoreState()
 		logging.info("end of printClueLogHeaderFooter")
 
 	def printClueLog(self,opPeriod):
-		self.clueLogOpPeriod=opPeriod
-		self.clueLogEvent.set()
+		return self.printJobs.submit(('clueLog',int(opPeriod)))
 
-	def _clueLogWorker(self,event):
-		while True:
-			logging.info('_clueLogWorker: waiting for event...')
-			event.wait()
-			logging.info('_clueLogWorker: event received; beginning file save operations...')
-			event.clear()
-
-			self.clueLogSaving=True
-			try:
-		##      header_labels=['#','DESCRIPTION','TEAM','TIME','DATE','O.P.','LOCATION','INSTRUCTIONS','RADIO LOC.']
-				opPeriod=int(self.clueLogOpPeriod)
-				# first, determine if there are any clues to print for this OP; if not, return before generating the pdf
-				rowsToPrint=[]
-				for row in self.clueLog:
-					if (str(row[5])==str(opPeriod) or row[1].startswith("Operational Period "+str(opPeriod)+" Begins:") or row[1].startswith("Radio Log Begins")):
-						rowsToPrint.append(row)
-						logging.info('appending: '+str(row))
-				if len(rowsToPrint)<2:
-					logging.info('Nothing to print for specified operational period '+str(opPeriod))
-					# return
-					continue # don't use return in an endless loop worker - it will end the loop which will end the thread
+	def _clueLogJob(self,opPeriod):
+		self.clueLogSaving=True
+		try:
+	##      header_labels=['#','DESCRIPTION','TEAM','TIME','DATE','O.P.','LOCATION','INSTRUCTIONS','RADIO LOC.']
+			# first, determine if there are any clues to print for this OP; if not, return before generating the pdf
+			rowsToPrint=[]
+			for row in self.clueLog:
+				if (str(row[5])==str(opPeriod) or row[1].startswith("Operational Period "+str(opPeriod)+" Begins:") or row[1].startswith("Radio Log Begins")):
+					rowsToPrint.append(row)
+					logging.info('appending: '+str(row))
+			if len(rowsToPrint)<2:
+				logging.info('Nothing to print for specified operational period '+str(opPeriod))
+				return
+			else:
+				# clueLogPdfFileName=self.firstWorkingDir+"\\"+self.pdfFileName.replace(".pdf","_clueLog_OP"+str(opPeriod)+".pdf")
+				clueLogPdfFileName=os.path.join(self.sessionDir,self.pdfFileName.replace(".pdf","_clueLog_OP"+str(opPeriod)+".pdf"))
+				logging.info("generating clue log pdf: "+clueLogPdfFileName)
+				try:
+					f=open(clueLogPdfFileName,"wb")
+				except:
+					self._sig_clueLogMessageBoxFromThread.emit(clueLogPdfFileName)
+					# self.printClueLogErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+clueLogPdfFileName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.",
+					# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+					# self.printClueLogErrMsgBox.show()
+					# self.printClueLogErrMsgBox.raise_()
+					# QTimer.singleShot(10000,self.printClueLogErrMsgBox.close)
+					# self.printClueLogErrMsgBox.exec_()
+					return False
 				else:
-					# clueLogPdfFileName=self.firstWorkingDir+"\\"+self.pdfFileName.replace(".pdf","_clueLog_OP"+str(opPeriod)+".pdf")
-					clueLogPdfFileName=os.path.join(self.sessionDir,self.pdfFileName.replace(".pdf","_clueLog_OP"+str(opPeriod)+".pdf"))
-					logging.info("generating clue log pdf: "+clueLogPdfFileName)
-					try:
-						f=open(clueLogPdfFileName,"wb")
-					except:
-						self._sig_clueLogMessageBoxFromThread.emit(clueLogPdfFileName)
-						# self.printClueLogErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+clueLogPdfFileName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.",
-						# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-						# self.printClueLogErrMsgBox.show()
-						# self.printClueLogErrMsgBox.raise_()
-						# QTimer.singleShot(10000,self.printClueLogErrMsgBox.close)
-						# self.printClueLogErrMsgBox.exec_()
-						# return
-						continue # don't use return in an endless loop worker - it will end the loop which will end the thread
-					else:
-						f.close()
-			# 		self.clueLogMsgBox=QMessageBox(QMessageBox.Information,"Printing","Generating PDF; will send to default printer automatically; please wait...",
-			# 							QMessageBox.Abort,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-			# 		self.clueLogMsgBox.setInformativeText("Initializing...")
-					# note the topMargin is based on what looks good; you would think that a 0.6 table plus a 0.5 hard
-					# margin (see t.drawOn above) would require a 1.1 margin here, but, not so.
-					doc = SimpleDocTemplate(clueLogPdfFileName, pagesize=landscape(letter),leftMargin=0.5*inch,rightMargin=0.5*inch,topMargin=1.03*inch,bottomMargin=0.5*inch) # or pagesize=letter
-			# 		self.clueLogMsgBox.show()
-			# 		QTimer.singleShot(5000,self.clueLogMsgBox.close)
-					# QCoreApplication.processEvents()
-					self._sig_processEventsFromThread.emit()
-					elements=[]
-					styles = getSampleStyleSheet()
-					clueLogPrint=[]
-					headers=clueTableModel.header_labels[0:5]+clueTableModel.header_labels[6:8] # omit operational period
+					f.close()
+		# 		self.clueLogMsgBox=QMessageBox(QMessageBox.Information,"Printing","Generating PDF; will send to default printer automatically; please wait...",
+		# 							QMessageBox.Abort,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+		# 		self.clueLogMsgBox.setInformativeText("Initializing...")
+				# note the topMargin is based on what looks good; you would think that a 0.6 table plus a 0.5 hard
+				# margin (see t.drawOn above) would require a 1.1 margin here, but, not so.
+				doc = SimpleDocTemplate(clueLogPdfFileName, pagesize=landscape(letter),leftMargin=0.5*inch,rightMargin=0.5*inch,topMargin=1.03*inch,bottomMargin=0.5*inch) # or pagesize=letter
+		# 		self.clueLogMsgBox.show()
+		# 		QTimer.singleShot(5000,self.clueLogMsgBox.close)
+				# QCoreApplication.processEvents()
+				self._sig_processEventsFromThread.emit()
+				elements=[]
+				context=logRenderContext("Clue Log",opPeriod,self.agencyNameForPrint,self.incidentName,self.printLogoFileName,self.useOperatorLogin,boldInfoCells=False)
+				styles=context.styles
+				clueLogPrint=[]
+				headers=clueTableModel.header_labels[0:5]+clueTableModel.header_labels[6:8] # omit operational period
+				if self.useOperatorLogin:
+					headers.append(context.operatorHeader)
+				clueLogPrint.append(headers)
+				for row in rowsToPrint:
+					locationText=row[6]
+					if row[8]:
+						locationText='[Radio GPS:\n'+(row[8].replace('\n',' '))+'] '+row[6]
+					printRows=[row[0],Paragraph(row[1],styles['Normal']),row[2],row[3],row[4],Paragraph(locationText,styles['Normal']),Paragraph(row[7],styles['Normal'])]
 					if self.useOperatorLogin:
-						operatorImageFile=os.path.join(iconsDir,'user_icon_80px.png')
-						if os.path.isfile(operatorImageFile):
-							headers.append(Image(operatorImageFile,width=0.16*inch,height=0.16*inch))
-						else:
-							logging.info('operator image file not found: '+operatorImageFile)
-							headers.append('Op.')
-					clueLogPrint.append(headers)
-					for row in rowsToPrint:
-						locationText=row[6]
-						if row[8]:
-							locationText='[Radio GPS:\n'+(row[8].replace('\n',' '))+'] '+row[6]
-						printRows=[row[0],Paragraph(row[1],styles['Normal']),row[2],row[3],row[4],Paragraph(locationText,styles['Normal']),Paragraph(row[7],styles['Normal'])]
-						if self.useOperatorLogin:
-							if len(row)>9:
-								printRows.append(row[9])
-							else:
-								printRows.append('')
-						clueLogPrint.append(printRows)
-					# #523: avoid exception	
-					try:
-						clueLogPrint[1][5]=self.datum
-					except:
-						logging.info('Nothing to print for specified Operational Period '+str(opPeriod))
-						# return
-						continue # don't use return in an endless loop worker - it will end the loop which will end the thread
-					if len(clueLogPrint)>2:
-			##			t=Table(clueLogPrint,repeatRows=1,colWidths=[x*inch for x in [0.6,3.75,.9,0.5,1.25,3]])
-						if self.useOperatorLogin:
-							colWidths=[x*inch for x in [0.3,3.75,0.9,0.5,0.8,1.25,2.2,0.3]]
+						if len(row)>9:
+							printRows.append(row[9])
 						else:
-							colWidths=[x*inch for x in [0.3,3.75,0.9,0.5,0.8,1.25,2.5]]
-						t=Table(clueLogPrint,repeatRows=1,colWidths=colWidths)
-						t.setStyle(TableStyle([('F/generating clue llONT',(0,0),(-1,-1),'Helvetica'),
-												('FONT',(0,0),(-1,1),'Helvetica-Bold'),
-												('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
-											('BOX', (0,0), (-1,-1), 2, colors.black),
-											('BOX', (0,0), (-1,0), 2, colors.black)]))
-						elements.append(t)
-						doc.build(elements,onFirstPage=functools.partial(self.printClueLogHeaderFooter,opPeriod=opPeriod),onLaterPages=functools.partial(self.printClueLogHeaderFooter,opPeriod=opPeriod))
-			# 			self.clueLogMsgBox.setInformativeText("Finalizing and Printing...")
-						self.printPDF(clueLogPdfFileName)
-						if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
-							logging.info("copying clue log pdf to "+self.secondWorkingDir)
-							shutil.copy(clueLogPdfFileName,self.secondWorkingDir)
-			# 		else:
-			# 			self.clueLogMsgBox.setText("No clues were logged during Operational Period "+str(opPeriod)+"; no clue log will be printed.")
-			# 			self.clueLogMsgBox.setInformativeText("")
-			# 			self.clueLogMsgBox.setStandardButtons(QMessageBox.Ok)
-			# 			self.msgBox.close()
-			# 			self.msgBox=QMessageBox(QMessageBox.Information,"Printing","No clues were logged during Operational Period "+str(opPeriod)+"; no clue log will be printed.",QMessageBox.Ok)
-			# 			QTimer.singleShot(500,self.msgBox.show)
-					with self.clueLogNeedsPrintLock:
-						self.clueLogNeedsPrint=False
-			except Exception as e:
-				logging.error(f'_clueLogWorker: outer exception caught in order to keep the thread alive: {e}')
-			finally: # clear the flag even if there was an early exit
-				self.clueLogSaving=False
+							printRows.append('')
+					clueLogPrint.append(printRows)
+				# #523: avoid exception	
+				try:
+					clueLogPrint[1][5]=self.datum
+				except:
+					logging.info('Nothing to print for specified Operational Period '+str(opPeriod))
+					return
+				if len(clueLogPrint)>2:
+		##			t=Table(clueLogPrint,repeatRows=1,colWidths=[x*inch for x in [0.6,3.75,.9,0.5,1.25,3]])
+					if self.useOperatorLogin:
+						colWidths=[x*inch for x in [0.3,3.75,0.9,0.5,0.8,1.25,2.2,0.3]]
+					else:
+						colWidths=[x*inch for x in [0.3,3.75,0.9,0.5,0.8,1.25,2.5]]
+					t=Table(clueLogPrint,repeatRows=1,colWidths=colWidths)
+					t.setStyle(TableStyle([('F/generating clue llONT',(0,0),(-1,-1),'Helvetica'),
+											('FONT',(0,0),(-1,1),'Helvetica-Bold'),
+											('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
+										('BOX', (0,0), (-1,-1), 2, colors.black),
+										('BOX', (0,0), (-1,0), 2, colors.black)]))
+					elements.append(t)
+					doc.build(elements,onFirstPage=functools.partial(self.printClueLogHeaderFooter,context=context),onLaterPages=functools.partial(self.printClueLogHeaderFooter,context=context))
+		# 			self.clueLogMsgBox.setInformativeText("Finalizing and Printing...")
+					self.printPDF(clueLogPdfFileName)
+					if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
+						logging.info("copying clue log pdf to "+self.secondWorkingDir)
+						shutil.copy(clueLogPdfFileName,self.secondWorkingDir)
+		# 		else:
+		# 			self.clueLogMsgBox.setText("No clues were logged during Operational Period "+str(opPeriod)+"; no clue log will be printed.")
+		# 			self.clueLogMsgBox.setInformativeText("")
+		# 			self.clueLogMsgBox.setStandardButtons(QMessageBox.Ok)
+		# 			self.msgBox.close()
+		# 			self.msgBox=QMessageBox(QMessageBox.Information,"Printing","No clues were logged during Operational Period "+str(opPeriod)+"; no clue log will be printed.",QMessageBox.Ok)
+		# 			QTimer.singleShot(500,self.msgBox.show)
+				with self.clueLogNeedsPrintLock:
+					self.clueLogNeedsPrint=False
+		finally: # clear the flag even if there was an early exit
+			self.clueLogSaving=False
 
 	def clueLogMessageBoxFromThread(self,clueLogPdfFileName):
 		self.printClueLogErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+clueLogPdfFileName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.  As a last resort, the auto-saved CSV file can be printed from Excel or as a plain text file.",
@@ -4553,269 +5111,299 @@ class MyWindow(QDialog,Ui_Dialog):
 
 	def printClueReport(self,clueData):
 		# logging.info('printClueReport called')
-		self.clueReportClueData=clueData
-		self.clueReportEvent.set()
+		return self.printClueReports([clueData])
+
+	# printClueReports - print several clue reports as one job and one pdf;
+	#  the job holds a copy of the clue data, so later edits to the clue log rows don't change a queued report
+	def printClueReports(self,clueDataList):
+		return self.printJobs.submit(('clueReport',tuple(tuple(clueData) for clueData in clueDataList)))
+
+	# printClueReportRange - print the clue reports for clue numbers first through last (inclusive) from clueLog
+	def printClueReportRange(self,first,last):
+		clueDataList=[row for row in self.clueLog if str(row[0]).isdigit() and first<=int(row[0])<=last]
+		if not clueDataList:
+			logging.info('no clues numbered '+str(first)+' through '+str(last)+'; no clue reports will be printed')
+			return None
+		logging.info('printing clue reports for clues '+str(first)+' through '+str(last))
+		return self.printClueReports(clueDataList)
 
 	# fillable pdf works well with pdftk external dependency, but is problematic in pure python
 	#  see https://stackoverflow.com/questions/72625568
 	# so, use reportlab instead
-	def _clueReportWorker(self,event):
-		while True:
-			logging.info('_clueReportWorker: waiting for event...')
-			event.wait()
-			logging.info('_clueReportWorker: event received; beginning file save operations...')
-			event.clear()
-
-			self.clueReportSaving=True
+	# _clueReportJob - one pdf for a batch of clue reports (usually just one): all of the overlay pages are
+	#  built in one pass, then each is stamped onto the template
+	def _clueReportJob(self,clueDataList):
+		self.clueReportSaving=True
+		try:
+			clueNumbers=[str(clueData[0]).zfill(2) for clueData in clueDataList]
+			suffix="_clue"+clueNumbers[0]
+			if len(clueNumbers)>1:
+				suffix="_clues"+clueNumbers[0]+"-"+clueNumbers[-1]
+			# cluePdfName=self.firstWorkingDir+"\\"+self.pdfFileName.replace(".pdf","_clue"+str(clueData[0]).zfill(2)+".pdf")
+			cluePdfName=os.path.join(self.sessionDir,self.pdfFileName.replace(".pdf",suffix+".pdf"))
+			logging.info("generating clue report pdf: "+cluePdfName)
+			
 			try:
-				clueData=self.clueReportClueData
-				# cluePdfName=self.firstWorkingDir+"\\"+self.pdfFileName.replace(".pdf","_clue"+str(clueData[0]).zfill(2)+".pdf")
-				cluePdfName=os.path.join(self.sessionDir,self.pdfFileName.replace(".pdf","_clue"+str(clueData[0]).zfill(2)+".pdf"))
-				logging.info("generating clue report pdf: "+cluePdfName)
-				
-				try:
-					f=open(cluePdfName,"wb")
-				except:
-					self._sig_clueReportMessageBoxFromThread.emit(cluePdfName)
-					# self.printClueErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+cluePdfName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.",
-					# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-					# self.printClueErrMsgBox.show()
-					# self.printClueErrMsgBox.raise_()
-					# QTimer.singleShot(10000,self.printClueErrMsgBox.close)
-					# self.printClueErrMsgBox.exec_()
-					# return
-					continue # don't use return in an endless loop worker - it will end the loop which will end the thread
-				else:
-					f.close()
+				f=open(cluePdfName,"wb")
+			except:
+				self._sig_clueReportMessageBoxFromThread.emit(cluePdfName)
+				# self.printClueErrMsgBox=QMessageBox(QMessageBox.Critical,"Error","PDF could not be generated:\n\n"+cluePdfName+"\n\nMaybe the file is currently being viewed by another program?  If so, please close that viewer and try again.",
+				# 	QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+				# self.printClueErrMsgBox.show()
+				# self.printClueErrMsgBox.raise_()
+				# QTimer.singleShot(10000,self.printClueErrMsgBox.close)
+				# self.printClueErrMsgBox.exec_()
+				return False
+			else:
+				f.close()
 
-				cluePdfOverlayName=cluePdfName.replace('.pdf','_overlay.pdf')
-				doc = SimpleDocTemplate(cluePdfOverlayName, pagesize=portrait(letter),leftMargin=0.84*inch,rightMargin=0.67*inch,topMargin=0.68*inch,bottomMargin=0.5*inch) # or pagesize=letter
-				self._sig_processEventsFromThread.emit()
-				# QCoreApplication.processEvents()
-				tableWidthInches=6.92 # determined from the template pdf, used to draw overlay pdf fields below
-				elements=[]
-				styles = getSampleStyleSheet()
-
-				img=''
-				if os.path.isfile(self.printLogoFileName):
-					imgReader=utils.ImageReader(self.printLogoFileName)
-					imgW,imgH=imgReader.getSize()
-					imgAspect=imgH/float(imgW)
-					img=Image(self.printLogoFileName,width=0.54*inch/float(imgAspect),height=0.54*inch)
-
-				instructions=clueData[7].lower()
-				# initialize all checkboxes to OFF
-				instructionsCollect=''
-				instructionsMarkAndLeave=''
-				instructionsDisregard=''
-				instructionsOther=''
-				instructionsOtherText=''
-				# parse to a list of tokens - split on comma or semicolon with space(s) before and/or after
-				instructions=re.sub(r' *[,;] *','|',instructions).split('|')
-				# remove any empty elements, probably due to back-to-back delimiters
-				instructions=[x for x in instructions if x]
-				logging.info('parsed instructions:'+str(instructions))
-				# look for keywords in the instructions text
-				if "collect" in instructions:
-					instructionsCollect='X'
-					instructions.remove('collect')
-				if "mark & leave" in instructions:
-					instructionsMarkAndLeave='X'
-					instructions.remove('mark & leave')
-				if "disregard" in instructions:
-					instructionsDisregard='X'
-					instructions.remove('disregard')
-				if instructions: # is there anything left in the parsed list?
-					instructionsOther='X'
-					instructionsOtherText=', '.join(instructions)
-		# 		locText=clueData[6]
-				if clueData[8]!="":
-		# 			locText=locText+"\n(Radio GPS = "+clueData[8]+")"
-					radioLocText="(Radio GPS: "+re.sub(r"\n","  x  ",clueData[8])+")"
-				else:
-					radioLocText=""
+			cluePdfOverlayName=cluePdfName.replace('.pdf','_overlay.pdf')
+			doc = SimpleDocTemplate(cluePdfOverlayName, pagesize=portrait(letter),leftMargin=0.84*inch,rightMargin=0.67*inch,topMargin=0.68*inch,bottomMargin=0.5*inch) # or pagesize=letter
+			self._sig_processEventsFromThread.emit()
+			# QCoreApplication.processEvents()
+			styles = getSampleStyleSheet()
+
+			img=''
+			if os.path.isfile(self.printLogoFileName):
+				imgReader=utils.ImageReader(self.printLogoFileName)
+				imgW,imgH=imgReader.getSize()
+				imgAspect=imgH/float(imgW)
+				img=Image(self.printLogoFileName,width=0.54*inch/float(imgAspect),height=0.54*inch)
+
+			elements=[]
+			for clueData in clueDataList:
+				if elements:
+					elements.append(PageBreak()) # one overlay page per clue
+				elements+=self.getClueReportElements(clueData,styles,img)
+			doc.build(elements)
+
+			# overlaying on the template https://gist.github.com/vsajip/8166dc0935ee7807c5bd4daa22a20937
+			#  each output page is a blank page with the template and then the clue's overlay merged onto it,
+			#  so the cached template page is never modified
+			templatePage=self.getClueReportTemplatePage()
+			overlayPDF=PdfReader(cluePdfOverlayName)
+			outputPDF=PdfWriter()
+			for overlayPage in overlayPDF.pages:
+				page=outputPDF.add_blank_page(width=templatePage.mediabox.width,height=templatePage.mediabox.height)
+				page.merge_page(templatePage)
+				page.merge_page(overlayPage)
+			with open(cluePdfName,'wb') as out_pdf:
+				outputPDF.write(out_pdf)
+
+			self.printPDF(cluePdfName)
+			if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
+				logging.info("copying clue report pdf to "+self.secondWorkingDir)
+				shutil.copy(cluePdfName,self.secondWorkingDir)
 
-				operatorText=''
-				if self.useOperatorLogin:
-					operatorText='Radio Dispatcher: '
-					if self.operatorLastName.startswith('?'):
-						operatorText+='Not logged in'
-					else:
-						operatorText+=self.operatorFirstName[0].upper()+self.operatorLastName[0].upper()+' '+self.operatorId
-
-				# define the fields and locations of the overlay pdf; similar to fillable pdf but with more control
-				# clueTableDicts - list of dictionaries, with each dictionary corresponding to a new reportlab table
-				#  data - list of lists, each sublist corresponding to one row of the reportlab table
-				#  heights - list of row heights (in inches) - the length of this list must equal the length of 'data';
-				#    can also be a single number, in which case each row will have the same specified height
-				#  widths - list of column widths - the length of theis list must equal the length of each element of 'data'
-				#    if sum of values adds up to page width in inches, then units are assumed to be in inches;
-				#    otherwise, units are assumed to be equal parts of total page width
-				clueTableDicts=[
-					{ # title bar row
-						'data':[[img,self.agencyNameForPrint,img]],
-						'heights':0.68,
-						'widths':[1,3,1],
-						'hvalign':['center','middle'],
-						'fontName':'Helvetica-Bold',
-						'fontSize':18
-					},
-					{ # incident name / date / operational period
-						'data':[['',self.incidentName,time.strftime('%x'),str(clueData[5])]],
-						'heights':0.43,
-						'widths':[67,108,85,79], # measured mm on screen (not sure of zoom)
-						'hvalign':['center','bottom']
-					},
-					{ # clue number / date/time located / team that located the clue
-						'data':[[str(clueData[0]),clueData[4]+'   '+clueData[3],clueData[2]]],
-						'heights':0.39,
-						'widths':[67,141,131],
-						'hvalign':['center','bottom']
-					},
-					{ # Name of Individual That Located Clue - not filled by radiolog, but,
-					#  use the right-justified space on this line to show radio dispatch operator
-					#  while still leaving space for someone to hand-write the individual's name
-						'data':[[operatorText]],
-						'heights':0.54,
-						'widths':[1], # width doesn't matter, since text is right-justified
-						'hvalign':['right','top'],
-						'fontSize':10 # slightly smaller font
-					},
-					{ # description of clue
-						'data':[['',clueData[1]]],
-						'heights':0.87,
-						'widths':[1,40], # left indent
-						'hvalign':['left','top']
-					},
-					{ # radio location
-						'data':[['',radioLocText]],
-						'heights':0.22,
-						'widths':[1,4],
-						'hvalign':['left','middle']
-					},
-					{ # location description
-						'data':[['',clueData[6]]],
-						'heights':0.63,
-						'widths':[1,40], # left indent
-						'hvalign':['left','top']
-					},
-					{ # gap - 'To investigations' and gap before checkboxes
-						'data':[['']],
-						'heights':1,
-						'widths':[1]
-					},
-					{ # Instructions checkboxes - to keep it to a single table, each row is [gap,checkbox,gap,othertext]
-						'data':[
-							['',instructionsCollect,'',''],
-							['',instructionsMarkAndLeave,'',''],
-							['',instructionsDisregard,'',''],
-							['',instructionsOther,'',instructionsOtherText]
-						],
-						'heights':0.19,
-						'widths':[1.35,1,3,30]
-						# note: if a cell width is less than required for a single character (plus padding),
-						#  the pdf generation process will throw an exception:
-						# AttributeError: 'Paragraph' object has no attribute 'blPara'
-						#  should probably catch this at the call to doc.build, by making the narrowest
-						#  field wider and trying again.  For helvetica-bold 18pt, a width of 0.15 is too
-						#  narrow and causes the error (1 part in 46) but 0.19 is OK (1 part in 36).
-					}
-				]
-				def ParagraphOrNot(d,style):
-					if isinstance(d,(str,int,float)):
-						# logging.info('   paragraph')
-						return Paragraph(d,style)
-					else:
-						# logging.info('   NOT paragraph')
-						return d
-
-				for td in clueTableDicts:
-					# logging.info('--- new table ---')
-					# logging.info('-- raw table data --')
-					# try:
-					# 	logging.info(json.dumps(td,indent=3))
-					# except:
-						# logging.info(str(td))
-
-					# using Normal paragraph style enables word wrap within table cells https://stackoverflow.com/a/10244769/3577105
-					style=ParagraphStyle('theStyle',parent=styles['Normal'])
-					# style.backColor='#dddddd' # helpful for layout development and debug
-					# style.borderPadding=(5,0,5,0)
-					if 'fontName' in td.keys():
-						style.fontName=td['fontName']
-					if 'fontSize' in td.keys():
-						style.fontSize=td['fontSize']
-					else:
-						style.fontSize=12
-					style.leading=style.fontSize*1.15 # rule of thumb: 20% larger than font size
-
-					# vertical alignment must be specified in the Table style;
-					# horizontal alignment must be specified in the Paragraph style
-					if 'hvalign' in td.keys():
-						[h,v]=td['hvalign']
-						# see reportlab docs paragraph alignment section for propert alignment values
-						# https://docs.reportlab.com/reportlab/userguide/ch6_paragraphs/
-						if h=='center':
-							style.alignment=1
-						elif h=='right':
-							style.alignment=2
-
-					data=[[ParagraphOrNot(d,style) for d in row] for row in td['data']]
-					# data=td['data']
-					# logging.info('data:'+str(data))
-					widths=td['widths']
-					wsum=sum(td['widths'])
-					# if width units are not inches, treat them as proportional units
-					if sum(td['widths'])!=tableWidthInches:
-						widths=[(w/wsum)*tableWidthInches for w in widths]
-					# logging.info('widths='+str(widths))
-					heights=td['heights']
-					if isinstance(heights,(int,float)):
-						heightsList=[heights for x in range(len(data))]
-						heights=heightsList
-					# logging.info('heights='+str(heights))
-					t=Table(data,colWidths=[x*inch for x in widths],rowHeights=[x*inch for x in heights])
-					styleList=[
-						# ('BOX',(0,0),(-1,-1),1,colors.red), # helpful for layout development and debug
-						# ('INNERGRID',(0,0),(-1,-1),0.5,colors.red) # helpful for layout development and debug
-					]
-					# vertical alignment must be specified in the Table style;
-					# horizontal alignment within paragraphs must be specified in the Paragraph style
-					#  but should be applied in the Table style also, in case the data is not a Paragraph
-					if 'hvalign' in td.keys():
-						[h,v]=td['hvalign']
-						if isinstance(v,str): # apply it to the entire table
-							styleList.append(('VALIGN',(0,0),(-1,-1),v.upper()))
-						if isinstance(h,str): # apply it to the entire table
-							styleList.append(('ALIGN',(0,0),(-1,-1),h.upper()))
-					t.setStyle(TableStyle(styleList))
-					# logging.info('setting table style:'+str(styleList))
-					elements.append(t)
-				doc.build(elements)
-
-				# overlaying on the template https://gist.github.com/vsajip/8166dc0935ee7807c5bd4daa22a20937
-				templatePDF=PdfReader(self.clueReportPdfFileName,'rb')
-				templatePage=templatePDF.pages[0]
-				overlayPDF=PdfReader(cluePdfOverlayName,'rb')
-				templatePage.merge_page(overlayPDF.pages[0])
-				outputPDF=PdfWriter()
-				outputPDF.add_page(templatePage)
-				with open(cluePdfName,'wb') as out_pdf:
-					outputPDF.write(out_pdf)
-
-				self.printPDF(cluePdfName)
-				if self.use2WD and self.secondWorkingDir and os.path.isdir(self.secondWorkingDir):
-					logging.info("copying clue report pdf to "+self.secondWorkingDir)
-					shutil.copy(cluePdfName,self.secondWorkingDir)
+			try:
+				os.remove(cluePdfOverlayName)
+			except:
+				pass
+		finally: # clear the flag even if there was an early exit
+			self.clueReportSaving=False
+
+	# getClueReportTemplatePage - the template is parsed once, and its page is reused for every clue report;
+	#  it is only read again if the template file is changed
+	def getClueReportTemplatePage(self):
+		key=[self.clueReportPdfFileName,os.path.getmtime(self.clueReportPdfFileName)]
+		if not self.clueReportTemplate or self.clueReportTemplate[0]!=key:
+			logging.info('reading clue report template '+self.clueReportPdfFileName)
+			self.clueReportTemplate=[key,PdfReader(self.clueReportPdfFileName).pages[0]]
+		return self.clueReportTemplate[1]
+
+	# getClueReportElements - the flowables for one clue's overlay page
+	def getClueReportElements(self,clueData,styles,img):
+		tableWidthInches=6.92 # determined from the template pdf, used to draw overlay pdf fields below
+		elements=[]
+		instructions=clueData[7].lower()
+		# initialize all checkboxes to OFF
+		instructionsCollect=''
+		instructionsMarkAndLeave=''
+		instructionsDisregard=''
+		instructionsOther=''
+		instructionsOtherText=''
+		# parse to a list of tokens - split on comma or semicolon with space(s) before and/or after
+		instructions=re.sub(r' *[,;] *','|',instructions).split('|')
+		# remove any empty elements, probably due to back-to-back delimiters
+		instructions=[x for x in instructions if x]
+		logging.info('parsed instructions:'+str(instructions))
+		# look for keywords in the instructions text
+		if "collect" in instructions:
+			instructionsCollect='X'
+			instructions.remove('collect')
+		if "mark & leave" in instructions:
+			instructionsMarkAndLeave='X'
+			instructions.remove('mark & leave')
+		if "disregard" in instructions:
+			instructionsDisregard='X'
+			instructions.remove('disregard')
+		if instructions: # is there anything left in the parsed list?
+			instructionsOther='X'
+			instructionsOtherText=', '.join(instructions)
+# 		locText=clueData[6]
+		if clueData[8]!="":
+# 			locText=locText+"\n(Radio GPS = "+clueData[8]+")"
+			radioLocText="(Radio GPS: "+re.sub(r"\n","  x  ",clueData[8])+")"
+		else:
+			radioLocText=""
 
-				try:
-					os.remove(cluePdfOverlayName)
-				except:
-					pass
-			except Exception as e:
-				logging.error(f'_clueReportWorker: outer exception caught in order to keep the thread alive: {e}')
-			finally: # clear the flag even if there was an early exit
-				self.clueReportSaving=False
+		operatorText=''
+		if self.useOperatorLogin:
+			operatorText='Radio Dispatcher: '
+			if self.operatorLastName.startswith('?'):
+				operatorText+='Not logged in'
+			else:
+				operatorText+=self.operatorFirstName[0].upper()+self.operatorLastName[0].upper()+' '+self.operatorId
+
+		# define the fields and locations of the overlay pdf; similar to fillable pdf but with more control
+		# clueTableDicts - list of dictionaries, with each dictionary corresponding to a new reportlab table
+		#  data - list of lists, each sublist corresponding to one row of the reportlab table
+		#  heights - list of row heights (in inches) - the length of this list must equal the length of 'data';
+		#    can also be a single number, in which case each row will have the same specified height
+		#  widths - list of column widths - the length of theis list must equal the length of each element of 'data'
+		#    if sum of values adds up to page width in inches, then units are assumed to be in inches;
+		#    otherwise, units are assumed to be equal parts of total page width
+		clueTableDicts=[
+			{ # title bar row
+				'data':[[img,self.agencyNameForPrint,img]],
+				'heights':0.68,
+				'widths':[1,3,1],
+				'hvalign':['center','middle'],
+				'fontName':'Helvetica-Bold',
+				'fontSize':18
+			},
+			{ # incident name / date / operational period
+				'data':[['',self.incidentName,time.strftime('%x'),str(clueData[5])]],
+				'heights':0.43,
+				'widths':[67,108,85,79], # measured mm on screen (not sure of zoom)
+				'hvalign':['center','bottom']
+			},
+			{ # clue number / date/time located / team that located the clue
+				'data':[[str(clueData[0]),clueData[4]+'   '+clueData[3],clueData[2]]],
+				'heights':0.39,
+				'widths':[67,141,131],
+				'hvalign':['center','bottom']
+			},
+			{ # Name of Individual That Located Clue - not filled by radiolog, but,
+			#  use the right-justified space on this line to show radio dispatch operator
+			#  while still leaving space for someone to hand-write the individual's name
+				'data':[[operatorText]],
+				'heights':0.54,
+				'widths':[1], # width doesn't matter, since text is right-justified
+				'hvalign':['right','top'],
+				'fontSize':10 # slightly smaller font
+			},
+			{ # description of clue
+				'data':[['',clueData[1]]],
+				'heights':0.87,
+				'widths':[1,40], # left indent
+				'hvalign':['left','top']
+			},
+			{ # radio location
+				'data':[['',radioLocText]],
+				'heights':0.22,
+				'widths':[1,4],
+				'hvalign':['left','middle']
+			},
+			{ # location description
+				'data':[['',clueData[6]]],
+				'heights':0.63,
+				'widths':[1,40], # left indent
+				'hvalign':['left','top']
+			},
+			{ # gap - 'To investigations' and gap before checkboxes
+				'data':[['']],
+				'heights':1,
+				'widths':[1]
+			},
+			{ # Instructions checkboxes - to keep it to a single table, each row is [gap,checkbox,gap,othertext]
+				'data':[
+					['',instructionsCollect,'',''],
+					['',instructionsMarkAndLeave,'',''],
+					['',instructionsDisregard,'',''],
+					['',instructionsOther,'',instructionsOtherText]
+				],
+				'heights':0.19,
+				'widths':[1.35,1,3,30]
+				# note: if a cell width is less than required for a single character (plus padding),
+				#  the pdf generation process will throw an exception:
+				# AttributeError: 'Paragraph' object has no attribute 'blPara'
+				#  should probably catch this at the call to doc.build, by making the narrowest
+				#  field wider and trying again.  For helvetica-bold 18pt, a width of 0.15 is too
+				#  narrow and causes the error (1 part in 46) but 0.19 is OK (1 part in 36).
+			}
+		]
+		def ParagraphOrNot(d,style):
+			if isinstance(d,(str,int,float)):
+				# logging.info('   paragraph')
+				return Paragraph(d,style)
+			else:
+				# logging.info('   NOT paragraph')
+				return d
+
+		for td in clueTableDicts:
+			# logging.info('--- new table ---')
+			# logging.info('-- raw table data --')
+			# try:
+			# 	logging.info(json.dumps(td,indent=3))
+			# except:
+				# logging.info(str(td))
+
+			# using Normal paragraph style enables word wrap within table cells https://stackoverflow.com/a/10244769/3577105
+			style=ParagraphStyle('theStyle',parent=styles['Normal'])
+			# style.backColor='#dddddd' # helpful for layout development and debug
+			# style.borderPadding=(5,0,5,0)
+			if 'fontName' in td.keys():
+				style.fontName=td['fontName']
+			if 'fontSize' in td.keys():
+				style.fontSize=td['fontSize']
+			else:
+				style.fontSize=12
+			style.leading=style.fontSize*1.15 # rule of thumb: 20% larger than font size
+
+			# vertical alignment must be specified in the Table style;
+			# horizontal alignment must be specified in the Paragraph style
+			if 'hvalign' in td.keys():
+				[h,v]=td['hvalign']
+				# see reportlab docs paragraph alignment section for propert alignment values
+				# https://docs.reportlab.com/reportlab/userguide/ch6_paragraphs/
+				if h=='center':
+					style.alignment=1
+				elif h=='right':
+					style.alignment=2
+
+			data=[[ParagraphOrNot(d,style) for d in row] for row in td['data']]
+			# data=td['data']
+			# logging.info('data:'+str(data))
+			widths=td['widths']
+			wsum=sum(td['widths'])
+			# if width units are not inches, treat them as proportional units
+			if sum(td['widths'])!=tableWidthInches:
+				widths=[(w/wsum)*tableWidthInches for w in widths]
+			# logging.info('widths='+str(widths))
+			heights=td['heights']
+			if isinstance(heights,(int,float)):
+				heightsList=[heights for x in range(len(data))]
+				heights=heightsList
+			# logging.info('heights='+str(heights))
+			t=Table(data,colWidths=[x*inch for x in widths],rowHeights=[x*inch for x in heights])
+			styleList=[
+				# ('BOX',(0,0),(-1,-1),1,colors.red), # helpful for layout development and debug
+				# ('INNERGRID',(0,0),(-1,-1),0.5,colors.red) # helpful for layout development and debug
+			]
+			# vertical alignment must be specified in the Table style;
+			# horizontal alignment within paragraphs must be specified in the Paragraph style
+			#  but should be applied in the Table style also, in case the data is not a Paragraph
+			if 'hvalign' in td.keys():
+				[h,v]=td['hvalign']
+				if isinstance(v,str): # apply it to the entire table
+					styleList.append(('VALIGN',(0,0),(-1,-1),v.upper()))
+				if isinstance(h,str): # apply it to the entire table
+					styleList.append(('ALIGN',(0,0),(-1,-1),h.upper()))
+			t.setStyle(TableStyle(styleList))
+			# logging.info('setting table style:'+str(styleList))
+			elements.append(t)
+		return elements
 
 	def processEventsFromThread(self):
 		QCoreApplication.processEvents()
@@ -4860,27 +5448,40 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.limitedFontSize=self.minLimitedFontSize
 		self.toolTipFontSize=int(self.limitedFontSize*2/3)
 		self.menuFontSize=int(self.limitedFontSize*3/4)
+		tableFontChanged=self.fonts.setPointSize('table',self.fontSize)
+		self.fonts.setPointSize('menu',self.menuFontSize)
+		self.fonts.setPointSize('limited',self.limitedFontSize)
+		tableFont=self.fonts.getFont('table')
+		if tableFontChanged:
+			self.rowHeightCache={} # cached heights are only valid for the previous font size
+			self.setColumnResizedFlag()
 		# preserve the currently selected tab, since something in this function
 		#  causes the rightmost tab to be selected
 		i=self.ui.tabWidget.currentIndex()
-		self.ui.tableView.setStyleSheet("font-size:"+str(self.fontSize)+"pt")
+		# setFont instead of setStyleSheet: views that aren't visible don't do any work until they are shown
+		self.ui.tableView.setFont(tableFont)
 		# for n in self.ui.tableViewList[1:]:
 		# 	logging.info("n="+str(n))
 		for x in self.ui.tabList:
 			try:
-				x.setStyleSheet('font-size:'+str(self.menuFontSize)+'pt')
-			except: # may fail for elements that don't have styles, like dummies and spacers
+				x.setFont(self.menuFont)
+			except: # may fail for elements that don't have fonts, like dummies
 				pass
-		for x in self.ui.tableViewList: # doesn't inherit from tabList item style sheet
+		for x in self.ui.tableViewList: # set explicitly, so it doesn't inherit from tabList item font
 			try:
-				# this could be a source of lag if the tableview has a lot of entries
-				x.setStyleSheet("font-size:"+str(self.fontSize)+"pt")
-			except: # may fail for elements that don't have styles, like dummies and spacers
+				x.setFont(tableFont)
+			except: # may fail for elements that don't have fonts, like dummies
 				pass
 		# don't change tab font size unless you find a good way to dynamically
 		# change tab size and margins as well
 ##		self.ui.tabWidget.tabBar().setStyleSheet("font-size:"+str(self.fontSize)+"pt")
-		self.redrawTables()
+		# redraw the main table, and the current team table if any, now; redraw each other team table
+		#  the next time it is shown (see teamTabChanged)
+		self.redrawTables(-1)
+		if tableFontChanged:
+			self.teamTablesNeedingRedraw=set([x for x in self.ui.tableViewList[1:] if x])
+		if i>0 and i<len(self.ui.tableViewList):
+			self.teamTabChanged(i)
 		self.ui.tabWidget.setCurrentIndex(i)
 		self.ui.incidentNameLabel.setStyleSheet("font-size:"+str(self.limitedFontSize)+"pt;")
 
@@ -4910,7 +5511,6 @@ class MyWindow(QDialog,Ui_Dialog):
 		#  section above was accomplishing, without using stylesheets
 
 		self.fsBuildTooltip()
-		self.menuFont.setPointSize(self.menuFontSize)
 
 	def redrawTables(self,index=0):
 		# only redraw tables specified by index
@@ -4920,12 +5520,16 @@ class MyWindow(QDialog,Ui_Dialog):
 
 		redrawMainTable=index<=0
 		# make a list of tables to redraw, since the code below is meant for a list
+		# team tables that haven't been built yet are skipped; see materializeTeamTable
 		if index==0: # redraw all team tables
-			teamTablesToRedraw=self.ui.tableViewList[1:]
-			tabsToScroll=range(1,self.ui.tabWidget.count())
-		else:
+			teamTablesToRedraw=[x for x in self.ui.tableViewList[1:] if x]
+			tabsToScroll=[i for i in range(1,self.ui.tabWidget.count()) if self.ui.tableViewList[i]]
+		elif index>0 and self.ui.tableViewList[index]:
 			teamTablesToRedraw=[self.ui.tableViewList[index]]
 			tabsToScroll=[index]
+		else:
+			teamTablesToRedraw=[]
+			tabsToScroll=[]
 
 		# column sizing rules, in sequence:
 		# TIME, T/F, STATUS: width is only a function of font size (not of contents)
@@ -4986,6 +5590,7 @@ class MyWindow(QDialog,Ui_Dialog):
 
 	def setTeamStatus(self,extTeamName,status):
 		teamStatusDict[extTeamName]=status
+		self.teamTabsDirtySet.add(extTeamName)
 		#715 redraw the sidebar here, regardless of visibility but only when needed, rather than
 		#  every second in updateTeamTimers, based on visibility, which doesn't happen until the next tick
 		self.sidebar.resizeEvent()
@@ -4993,13 +5598,96 @@ class MyWindow(QDialog,Ui_Dialog):
 	def updateClock(self):
 		self.ui.clock.display(time.strftime("%H:%M"))
 
+	# getTeamTabVisualState - resolve the tab appearance for a given set of inputs;
+	#  returns [styleKey,strikeOut] where styleKey is a key of statusStyleDict, and either value
+	#  can be None meaning 'no change'; results are cached since there are only a few possible combinations
+	#   timeoutLevel: 0 = not timed out, 1 = orange, 2 = red
+	def getTeamTabVisualState(self,status,blinkToggle,timeoutLevel,hold,fsFilter):
+		key=(status,blinkToggle,timeoutLevel,hold,fsFilter)
+		state=self.teamTabVisualStateCache.get(key)
+		if state:
+			return state
+		styleKey=status
+		if timeoutLevel>0 or status in ["Waiting for Transport","STANDBY","Available"]:
+			if blinkToggle==1:
+				# blink 1: style is one of these:
+				# - timeout orange
+				# - timeout red
+				# - no change (if status is anything but 'Waiting for transport' or 'STANDBY')
+				# - blank (black on white) (if status is 'Waiting for transport' or 'STANDBY', and not timed out)
+				if not hold and status not in ["At IC","Off Duty"] and timeoutLevel==2:
+					styleKey="TIMED_OUT_RED"
+				elif not hold and status not in ["At IC","Off Duty"] and timeoutLevel==1:
+					styleKey="TIMED_OUT_ORANGE"
+				elif status in ["Waiting for Transport","STANDBY","Available"]:
+					styleKey=""
+				else:
+					styleKey=None
+		# always check for fleetsync filtering, independent from team status;
+		#  strikeout all the time if all devices for this callsign are filtered
+		if blinkToggle==0:
+			strikeOut=True if fsFilter>0 else None
+		else:
+			strikeOut=fsFilter>=2
+		state=[styleKey,strikeOut]
+		self.teamTabVisualStateCache[key]=state
+		return state
+
+	# applyTeamTabStyle - only call setStyleSheet / setFont if the requested visual state differs
+	#  from what was last applied to this same button; returns True if anything was changed
+	def applyTeamTabStyle(self,extTeamName,button,styleKey=None,strikeOut=None):
+		applied=self.teamTabAppliedStateDict.get(extTeamName)
+		if not applied or applied[0] is not button: # new button, i.e. from addTab or rebuildTabs
+			applied=[button,None,None]
+			self.teamTabAppliedStateDict[extTeamName]=applied
+		changed=False
+		if styleKey is not None and styleKey!=applied[1]:
+			styleObjectName=normName('tab_'+extTeamName)
+			ss=self.teamTabStyleSheetCache.get((styleObjectName,styleKey))
+			if ss is None:
+				ss=buildObjSS(styleObjectName,statusStyleDict[styleKey])
+				self.teamTabStyleSheetCache[(styleObjectName,styleKey)]=ss
+			button.setStyleSheet(ss)
+			applied[1]=styleKey
+			changed=True
+		if strikeOut is not None and strikeOut!=applied[2]:
+			f=button.font()
+			f.setStrikeOut(strikeOut)
+			button.setFont(f)
+			applied[2]=strikeOut
+			changed=True
+		return changed
+
+	# setTeamLastContact - record the time of last contact for a team (default: now), and schedule
+	#  its orange and red timeout deadlines; lastContact=-1 means the team will never time out
+	def setTeamLastContact(self,extTeamName,lastContact=None):
+		if lastContact is None:
+			lastContact=time.time()
+		teamLastContactDict[extTeamName]=lastContact
+		if lastContact>=0:
+			heapq.heappush(self.teamTimeoutDeadlines,(lastContact+self.timeoutOrangeSec,extTeamName,lastContact))
+			heapq.heappush(self.teamTimeoutDeadlines,(lastContact+self.timeoutRedSec,extTeamName,lastContact))
+		self.teamTabsDirtySet.add(extTeamName)
+
+	# rescheduleTeamTimeouts - rebuild all timeout deadlines, i.e. after the timeout setting has changed
+	def rescheduleTeamTimeouts(self):
+		self.teamTimeoutDeadlines=[]
+		for extTeamName,lastContact in teamLastContactDict.items():
+			if lastContact>=0:
+				self.teamTimeoutDeadlines.append((lastContact+self.timeoutOrangeSec,extTeamName,lastContact))
+				self.teamTimeoutDeadlines.append((lastContact+self.timeoutRedSec,extTeamName,lastContact))
+		heapq.heapify(self.teamTimeoutDeadlines)
+		self.teamTabsDirtySet.update(teamLastContactDict.keys())
+
 	def updateTeamTimers(self):
-		# logging.info('timers:'+str(teamTimersDict))
-		# keep track of seconds since contact, rather than seconds remaining til timeout,
-		#  since timeout setting may change but each team's counter should still count
-		# 1. increment each number in teamTimersDict
-		# 2. if any of them are more than the timeout setting, they have timed out: start flashing
+		# logging.info('last contact:'+str(teamLastContactDict))
+		# keep track of the time of last contact, rather than seconds remaining til timeout,
+		#  since timeout setting may change but each team's elapsed time should still count
+		# 1. pop any timeout deadlines that have passed; those teams need to be redrawn
+		# 2. if any teams are past the timeout setting, they have timed out: start flashing
 		# 3. use this same timer to toggle the blink state of each style
+		# only teams that changed, teams that just hit a deadline, and teams that are currently
+		#  blinking (or filtered) are processed, rather than every team on every tick
 
 		if self.blinkToggle==0:
 			self.blinkToggle=1
@@ -5012,7 +5700,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			if self.newEntryWindowHiddenPopup.isVisible():
 				self.newEntryWindowHiddenPopup.setStyleSheet('color:black;background:lightgray')
 			# blink finger tabs of new entries that have children
-			if teamTimersDict: # to avoid errors before first newEntryWidget is created
+			if teamLastContactDict: # to avoid errors before first newEntryWidget is created
 				tw=self.newEntryWindow.ui.tabWidget
 				for new in newEntryWidget.instances:
 					i=tw.indexOf(new)
@@ -5035,7 +5723,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			if self.newEntryWindowHiddenPopup.isVisible():
 				self.newEntryWindowHiddenPopup.setStyleSheet('color:white;background:red')
 			# blink finger tabs of new entries that have children
-			if teamTimersDict: # to avoid errors before first newEntryWidget is created
+			if teamLastContactDict: # to avoid errors before first newEntryWidget is created
 				tw=self.newEntryWindow.ui.tabWidget
 				for new in newEntryWidget.instances:
 					i=tw.indexOf(new)
@@ -5055,76 +5743,59 @@ class MyWindow(QDialog,Ui_Dialog):
 		# 	logging.info('lastModAge for '+str(widget)+':'+str(widget.lastModAge))
 
 		teamTabsMoreButtonBlinkNeeded=False
-		for extTeamName in teamTimersDict:
-			secondsSinceContact=teamTimersDict.get(extTeamName,0)
-			# logging.info('extTeamName='+str(extTeamName)+'  secondsSinceContact='+str(secondsSinceContact)+'  hiddenTeamTabsList:'+str(self.hiddenTeamTabsList)+'  extTeamNameList:'+str(self.extTeamNameList))
-			if extTeamName not in self.hiddenTeamTabsList:
-				# logging.info('updateTeamTimers processing '+extTeamName)
-				# if there is a newEntryWidget currently open for this team, don't blink,
-				#  but don't reset the timer.  Only reset the timer when the dialog is accepted.
-				hold=False
-				for widget in newEntryWidget.instances:
-					if widget.ui.to_fromField.currentText()=="FROM" and getExtTeamName(widget.ui.teamField.text())==extTeamName:
-						hold=True
-				i=self.extTeamNameList.index(extTeamName)
-				status=teamStatusDict.get(extTeamName,"")
-				fsFilter=teamFSFilterDict.get(extTeamName,0)
-	##			logging.info("blinking "+extTeamName+": status="+status)
-	# 			logging.info("fsFilter "+extTeamName+": "+str(fsFilter))
-				# secondsSinceContact=teamTimersDict.get(extTeamName,0)
-				button=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide)
-				# logging.info('  i='+str(i)+'  status='+str(status)+'  filter='+str(fsFilter)+'  blink='+str(self.blinkToggle)+'  button='+str(button))
-				styleObjectName=normName('tab_'+extTeamName)
-				#741 wrap this entire if/else clause in a check to see if button exists;
-				#  it should always exist now, due to other fixes for #741
-				if button:
-					if status in ["Waiting for Transport","STANDBY","Available"] or (secondsSinceContact>=self.timeoutOrangeSec):
-						# if a team status is blinking, and the tab is not visible due to scrolling of a very wide tab bar,
-						#  then blink the three-dots icon; but this test may be expensive so don't test again after the first hit
-						#  https://stackoverflow.com/a/28805583/3577105
-						if not teamTabsMoreButtonBlinkNeeded and button.visibleRegion().isEmpty():
-							teamTabsMoreButtonBlinkNeeded=True
-						if self.blinkToggle==0:
-							# blink 0: style is one of these:
-							# - style as normal per status
-							button.setStyleSheet(buildObjSS(styleObjectName,statusStyleDict[status]))
-						else:
-							# blink 1: style is one of these:
-							# - timeout orange
-							# - timeout red
-							# - no change (if status is anything but 'Waiting for transport' or 'STANDBY')
-							# - blank (black on white) (if status is 'Waiting for transport' or 'STANDBY', and not timed out)
-							if not hold and status not in ["At IC","Off Duty"] and secondsSinceContact>=self.timeoutRedSec:
-								button.setStyleSheet(buildObjSS(styleObjectName,statusStyleDict["TIMED_OUT_RED"]))
-							elif not hold and status not in ["At IC","Off Duty"] and (secondsSinceContact>=self.timeoutOrangeSec and secondsSinceContact<self.timeoutRedSec):
-								button.setStyleSheet(buildObjSS(styleObjectName,statusStyleDict["TIMED_OUT_ORANGE"]))
-							elif status=="Waiting for Transport" or status=="STANDBY" or status=="Available":
-								button.setStyleSheet(buildObjSS(styleObjectName,statusStyleDict[""]))
-					else:
-						# not Waiting for Transport or Available, and not in orange/red time zone: draw the normal style
-						button.setStyleSheet(buildObjSS(styleObjectName,statusStyleDict[status]))
-				else:
-					logging.info('ERROR in updateTeamTimers: attempted to update appearance for a non-existent tab for '+str(extTeamName))
-					
-				# always check for fleetsync filtering, independent from team status
-				if self.blinkToggle==0:
-					if fsFilter>0:
-						f=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).font()
-						f.setStrikeOut(True)
-						self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).setFont(f)
-				if self.blinkToggle==1:
-					if fsFilter<2: # strikeout all the time if all devices for this callsign are filtered
-						f=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).font()
-						f.setStrikeOut(False)
-						self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).setFont(f)
-					else:
-						f=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).font()
-						f.setStrikeOut(True)
-						self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).setFont(f)
-						
-			# once they have timed out, keep incrementing; but if the timer is '-1', they will never timeout
-			if secondsSinceContact>-1:
-				teamTimersDict[extTeamName]=secondsSinceContact+1
+		self.teamTabRestyleCount=0
+		now=time.time()
+		while self.teamTimeoutDeadlines and self.teamTimeoutDeadlines[0][0]<=now:
+			[deadline,extTeamName,lastContact]=heapq.heappop(self.teamTimeoutDeadlines)
+			if teamLastContactDict.get(extTeamName,None)==lastContact: # otherwise it's stale: the team has been heard from since
+				self.teamTabsDirtySet.add(extTeamName)
+		for extTeamName in list(self.teamTabsDirtySet|self.teamTabsActiveSet):
+			# logging.info('extTeamName='+str(extTeamName)+'  hiddenTeamTabsList:'+str(self.hiddenTeamTabsList)+'  extTeamNameList:'+str(self.extTeamNameList))
+			if extTeamName in self.hiddenTeamTabsList or extTeamName not in self.extTeamNameList:
+				# hidden (or not yet added) tabs will be marked dirty again by addTab
+				self.teamTabsActiveSet.discard(extTeamName)
+				continue
+			# logging.info('updateTeamTimers processing '+extTeamName)
+			secondsSinceContact=getTeamSecondsSinceContact(extTeamName)
+			# if there is a newEntryWidget currently open for this team, don't blink,
+			#  but don't reset the timer.  Only reset the timer when the dialog is accepted.
+			hold=extTeamName in newEntryWidget.fromExtTeamNameDict
+			i=self.extTeamNameList.index(extTeamName)
+			status=teamStatusDict.get(extTeamName,"")
+			fsFilter=teamFSFilterDict.get(extTeamName,0)
+##			logging.info("blinking "+extTeamName+": status="+status)
+# 			logging.info("fsFilter "+extTeamName+": "+str(fsFilter))
+			button=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide)
+			# logging.info('  i='+str(i)+'  status='+str(status)+'  filter='+str(fsFilter)+'  blink='+str(self.blinkToggle)+'  button='+str(button))
+			timeoutLevel=0
+			if secondsSinceContact>=self.timeoutRedSec:
+				timeoutLevel=2
+			elif secondsSinceContact>=self.timeoutOrangeSec:
+				timeoutLevel=1
+			blinking=timeoutLevel>0 or status in ["Waiting for Transport","STANDBY","Available"]
+			# keep processing this team on every tick while it's blinking or filtered; otherwise
+			#  draw its steady (blink 1) state once, and leave it alone until it changes again
+			if blinking or fsFilter>0:
+				self.teamTabsActiveSet.add(extTeamName)
+				blinkToggle=self.blinkToggle
+			else:
+				self.teamTabsActiveSet.discard(extTeamName)
+				blinkToggle=1
+			#741 wrap this entire if/else clause in a check to see if button exists;
+			#  it should always exist now, due to other fixes for #741
+			if button:
+				if blinking:
+					# if a team status is blinking, and the tab is not visible due to scrolling of a very wide tab bar,
+					#  then blink the three-dots icon; but this test may be expensive so don't test again after the first hit
+					#  https://stackoverflow.com/a/28805583/3577105
+					if not teamTabsMoreButtonBlinkNeeded and button.visibleRegion().isEmpty():
+						teamTabsMoreButtonBlinkNeeded=True
+				[styleKey,strikeOut]=self.getTeamTabVisualState(status,blinkToggle,timeoutLevel,hold,fsFilter)
+				if self.applyTeamTabStyle(extTeamName,button,styleKey,strikeOut):
+					self.teamTabRestyleCount+=1
+			else:
+				logging.info('ERROR in updateTeamTimers: attempted to update appearance for a non-existent tab for '+str(extTeamName))
+		self.teamTabsDirtySet=set()
 
 		if teamTabsMoreButtonBlinkNeeded:
 			self.teamTabsMoreButtonIsBlinking=True
@@ -5172,7 +5843,9 @@ class MyWindow(QDialog,Ui_Dialog):
 				# logging.info("  key:"+QKeySequence(event.key()).toString()+"  mod:"+str(mod))
 				# logging.info("  key:"+QKeySequence(event.key()).toString())
 				# logging.info('  key:'+key+'  mod:'+str(mod))
-				if mod==Qt.ControlModifier and event.key()==Qt.Key_F:
+				if mod==(Qt.ControlModifier|Qt.ShiftModifier) and event.key()==Qt.Key_F:
+					self.sessionSearchDialogShow()
+				elif mod==Qt.ControlModifier and event.key()==Qt.Key_F:
 					self.findDialogShowHide()
 				elif self.ui.teamHotkeysWidget.isVisible():
 					# these key handlers apply only if hotkeys are enabled:
@@ -5353,7 +6026,8 @@ class MyWindow(QDialog,Ui_Dialog):
 			['self.teamNotesSaving','Saving the team notes catalog'],
 			['self.clueReportSaving','Printing a clue report'],
 			['self.clueLogSaving','Printing the clue log'],
-			['self.logPrinting','Printing the main radio log']
+			['self.logPrinting','Printing the main radio log'],
+			['not self.printJobs.join(0)','Printing queued print jobs']
 		]
 		waitedSec=0
 		total=-1
@@ -5383,11 +6057,20 @@ class MyWindow(QDialog,Ui_Dialog):
 					shuttingDownMsgBox.raise_()
 					shuttingDownMsgBox.setStandardButtons(QMessageBox.NoButton)
 					QApplication.processEvents()
-				time.sleep(1)
+				# while print jobs are still running, wait on the queue itself, which returns as soon as
+				#  the last one finishes rather than a full second later
+				if self.printJobs.join(0):
+					time.sleep(1)
+				else:
+					self.printJobs.join(1)
 				waitedSec+=1
 				if waitedSec==10:
 					logging.error('File save operation(s) are still in process, but it has been a while; exiting anyway; check the transcript for exceptions')
+					# don't start any more print jobs while exiting
+					for job in self.printJobs.drain():
+						logging.error('  print job cancelled: '+str(job))
 
+		self.shutdownPrintPool()
 		if waitedSec<3:
 			time.sleep(2) # just for aesthetics, so the operator has a chance to look at the final message box
 		qApp.quit() # needed to make sure all windows area closed
@@ -5692,7 +6375,10 @@ class MyWindow(QDialog,Ui_Dialog):
 
 				# moving rotation code from windows powershell to pure python:
 				# logging.info(f'totalEntryCount:{self.totalEntryCount}')
-				if self.totalEntryCount%5==0:
+				# entries can be added several at a time (see newEntryPost), so the count can skip past a
+				#  multiple of 5; rotate when 5 or more entries have been added since the last rotation
+				if self.totalEntryCount-self.lastBackupRotationCount>=5:
+					self.lastBackupRotationCount=self.totalEntryCount
 					try:
 						logging.info('  beginning backup file rotation...')
 						# rotate backup files after every 5 entries, but note the actual
@@ -5867,7 +6553,9 @@ class MyWindow(QDialog,Ui_Dialog):
 			#  left at True, probably due to early return above (see #340)
 			self.loadFlag=True
 			i=2
-			for row in loadedRadioLog:
+			chunkSize=50 # add entries in batches, while still checking for progress box cancel between batches
+			for chunkStart in range(0,len(loadedRadioLog),chunkSize):
+				chunk=loadedRadioLog[chunkStart:chunkStart+chunkSize]
 				QCoreApplication.processEvents() # required to check for progress box cancel
 				if progressBox.wasCanceled():
 					progressBox.close()
@@ -5877,8 +6565,8 @@ class MyWindow(QDialog,Ui_Dialog):
 								QMessageBox.Close,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
 					box.exec_() # modal
 					return
-				self.newEntry(row)
-				i=i+1
+				self.newEntries(chunk)
+				i=i+len(chunk)
 				progressBox.setValue(i)
 			self.loadFlag=False
 
@@ -6025,20 +6713,122 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.updateFileNames()
 			# don't change the rc file at this point - wait until a log entry is actually saved
 			self.ui.incidentNameLabel.setText(self.incidentName)
+		prevDatumFormat=[self.datum,self.coordFormat]
 		self.datum=self.optionsDialog.ui.datumField.currentText()
 		self.coordFormat=self.optionsDialog.ui.formatField.currentText()
 		# TMG 4-22-15: do not try to convert coords right now: it fails due to space in radioLoc i.e. "NO FIX"
-##		for row in self.radioLog:
-##			if row[9] and row[9]!='':
-##				row[4]=self.convertCoords(row[9].split('|'),self.datum,self.coordFormat)
-##		self.redrawTables()
+		#  - now done in the background, skipping anything that is not a valid fix; see reproject
+		if [self.datum,self.coordFormat]!=prevDatumFormat and hasattr(self,'reprojectEvent'): # not during init
+			self.reproject()
 		self.ui.datumFormatLabel.setText(self.datum+"\n"+self.coordFormat)
 		self.timeoutRedSec=timeoutDisplayList[self.optionsDialog.ui.timeoutField.value()][1]
 		self.timeoutOrangeSec=self.timeoutRedSec-300 # always go orange 5 minutes before red
 		if self.timeoutOrangeSec<0:
 			self.timeoutOrangeSec=self.timeoutRedSec-3 # or 3 seconds before for tiny values
+		self.rescheduleTeamTimeouts()
 		self.ui.timeoutLabel.setText("TIMEOUT:\n"+timeoutDisplayList[self.optionsDialog.ui.timeoutField.value()][0])
 
+	# reproject - re-project every stored location in radioLog and clueLog from its original fix into the
+	#  current datum and coordinate format, in the background; if the datum or format changes again before
+	#  it's done, the job starts over with the new target
+	def reproject(self):
+		self.reprojectTarget=[self.datum,self.coordFormat]
+		logging.info('re-projecting stored locations to '+str(self.reprojectTarget))
+		self.reprojectEvent.set()
+
+	# _reprojectWorker - converts the locations in batches (using the cached coordinate service) and publishes
+	#  each batch to the main thread, which updates the rows and the models; radioLog rows are re-projected
+	#  from origLocString; clue rows only have the radio location text that was shown when the clue was
+	#  entered, so their original fix is found from the radioLog entry with the same location text
+	def _reprojectWorker(self,event):
+		while True:
+			logging.info('_reprojectWorker: waiting for event...')
+			event.wait()
+			logging.info('_reprojectWorker: event received; beginning re-projection...')
+			event.clear()
+
+			self.reprojecting=True
+			try:
+				target=self.reprojectTarget
+				[datum,coordFormat]=target
+				items=[] # [kind,row,origLocString,coords]
+				rawDict={} # key = location text without whitespace; value = origLocString
+				for row in list(self.radioLog):
+					if len(row)>9 and row[9]:
+						coords=parseRawFix(row[9])
+						if coords:
+							items.append(['radioLog',row,row[9],coords])
+							rawDict[re.sub(r'\s+','',row[4])]=row[9]
+				for row in list(self.clueLog):
+					if len(row)>8 and row[8]:
+						# once a clue's fix is found, it's kept, since the clue and radioLog location texts stop
+						#  matching if a job is aborted after only some of its batches were applied
+						[clueRow,raw]=self.clueRawFixDict.get(id(row),[None,None])
+						if clueRow is not row:
+							raw=rawDict.get(re.sub(r'\s+','',row[8]),None)
+							if raw:
+								self.clueRawFixDict[id(row)]=[row,raw]
+						if raw:
+							items.append(['clueLog',row,raw,parseRawFix(raw)])
+				logging.info('_reprojectWorker: '+str(len(items))+' locations to re-project to '+str(target))
+				aborted=False
+				for n in range(0,len(items),self.reprojectBatchSize):
+					if self.reprojectTarget!=target: # changed again; start over
+						aborted=True
+						break
+					batch=items[n:n+self.reprojectBatchSize]
+					results=self.coordService.convertBatch([item[3] for item in batch],datum,[coordFormat])
+					updates=[[kind,row,raw,result[coordFormat]] for [[kind,row,raw,coords],result] in zip(batch,results)]
+					self._sig_reprojectBatchFromThread.emit([target,updates])
+					time.sleep(0.01) # let the main thread keep up
+				if not aborted:
+					self._sig_reprojectDoneFromThread.emit(target)
+			except Exception as e:
+				logging.error(f'_reprojectWorker: outer exception caught in order to keep the thread alive: {e}')
+			finally: # clear the flag even if there was an early exit
+				self.reprojecting=False
+
+	# reprojectBatch - runs in the main thread: update the rows of one batch, then tell the models which rows
+	#  changed, so that the views (including team tables, through their proxy models) repaint just those rows;
+	#  the '*' (stale GPS lock) or '!' (unknown response code) markers that fsParse puts around a location
+	#  are kept around the re-projected text
+	def reprojectBatch(self,batch):
+		[target,updates]=batch
+		if target!=self.reprojectTarget: # superseded by a newer datum or format change
+			return
+		radioLogIndices=[]
+		clueLogIndices=[]
+		for [kind,row,raw,text] in updates:
+			prevText=row[4] if kind=='radioLog' else row[8]
+			if len(prevText)>1 and prevText[0] in '*!' and prevText[-1]==prevText[0]:
+				text=prevText[0]+text+prevText[0]
+			if kind=='radioLog':
+				if row[9]!=raw: # amended since the batch was converted
+					continue
+				row[4]=text
+				self.radioLogPrintWatermarks.update(row) # so it's in the next continuation, and full prints aren't reused
+				n=findRowIndex(self.radioLog,row)
+				if n>-1:
+					radioLogIndices.append(n)
+			else:
+				row[8]=text
+				for n in range(len(self.clueLog)):
+					if self.clueLog[n] is row:
+						clueLogIndices.append(n)
+						break
+		if radioLogIndices:
+			self.tableModel.dataChanged.emit(self.tableModel.index(min(radioLogIndices),4),self.tableModel.index(max(radioLogIndices),4))
+		if clueLogIndices:
+			clueModel=self.clueLogDialog.ui.tableView.model()
+			clueModel.dataChanged.emit(clueModel.index(min(clueLogIndices),8),clueModel.index(max(clueLogIndices),8))
+
+	def reprojectDone(self,target):
+		if target!=self.reprojectTarget:
+			return
+		logging.info('re-projection to '+str(target)+' complete')
+		self.setColumnResizedFlag() # location text length may have changed
+		self.save()
+
 	def openNewEntry(self,key=None,callsign=None,formattedLocString=None,fleet=None,dev=None,origLocString=None,amendFlag=False,amendRow=None,isMostRecentForCallsign=False):
 		logging.info("openNewEntry called:key="+str(key)+" callsign="+str(callsign)+" formattedLocString="+str(formattedLocString)+" fleet="+str(fleet)+" dev="+str(dev)+" origLocString="+str(origLocString)+" amendFlag="+str(amendFlag)+" amendRow="+str(amendRow)+" isMostRecentForCallsign="+str(isMostRecentForCallsign))
 		self.clearSelectionAllTables() # in case copy or context menu was in process
@@ -6055,7 +6845,12 @@ class MyWindow(QDialog,Ui_Dialog):
 		# 	self.newEntryWindow.setWindowFlags(self.NEWFlags)
 
 		sec=time.time() # epoch seconds, for sorting purposes; not displayed
-		self.newEntryWidget=newEntryWidget(self,sec,formattedLocString,fleet,dev,origLocString,amendFlag,amendRow,isMostRecentForCallsign)
+		if self.newEntryWidgetPool: # use a pre-built widget if available
+			self.newEntryWidget=self.newEntryWidgetPool.pop(0)
+			self.newEntryWidget.activate(sec,formattedLocString,fleet,dev,origLocString,amendFlag,amendRow,isMostRecentForCallsign)
+		else:
+			self.newEntryWidget=newEntryWidget(self,sec,formattedLocString,fleet,dev,origLocString,amendFlag,amendRow,isMostRecentForCallsign)
+		self.scheduleNewEntryWidgetPoolRefill()
 		# focus rules and timeline:
 		#  openNewEntry
 		#    |-> newEntryWidget.__init__
@@ -6187,6 +6982,20 @@ class MyWindow(QDialog,Ui_Dialog):
 		
 		return rval # only relevant for #761
 	
+	def scheduleNewEntryWidgetPoolRefill(self,delay=500):
+		# only one refill pass is pending at any time; the delay lets a burst of
+		#  incoming calls / keypresses finish before spending time building new widgets
+		if not self.newEntryWidgetPoolRefillPending and len(self.newEntryWidgetPool)<self.newEntryWidgetPoolSize:
+			self.newEntryWidgetPoolRefillPending=True
+			QTimer.singleShot(delay,self.refillNewEntryWidgetPool)
+
+	def refillNewEntryWidgetPool(self):
+		self.newEntryWidgetPoolRefillPending=False
+		# build one widget per pass, so that the event loop stays responsive in between
+		if len(self.newEntryWidgetPool)<self.newEntryWidgetPoolSize:
+			self.newEntryWidgetPool.append(newEntryWidget(self,pooled=True))
+			self.scheduleNewEntryWidgetPoolRefill(50)
+
 	def isInCCD1List(self,callsign):
 		found=False
 		for i in self.CCD1List:
@@ -6213,59 +7022,48 @@ class MyWindow(QDialog,Ui_Dialog):
 		#  Only columns thru and including status are shown in the tables.
 		logging.info("newEntry called with these values:")
 		logging.info(values)
-		# add operator initials if not already present
-		if len(values)==10: 
-			if self.useOperatorLogin:
-				values.append(self.getOperatorInitials())
-			else:
-				values.append('')
-		niceTeamName=values[2]
-		extTeamName=getExtTeamName(niceTeamName)
-		#766 force unhiding to True if extTeamName is in hiddenTeamTabsList
-		# logging.info('hiddenTeamTabsList:'+str(self.hiddenTeamTabsList))
-		if extTeamName in self.hiddenTeamTabsList:
-			unhiding=True
-		# if self.useOperatorLogin:
-		# 	values[0]+=' ['+self.getOperatorInitials()+']'
-		status=values[5]
-		if values[4]==None:
-			values[4]=''
-		sec=values[6] # epoch seconds of dialog open time, for sorting; not displayed
+		self.newEntries([values],amend,unhiding)
+
+	# newEntries - add one or more entries; the whole batch is merged into radioLog (in time order)
+	#  with a single model insert or reset, then each entry is processed in the order given
+	def newEntries(self,valuesList,amend=False,unhiding=False):
+		unhidingList=[]
+		for values in valuesList:
+			# add operator initials if not already present
+			if len(values)==10: 
+				if self.useOperatorLogin:
+					values.append(self.getOperatorInitials())
+				else:
+					values.append('')
+			extTeamName=getExtTeamName(values[2])
+			#766 force unhiding to True if extTeamName is in hiddenTeamTabsList
+			# logging.info('hiddenTeamTabsList:'+str(self.hiddenTeamTabsList))
+			unhidingList.append(unhiding or extTeamName in self.hiddenTeamTabsList)
+			# if self.useOperatorLogin:
+			# 	values[0]+=' ['+self.getOperatorInitials()+']'
+			if values[4]==None:
+				values[4]=''
 		# sorting is bad because layoutChanged should be emitted which is slow;
 		#  since the only reason we really need to sort is to make sure that
 		#  entries are saved and displayed in the order they began (not necessarily
 		#  the same as the order they were accepted if multiple items are
-		#  on the stack), just do that by hand here when determining where to insert
-		#  the accepted entry into the radioLog list:
-		# if new sec is greater than the sec of the last radioLog item, then append.
-		# otherwise, decrement the index where the new row should be inserted,
-		#  and try the test again until new sec is greater than the sec of the
-		#  entry 'above'.
-		# proper use of beginInsertRows and endInsertRows here makes sure the view(s)
+		#  on the stack), the model merges each entry into radioLog based on sec
+		#  (epoch seconds of dialog open time, for sorting; not displayed) - see MyTableModel.insertEntries.
+		# proper use of beginInsertRows and endInsertRows there makes sure the view(s)
 		#  refresh automatically, allowing newEntryPost to be simplified,
-		#  reducing lag by 90+%
-		i=len(self.radioLog)-1 # i = zero-based list index of the last element
-		while i>-1 and isinstance(sec,float) and sec<self.radioLog[i][6]:
-			i=i-1
-# 			logging.info("new entry sec="+str(sec)+"; prev entry sec="+str(self.radioLog[i+1][6])+"; decrementing: i="+str(i))
-		# at this point, i is the index of the item AFTER which the new entry should be inserted,
-		#  so, use i+1 for the actual insertion
-		i=i+1
-		if not self.loadFlag:
-			model=self.ui.tableView.model()
-			model.beginInsertRows(QModelIndex(),i,i) # this is one-based
-# 		self.radioLog.append(values) # leave a blank entry at the end for aesthetics
-		# myList.insert(i,val) means val will become myList[i] using a zero-based index
-		#  i.e. val will be the (i+1)th element in the list 
-		self.radioLog.insert(i,values)
-# 		logging.info("inserting entry at index "+str(i))
-		if not self.loadFlag:
-			model.endInsertRows()
+		#  reducing lag by 90+%; during load, no model signals are emitted (see load)
+		self.tableModel.insertEntries(valuesList,emit=not self.loadFlag)
+		for n in range(len(valuesList)):
+			values=valuesList[n]
+			self.radioLogSearchIndex.update(values)
+			self.radioLogTeamIndex.update(values)
+			self.radioLogOpPeriodIndex.update(values)
+			self.radioLogPrintWatermarks.update(values)
 ##		if not values[3].startswith("RADIO LOG SOFTWARE:"):
 ##			self.newEntryProcessTeam(niceTeamName,status,values[1],values[3])
-		self.newEntryProcessTeam(niceTeamName,status,values[1],values[3],amend,unhiding=unhiding)
+			self.newEntryProcessTeam(values[2],values[5],values[1],values[3],amend,unhiding=unhidingList[n],entry=values)
 
-	def newEntryProcessTeam(self,niceTeamName,status,to_from,msg,amend=False,unhiding=False):
+	def newEntryProcessTeam(self,niceTeamName,status,to_from,msg,amend=False,unhiding=False,entry=None):
 		# logging.info(f'nept: niceTeamName={niceTeamName} status={status} to_from={to_from} msg={msg} amend={amend} unhiding={unhiding}')
 		extTeamName=getExtTeamName(niceTeamName)
 		# 393: if the new entry's extTeamName is a case-insensitive match for an
@@ -6293,7 +7091,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			if not self.loadFlag:
 				button=self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide)
 				if button:
-					button.setStyleSheet(statusStyleDict[status])
+					self.applyTeamTabStyle(extTeamName,button,status)
 				else:
 					logging.info(' ERROR: there was an attempt to set the styleSheet for a non-existent tab button:')
 					logging.info('   extTeamName='+str(extTeamName)+'  i='+str(i)+'  tabBar count='+str(self.ui.tabWidget.tabBar().count()))
@@ -6305,92 +7103,138 @@ class MyWindow(QDialog,Ui_Dialog):
 			if amend:
 				logging.info('t2')
 				found=False
-				for n in range(len(self.radioLog)-1,-1,-1):
-					entry=self.radioLog[n]
-					logging.info(' t3:'+str(n)+':'+str(entry))
-					if getExtTeamName(entry[2]).lower()==extTeamName.lower() and entry[1]=='FROM':
-						logging.info('  t4:match: now='+str(int(time.time())))
-						logging.info('  setting teamTimersDict to '+str(time.time()-entry[6]))
-						teamTimersDict[extTeamName]=int(time.time()-entry[6])
-						found=True
-						break
+				entry=self.radioLogTeamIndex.getLastFrom(extTeamName)
+				if entry:
+					logging.info('  t4:match: now='+str(int(time.time())))
+					logging.info('  setting teamLastContactDict to '+str(entry[6]))
+					self.setTeamLastContact(extTeamName,entry[6])
+					found=True
 				# if there are 'from' entries for the callsign, use the oldest 'to' entry for the callsign
 				if not found:
-					for entry in self.radioLog:
-						logging.info(' t3b:'+str(entry))
-						if getExtTeamName(entry[2]).lower()==extTeamName.lower():
-							logging.info('t4b:"TO" match: now='+str(int(time.time())))
-							teamTimersDict[extTeamName]=int(time.time()-entry[6])
-							found=True
-							break
+					entries=self.radioLogTeamIndex.getEntries(extTeamName)
+					if entries:
+						entry=entries[0]
+						logging.info('t4b:"TO" match: now='+str(int(time.time())))
+						self.setTeamLastContact(extTeamName,entry[6])
+						found=True
 				# this code should never be reached: what does it mean if there are no TO or FROM entries after amend?
 				if not found:
 					logging.info('WARNING after amend: team timer may be undetermined because no entries (either TO or FROM) were found for '+str(niceTeamName))
 			elif to_from=="FROM" and msg != "":
-				teamTimersDict[extTeamName]=0
+				self.setTeamLastContact(extTeamName)
 			# finally, disable timeouts as long as status is AT IC
 			if status=="At IC":
-				teamTimersDict[extTeamName]=-1 # no more timeouts will show up
+				self.setTeamLastContact(extTeamName,-1) # no more timeouts will show up
 		if not self.loadFlag:
-			QTimer.singleShot(100,lambda:self.newEntryPost(extTeamName))
+			self.scheduleNewEntryPost(extTeamName,entry)
 
-	def newEntryPost(self,extTeamName=None):
+	# scheduleNewEntryPost - queue the post-entry UI work (resizing, scrolling, save) for this team
+	#  and entry; all entries queued during the same event loop turn are handled by one newEntryPost call
+	def scheduleNewEntryPost(self,extTeamName=None,entry=None):
+		self.newEntryPostCount+=1
+		if extTeamName:
+			# keep the most recent team last, since that is the tab that will be shown
+			if extTeamName in self.newEntryPostTeamList:
+				self.newEntryPostTeamList.remove(extTeamName)
+			self.newEntryPostTeamList.append(extTeamName)
+		if entry:
+			self.newEntryPostEntryList.append(entry)
+		if not self.newEntryPostPending:
+			self.newEntryPostPending=True
+			QTimer.singleShot(0,self.newEntryPost)
+
+	# getColumnTextWidth - the width needed to show the text in the given view's current font,
+	#  including the item margins, same as resizeColumnToContents would measure for that text
+	def getColumnTextWidth(self,view,text):
+		metrics=view.fontMetrics()
+		margin=2*(view.style().pixelMetric(QStyle.PM_FocusFrameHMargin,None,view)+1)+1 # +1 for the grid line
+		return max([metrics.horizontalAdvance(line) for line in str(text).split('\n')])+margin
+
+	# widenColumnsForEntries - columns 2 and 4 are sized to fit the widest text in the view; since
+	#  the current width already fits all existing rows, only the new or amended entries need to be
+	#  measured, and the column only needs to change if one of those is wider
+	def widenColumnsForEntries(self,view,entries):
+		for i in [2,4]: # hardcode results in significant speedup
+			w=max([self.getColumnTextWidth(view,entry[i]) for entry in entries])
+			if w>view.columnWidth(i):
+				view.setColumnWidth(i,w)
+
+	def newEntryPost(self):
 # 		logging.info("1: called newEntryPost")
+		self.newEntryPostPending=False
+		teamList=self.newEntryPostTeamList
+		entries=self.newEntryPostEntryList
+		count=self.newEntryPostCount
+		self.newEntryPostTeamList=[]
+		self.newEntryPostEntryList=[]
+		self.newEntryPostCount=0
 		with self.radioLogNeedsPrintLock:
 			self.radioLogNeedsPrint=True
 		# don't do any sorting at all since layoutChanged during/after sort is
 		#  a huge cause of lag; see notes in newEntry function
 # 		logging.info("3")
-		# resize the bottom-most rows (up to 10 of them):
-		#  this makes lag time independent of total row count for large tables,
-		#  and reduces overall lag about 30% vs resizeRowsToContents (about 3 sec vs 4.5 sec for a 1300-row table)
-		for n in range(len(self.radioLog)-10,len(self.radioLog)):
-			if n>=0:
-				self.ui.tableView.resizeRowToContents(n+1)
+		# resize the rows of the new or amended entries only:
+		#  this makes lag time independent of total row count for large tables;
+		#  new entries are almost always near the bottom, so search from there
+		entryRowList=[] # [entry,source row]
+		for entry in entries:
+			for n in range(len(self.radioLog)-1,-1,-1):
+				if self.radioLog[n] is entry:
+					self.ui.tableView.resizeRowToContents(n)
+					entryRowList.append([entry,n])
+					break
 # 		logging.info("4")
 		self.ui.tableView.scrollToBottom()
 # 		logging.info("5")
-		for i in [2,4]: # hardcode results in significant speedup
-			self.ui.tableView.resizeColumnToContents(i)
+		if entries:
+			self.widenColumnsForEntries(self.ui.tableView,entries)
 # 		logging.info("5.1")
-		# note, the following clause results in a small lag for very large team count
-		#  and large radioLog (about 0.1sec on TomZen for 180kB log file); probably
-		#  not worth trying to optimize
-		for n in self.ui.tableViewList[1:]:
-			for i in [2,4]: # hardcode results in significant speedup
-				n.resizeColumnToContents(i)
+		# only the team tables that show one of the new or amended entries need to be touched
+		teamIndexDict={} # key = index in tableViewList; value = list of [entry,source row] shown in that table
+		for [entry,n] in entryRowList:
+			if not entry[2]: # entries with no team like 'radio log begins'
+				continue
+			if entry[2].lower()=="all" or entry[2].lower().startswith("all "): # may be shown in every team table; see CustomSortFilterProxyModel
+				for i in range(1,len(self.extTeamNameList)):
+					if not self.extTeamNameList[i].startswith("spacer"):
+						teamIndexDict.setdefault(i,[]).append([entry,n])
+				continue
+			entryExtTeamName=getExtTeamName(entry[2]).lower()
+			for i in range(1,len(self.extTeamNameList)):
+				if self.extTeamNameList[i].lower()==entryExtTeamName:
+					teamIndexDict.setdefault(i,[]).append([entry,n])
+					break
+		for i in teamIndexDict:
+			view=self.ui.tableViewList[i]
+			if not view: # not built yet; it will be fully sized when first shown
+				continue
+			self.widenColumnsForEntries(view,[x[0] for x in teamIndexDict[i]])
+			for [entry,n] in teamIndexDict[i]:
+				proxyIndex=view.model().mapFromSource(self.tableModel.index(n,0))
+				if proxyIndex.isValid():
+					view.resizeRowToContents(proxyIndex.row())
 # 		logging.info("5.2")
-		if extTeamName:
+		for extTeamName in teamList:
 # 			logging.info("5.2.1")
 			if extTeamName=="ALL TEAMS":
-				for i in range(1,len(self.extTeamNameList)):
-					self.ui.tabWidget.setCurrentIndex(i)
-					self.ui.tableViewList[i].resizeRowsToContents()
-					for n in range(len(self.radioLog)-10,len(self.radioLog)):
-						if n>=0:
-							self.ui.tableViewList[i].resizeRowToContents(n+1)
-					self.ui.tableViewList[i].scrollToBottom()
-			elif extTeamName!="z_00000":
+				# don't show each team tab in turn, since that would build every team table;
+				#  just scroll the ones that are already built - the rest scroll to the bottom when first shown
+				for view in self.ui.tableViewList[1:]:
+					if view:
+						view.scrollToBottom()
+			elif extTeamName!="z_00000" and extTeamName in self.extTeamNameList:
 # 				logging.info("5.2.1.2")
-				if extTeamName in self.extTeamNameList:
-# 					logging.info("5.2.1.2.1")
-					i=self.extTeamNameList.index(extTeamName)
-# 					logging.info("  a: i="+str(i))
-					self.ui.tabWidget.setCurrentIndex(i)
-# 					logging.info("  b")
-					self.ui.tableViewList[i].resizeRowsToContents()
-# 					logging.info("  c")
-					for n in range(len(self.radioLog)-10,len(self.radioLog)):
-						if n>=0:
-							self.ui.tableViewList[i].resizeRowToContents(n+1)
-# 					logging.info("  d")
+				i=self.extTeamNameList.index(extTeamName)
+# 				logging.info("  a: i="+str(i))
+				self.ui.tabWidget.setCurrentIndex(i) # builds the table if needed; see teamTabChanged
+# 				logging.info("  d")
+				if self.ui.tableViewList[i]:
 					self.ui.tableViewList[i].scrollToBottom()
-# 					logging.info("  e")
 # 		logging.info("6")
 		if self.sidebar.isVisible():
 			self.sidebar.showEvent() # refresh display
 # 		logging.info("7")
-		self.totalEntryCount+=1 # done here instead of newEntryWidget.accept, to catch system-generated messages too
+		self.totalEntryCount+=count # done here instead of newEntryWidget.accept, to catch system-generated messages too
 		self.save()
 		self.showTeamTabsMoreButtonIfNeeded()
 ##		self.redrawTables()
@@ -6404,14 +7248,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		# #508 - determine if the row being amended is the most recent row regarding the same callsign
 		#    row argument is zero-based, and radiolog always has a dummy row at the end
 		team=self.radioLog[row][2]
-		extTeamName=getExtTeamName(team)
-		found=False
-		for n in range(row+1,len(self.radioLog)):
-			entry=self.radioLog[n]
-			logging.info(' t3:'+str(n)+':'+str(entry))
-			if getExtTeamName(entry[2]).lower()==extTeamName.lower():
-				found=True
-				break
+		found=not self.radioLogTeamIndex.isMostRecent(self.radioLog[row])
 		if found:
 			logging.info('found a newer entry for '+team+' than the one being amended')
 		else:
@@ -6456,6 +7293,9 @@ class MyWindow(QDialog,Ui_Dialog):
 		for extTeamName in self.extTeamNameList[1:]:
 			self.addTab(extTeamName)
 			self.teamNotesBuildTooltip(extTeamName)
+		# addTab no longer selects each new tab as it is added (that would build every team table);
+		#  select the last one at the end, same as the end result before
+		self.ui.tabWidget.setCurrentIndex(self.ui.tabWidget.count()-1)
 # 		self.rebuildTeamHotkeys()
 	
 	def newTeam(self,newTeamName,unhiding=False):
@@ -6487,7 +7327,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.hiddenTeamTabsList=[x for x in self.hiddenTeamTabsList if extTeamName!=x]
 
 		# prevGroupCount=self.nonEmptyTabGroupCount
-		prevGroups=self.nonEmptyTabGroups
+		prevExtTeamNameList=[x for x in self.extTeamNameList if x!=extTeamName]
 		self.rebuildGroupedTabDict()
 		logging.info("extTeamNameList after sort:"+str(self.extTeamNameList))
 		if not self.loadFlag:
@@ -6500,7 +7340,9 @@ class MyWindow(QDialog,Ui_Dialog):
 			# logging.info('  prevGroups='+str(prevGroups)+'  nonEmptyTabGroups='+str(self.nonEmptyTabGroups))
 			# if restoringHidden or prevGroupCount!=self.nonEmptyTabGroupCount or self.ui.tabWidget.tabBar().count()<2:
 			# if restoringHidden or prevGroups!=self.nonEmptyTabGroups or self.ui.tabWidget.tabBar().count()<2:
-			if unhiding or prevGroups!=self.nonEmptyTabGroups or self.ui.tabWidget.tabBar().count()<2:
+			# when a tab group becomes non-empty, its spacer tab is inserted along with the new team tab,
+			#  rather than rebuilding all tabs (see insertNewTabs)
+			if unhiding or self.ui.tabWidget.tabBar().count()<2:
 				# logging.info('t1')
 				self.rebuildTabs()
 			else:
@@ -6509,7 +7351,9 @@ class MyWindow(QDialog,Ui_Dialog):
 				# so, if this would be the rightmost tab, activate a different tab first
 				self.ui.tabWidget.tabBar().setCurrentIndex(0)
 				# logging.info('t2: extTeamName='+str(extTeamName))
-				self.addTab(extTeamName)
+				if not self.insertNewTabs(prevExtTeamNameList):
+					logging.info('existing tabs are out of sequence; rebuilding all tabs')
+					self.rebuildTabs()
 				# self.rebuildTabs() # this is the line we wanted to get away from in #670, to reduce lag, which is the reason for this entire if clause
 		
 		if not extTeamName.startswith("spacer"):
@@ -6521,9 +7365,9 @@ class MyWindow(QDialog,Ui_Dialog):
 				self.allTeamsList.insert(i,niceTeamName)
 				self.allTeamsList.sort(key=lambda x:getExtTeamName(x))
 				logging.info("   allTeamsList after:"+str(self.allTeamsList))
-			#710 - preseve teamTimersDict  and teamCreatedTimeDict values e.g. on unhide
-			if extTeamName not in teamTimersDict.keys():
-				teamTimersDict[extTeamName]=0
+			#710 - preseve teamLastContactDict  and teamCreatedTimeDict values e.g. on unhide
+			if extTeamName not in teamLastContactDict.keys():
+				self.setTeamLastContact(extTeamName)
 			if extTeamName not in teamCreatedTimeDict:
 				teamCreatedTimeDict[extTeamName]=time.time()
 			# assign team hotkey
@@ -6560,7 +7404,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.ui.tableViewList[i].setTextElideMode(Qt.ElideNone)
 		self.ui.tableViewList[i].setFocusPolicy(Qt.NoFocus)
 		self.ui.tableViewList[i].setSelectionMode(QAbstractItemView.NoSelection)
-		self.ui.tableViewList[i].setStyleSheet("font-size:"+str(self.fontSize)+"pt")
+		self.ui.tableViewList[i].setFont(self.fonts.getFont('table'))
 		self.ui.tabGridLayoutList[i].addWidget(self.ui.tableViewList[i],0,0,1,1)
 		self.ui.tabWidget.insertTab(i,self.ui.tabList[i],'')
 		label=QLabel(" "+shortNiceTeamName+" ")
@@ -6638,27 +7482,17 @@ class MyWindow(QDialog,Ui_Dialog):
 		# logging.info("addTab: tabList before insert:"+str(self.ui.tabList))
 		self.ui.tabList.insert(i,QWidget())
 		# logging.info("addTab: tabList after insert:"+str(self.ui.tabList))
-		self.ui.tabList[i].setStyleSheet('font-size:'+str(self.menuFontSize)+'pt')
+		self.ui.tabList[i].setFont(self.menuFont)
 		self.ui.tabGridLayoutList.insert(i,QGridLayout(self.ui.tabList[i]))
 		self.ui.tabGridLayoutList[i].setContentsMargins(5,2,5,5)
 		self.ui.tabGridLayoutList[i].setSpacing(2)
-		tv=CustomTableView(self,self.ui.tabList[i])
-		tv.horizontalHeader().setMinimumSectionSize(10) # allow tiny column for operator initials
-		tv.horizontalHeader().setDefaultAlignment(Qt.AlignHCenter)
-		# tv.setEditTriggers(QAbstractItemView.AllEditTriggers)
-		self.ui.tableViewList.insert(i,tv)
-		self.ui.tableViewList[i].verticalHeader().setVisible(False)
-		self.ui.tableViewList[i].setTextElideMode(Qt.ElideNone)
-		self.ui.tableViewList[i].setFocusPolicy(Qt.ClickFocus)
-		self.ui.tableViewList[i].setSelectionMode(QAbstractItemView.ContiguousSelection)
-		self.ui.tableViewList[i].setStyleSheet("font-size:"+str(self.fontSize)+"pt")
-		self.ui.tableViewList[i].setPalette(self.teamTablePalette)
-		# self.ui.tableViewList[i].horizontalHeader().setMinimumSectionSize(10) # allow tiny column for operator initials
-		# self.ui.tabGridLayoutList[i].addWidget(self.ui.tableViewList[i],0,0,1,1)
+		# the table view and its proxy model are not built until the tab is first shown;
+		#  see materializeTeamTable
+		self.ui.tableViewList.insert(i,None)
+		self.proxyModelList.insert(i,None)
 		if 'spacer' not in extTeamName.lower(): #717 - widgets for spacer tabs should be blank
 			notes=QLabel('No notes for this callsign')
 			self.ui.tabGridLayoutList[i].addWidget(notes,0,0,1,1)
-			self.ui.tabGridLayoutList[i].addWidget(self.ui.tableViewList[i],1,0,1,1)
 		self.ui.tabWidget.insertTab(i,self.ui.tabList[i],'')
 		label=QLabel(" "+shortNiceTeamName+" ")
 		if len(shortNiceTeamName)<2:
@@ -6684,6 +7518,8 @@ class MyWindow(QDialog,Ui_Dialog):
 		ss=buildObjSS(styleObjectName,statusStyleDict[""])
 		logging.info('setting tab initial style in addTab: '+ss)
 		button.setStyleSheet(ss)
+		self.teamTabAppliedStateDict[extTeamName]=[button,"",None]
+		self.teamTabsDirtySet.add(extTeamName)
 # 		if not extTeamName.startswith("spacer"):
 # 			label.setStyleSheet("font-size:40px;border:1px outset green;qproperty-alignment:AlignHCenter")
 		# spacers should be disabled
@@ -6699,31 +7535,89 @@ class MyWindow(QDialog,Ui_Dialog):
 # 				logging.info("Team hotkey pool has been used up.  Not setting any hotkeyDict entry for "+niceTeamName)
 # 		self.rebuildTeamHotkeys()
 		
+		
+	# materializeTeamTable - build the table view and proxy model for team tab i, if not already built;
+	#  returns the view, or None for spacer tabs, which have no table
+	def materializeTeamTable(self,i):
+		if i<1 or i>=len(self.ui.tableViewList) or isinstance(self.ui.tabList[i],str):
+			return None
+		extTeamName=self.extTeamNameList[i]
+		if 'spacer' in extTeamName.lower(): #717 - widgets for spacer tabs should be blank
+			return None
+		if self.ui.tableViewList[i]:
+			return self.ui.tableViewList[i]
+		# logging.info('building team table for '+extTeamName)
+		tv=CustomTableView(self,self.ui.tabList[i])
+		tv.horizontalHeader().setMinimumSectionSize(10) # allow tiny column for operator initials
+		tv.horizontalHeader().setDefaultAlignment(Qt.AlignHCenter)
+		# tv.setEditTriggers(QAbstractItemView.AllEditTriggers)
+		self.ui.tableViewList[i]=tv
+		tv.verticalHeader().setVisible(False)
+		tv.setTextElideMode(Qt.ElideNone)
+		tv.setFocusPolicy(Qt.ClickFocus)
+		tv.setSelectionMode(QAbstractItemView.ContiguousSelection)
+		tv.setFont(self.fonts.getFont('table'))
+		tv.setPalette(self.teamTablePalette)
+		self.ui.tabGridLayoutList[i].addWidget(tv,1,0,1,1)
 		# better to NOT modify the entered team name value, for data integrity;
 		# instead, set the filter to only display rows where the human readable form
 		# of the value in column 2 matches the human readable form of the tab name
-		self.proxyModelList.insert(i,CustomSortFilterProxyModel(self))
+		self.proxyModelList[i]=CustomSortFilterProxyModel(self)
 		self.proxyModelList[i].setSourceModel(self.tableModel)
 		self.proxyModelList[i].setFilterFixedString(extTeamName)
-		self.ui.tableViewList[i].setModel(self.proxyModelList[i])
-		self.ui.tableViewList[i].hideColumn(6) # hide epoch seconds
-		self.ui.tableViewList[i].hideColumn(7) # hide epoch seconds
-		self.ui.tableViewList[i].hideColumn(8) # hide epoch seconds
-		self.ui.tableViewList[i].hideColumn(9) # hide epoch seconds
+		tv.setModel(self.proxyModelList[i])
+		tv.hideColumn(6) # hide epoch seconds
+		tv.hideColumn(7) # hide fleet
+		tv.hideColumn(8) # hide device
+		tv.hideColumn(9) # hide original location string
 		if not self.useOperatorLogin:
-			self.ui.tableViewList[i].hideColumn(10) # hide operator initials
-		self.ui.tableViewList[i].resizeRowsToContents()
+			tv.hideColumn(10) # hide operator initials
 
 		#NOTE if you do this section before the model is assigned to the tableView,
 		# python will crash every time!
 		# see the QHeaderView.ResizeMode docs for descriptions of each resize mode value
 		# note QHeaderView.setResizeMode is deprecated in 5.4, replaced with
 		# .setSectionResizeMode but also has both global and column-index forms
-		self.ui.tableViewList[i].horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+		tv.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
 		# automatically expand the 'message' column width to fill available space
-		self.ui.tableViewList[i].horizontalHeader().setSectionResizeMode(3,QHeaderView.Stretch)
-		self.redrawTables(i) # adjust columns widths on this table only
-		
+		tv.horizontalHeader().setSectionResizeMode(3,QHeaderView.Stretch)
+		self.teamTableLastShownDict[tv]=time.time()
+		# column widths and row heights are set the first time it's shown; see teamTabChanged
+		self.teamTablesNeedingRedraw.add(tv)
+		return tv
+
+	# releaseIdleTeamTables - tear down team table views (and their proxy models) that have not been shown
+	#  for a while, to keep the number of live filtered views small; they are rebuilt when shown again
+	def releaseIdleTeamTables(self):
+		current=self.ui.tabWidget.currentIndex()
+		now=time.time()
+		for i in range(1,len(self.ui.tableViewList)):
+			tv=self.ui.tableViewList[i]
+			if tv and i!=current and now-self.teamTableLastShownDict.get(tv,0)>self.teamTableReleaseSec:
+				logging.info('releasing idle team table for '+str(self.extTeamNameList[i]))
+				self.teamTableLastShownDict.pop(tv,None)
+				self.teamTablesNeedingRedraw.discard(tv)
+				self.teamTablesNeedingRowResize.discard(tv)
+				self.rowsNeedingResizeDict.pop(tv,None)
+				self.ui.tabGridLayoutList[i].removeWidget(tv)
+				tv.setModel(None)
+				tv.deleteLater()
+				self.proxyModelList[i].deleteLater()
+				self.ui.tableViewList[i]=None
+				self.proxyModelList[i]=None
+
+	# getTabGroup - return the name of the tab group for this callsign: the first group in tabGroups
+	#  whose regular expression matches, or 'other'; each callsign is only classified once
+	def getTabGroup(self,etn):
+		if etn not in self.tabGroupDict:
+			g="other" # default to the 'other' group
+			for [grpName,grpRegex] in self.tabGroupRegexList:
+				if grpRegex.match(etn):
+					g=grpName
+					break # use only the first matching group
+			self.tabGroupDict[etn]=g
+		return self.tabGroupDict[etn]
+
 	def rebuildGroupedTabDict(self):
 		# sort the tabs list, inserting hidden uniquely-named spacer tabs between groups
 		# grouping sequence and regular expressions are defined in the local config file
@@ -6733,18 +7627,12 @@ class MyWindow(QDialog,Ui_Dialog):
 		# Once a callsign has been assigned to a group, make sure to not assign it
 		#  to any other groups.
 		grouped=dict()
-		for grp in self.tabGroups:
+		for grp in self.tabGroupRegexList:
 			grouped[grp[0]]=[]
 		grouped["other"]=[]
 		# for etn in [getExtTeamName(x) for x in self.allTeamsList if not x.startswith("spacer")]: # spacerless list, including hidden tabs
 		for etn in [x for x in self.extTeamNameList+self.hiddenTeamTabsList if not x.startswith("spacer")]: # spacerless list, including hidden tabs
-			g="other" # default to the 'other' group
-			for grp in self.tabGroups:
-				if re.match(grp[1].replace("^","^z_0*").replace("Team ","Team"),etn,re.IGNORECASE):
-					# account for leading 'z_' and any zeros introduced by getExtTeamName
-					g=grp[0]
-					break # use only the first matching group
-			grouped[g].append(etn)
+			grouped[self.getTabGroup(etn)].append(etn)
 			
 		# sort alphanumerically within each group
 		for grp in grouped:
@@ -6755,25 +7643,26 @@ class MyWindow(QDialog,Ui_Dialog):
 		
 		# rebuild self.extTeamNameList, with groups and spacers in the correct order,
 		#  since everything throughout the code keys off its sequence;
-		#  note the spacer names need to be unique for later processing
+		#  note the spacer names need to be unique for later processing, and each group's spacer
+		#  is named by the group's position, so that it keeps the same name when other groups
+		#  become non-empty (see insertNewTabs)
 		# also rebuild allTeamsList in the same sequence, which includes hidden teams
 		self.extTeamNameList=['spacerLeft']
 		self.allTeamsList=[]
-		spacerIndex=1 # start with 1 so trailing 0 doesn't get deleted in getNiceTeamName
-		for grp in self.tabGroups:
+		for spacerIndex in range(1,len(self.tabGroupRegexList)+1): # start with 1 so trailing 0 doesn't get deleted in getNiceTeamName
 			spacerNeeded=False
-# 			logging.info("group:"+str(grp)+":"+str(grouped[grp[0]]))
-			for val in grouped[grp[0]]:
+			grpName=self.tabGroupRegexList[spacerIndex-1][0]
+# 			logging.info("group:"+str(grpName)+":"+str(grouped[grpName]))
+			for val in grouped[grpName]:
 				self.allTeamsList.append(getNiceTeamName(val))
 				if val not in self.hiddenTeamTabsList:
 	# 				logging.info("appending:"+val)
 					self.extTeamNameList.append(val)
 					spacerNeeded=True
 			#766 don't append a spacer after the group if all group members are hidden
-			# if len(grouped[grp[0]])>0:
+			# if len(grouped[grpName])>0:
 			if spacerNeeded:
 				self.extTeamNameList.append("spacer"+str(spacerIndex))
-				spacerIndex=spacerIndex+1
 		for val in grouped["other"]:
 			if val!="dummy":
 				self.allTeamsList.append(getNiceTeamName(val))
@@ -6783,6 +7672,19 @@ class MyWindow(QDialog,Ui_Dialog):
 		# self.nonEmptyTabGroupCount=len([v for v in grouped.values() if v])
 		self.nonEmptyTabGroups=[k for k in grouped.keys() if grouped[k]]
 		# logging.info('nonEmptyTabGroups:'+str(self.nonEmptyTabGroups))
+
+	# insertNewTabs - after rebuildGroupedTabDict, add tabs only for the names (teams and spacers) that are new
+	#  in extTeamNameList, in order, so each lands at its final index; returns False if the existing tabs are
+	#  not in the same sequence as the new list (then the caller needs to rebuild all tabs)
+	def insertNewTabs(self,prevExtTeamNameList):
+		prevSet=set(prevExtTeamNameList)
+		existing=[x for x in self.extTeamNameList if x in prevSet]
+		if existing!=[x for x in prevExtTeamNameList if x in set(self.extTeamNameList)] or len(existing)!=len(self.ui.tabList):
+			return False
+		for extTeamName in self.extTeamNameList:
+			if extTeamName not in prevSet:
+				self.addTab(extTeamName)
+		return True
 			
 	def tabContextMenu(self,pos):
 		menu=QMenu()
@@ -7346,11 +8248,17 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.extTeamNameList.remove(extTeamName)
 			if not teamName.lower().startswith("spacer"):
 				self.teamNameList.remove(niceTeamName)
-				#710 - don't delete teamTimersDict entry
-				# del teamTimersDict[extTeamName]
+				#710 - don't delete teamLastContactDict entry
+				# del teamLastContactDict[extTeamName]
 				del teamCreatedTimeDict[extTeamName]
 			del self.ui.tabList[i]
 			del self.ui.tabGridLayoutList[i]
+			view=self.ui.tableViewList[i]
+			if view: # so the deferred redraw passes and releaseIdleTeamTables don't keep working on it
+				self.teamTableLastShownDict.pop(view,None)
+				self.teamTablesNeedingRedraw.discard(view)
+				self.teamTablesNeedingRowResize.discard(view)
+				self.rowsNeedingResizeDict.pop(view,None)
 			del self.ui.tableViewList[i]
 			self.ui.tabWidget.removeTab(i)
 			try:
@@ -7558,6 +8466,15 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.sidebarIsVisible=True
 		self.sidebarAnimation.start()
 
+	def sessionSearchDialogShow(self):
+		if not self.sessionSearchDialog:
+			self.sessionSearchDialog=sessionSearchDialog(self)
+		if not self.sessionSearchIndexing and time.time()-self.sessionSearchIndexTime>60:
+			self.sessionSearchIndexEvent.set() # bring the index up to date while the search is being typed
+		self.sessionSearchDialog.show()
+		self.sessionSearchDialog.raise_()
+		self.sessionSearchDialog.textField.setFocus()
+
 	def findDialogShowHide(self,e=None):
 		# logging.info('sidebarShowHide: x='+str(self.sidebar.pos().x())+'  e='+str(e))
 		# logging.info('sidebarShowHide: h='+str(self.findDialog.height())+'  e='+str(e))
@@ -7693,6 +8610,10 @@ class MyWindow(QDialog,Ui_Dialog):
 
 	def resizeEvent(self,e):
 		self.findDialog.setVisible(False)
+		self.geometryCheckTimer.start() # restart: only check once the resize is done
+
+	def moveEvent(self,e):
+		self.geometryCheckTimer.start()
 		
 	def newEntryWindowHiddenPopupClicked(self,event):
 		self.newEntryWindowHiddenPopup.close()
@@ -8241,50 +9162,46 @@ class teamTabsPopup(QWidget,Ui_teamTabsPopup):
 				sum([self.ui.teamTabsSummaryTableWidget.verticalHeader().sectionSize(n)\
 	 			for n in range(self.ui.teamTabsSummaryTableWidget.rowCount())])+2
 		self.ui.teamTabsSummaryTableWidget.setFixedHeight(self.ttsHeight)
-		self.tttRowHeight=self.ui.teamTabsTableWidget.verticalHeader().defaultSectionSize() # assuming all rows are the same height
-		self.ui.teamTabsTableWidget.cellClicked.connect(self.cellClicked)
+		self.tttRowHeight=self.ui.teamTabsTableView.verticalHeader().defaultSectionSize() # assuming all rows are the same height
+		# the team table is backed by a model, so that status / timer / color changes only
+		#  repaint the affected cells, instead of rebuilding all items every time
+		self.teamTabsTableModel=teamTabsTableModel(self.parent)
+		self.ui.teamTabsTableView.setModel(self.teamTabsTableModel)
+		self.ui.teamTabsTableView.clicked.connect(self.cellClicked)
 		# disable mouse wheel scroll: https://stackoverflow.com/a/61085704/3577105
-		self.ui.teamTabsTableWidget.wheelEvent=lambda event: None
+		self.ui.teamTabsTableView.wheelEvent=lambda event: None
 		self.initialWidth=self.width()
 		self.initialHeight=self.height()
 		self.teamsRowCount=0
 		self.teamsColumnCount=0
 
-	def cellClicked(self,row,col):
-		ci=self.ui.teamTabsTableWidget.currentItem()
-		self.ui.teamTabsTableWidget.clearSelection() # get rid of fixed gray background, to allow already-set status color to keep showing
-		if ci:
-			ntn=self.ui.teamTabsTableWidget.currentItem().text()
-			# remove any leading team hotkey text (character+colon+space)
-			if ntn[1]==':' and len(ntn)>3:
-				ntn=ntn[3:]
-			etn=getExtTeamName(ntn)
+	def cellClicked(self,index):
+		self.ui.teamTabsTableView.clearSelection() # get rid of fixed gray background, to allow already-set status color to keep showing
+		etn=self.teamTabsTableModel.extTeamNameAt(index)
+		if etn:
+			ntn=getNiceTeamName(etn)
 			# logging.info('cell clicked: '+str(ntn)+'  extTeamName='+str(etn))
 			# logging.info('extTeamNameList: '+str(self.parent.extTeamNameList))
-			try:
+			if etn in self.parent.extTeamNameList:
 				i=self.parent.extTeamNameList.index(etn)
 				# logging.info('  i='+str(i))
 				self.parent.ui.tabWidget.setCurrentIndex(i)
 				# self.hide() # after self.hide, the popup doesn't show again on hover
 				self.parent.sidebarShowHide() # sidebarShowHide does a proper hide, but then any mouse movement shows it again - must be leaveEvent even though it's been moved away
-			except: # this will get called if the team tab is hidden
-				try:
-					# logging.info('searching hiddenTeamTabsList:'+str(self.parent.hiddenTeamTabsList))
-					ntn=ntn.replace('[','').replace(']','') # might be wrapped in square brackets
-					etn=getExtTeamName(ntn)
-					i=self.parent.hiddenTeamTabsList.index(etn)
-					box=QMessageBox(QMessageBox.Warning,"Hidden tab","The tab for '"+ntn+"' is currently hidden.\n\nDo you want to unhide the tab?",
-						QMessageBox.Yes|QMessageBox.No,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
-					box.show()
-					box.raise_()
-					if box.exec_()==QMessageBox.No:
-						return
-					self.parent.unhideTeamTab(ntn)
+			elif etn in self.parent.hiddenTeamTabsList: # the team tab is hidden
+				box=QMessageBox(QMessageBox.Warning,"Hidden tab","The tab for '"+ntn+"' is currently hidden.\n\nDo you want to unhide the tab?",
+					QMessageBox.Yes|QMessageBox.No,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+				box.show()
+				box.raise_()
+				if box.exec_()==QMessageBox.No:
+					return
+				self.parent.unhideTeamTab(ntn)
+				if etn in self.parent.extTeamNameList:
 					i=self.parent.extTeamNameList.index(etn)
 					self.parent.ui.tabWidget.setCurrentIndex(i)
-					# self.hide()
-				except: # not in either list
-					logging.info('ERROR: clicked a cell '+etn+' that does not exist in extTeamNameList or hiddenTeamTabsList')
+				# self.hide()
+			else: # not in either list
+				logging.info('ERROR: clicked a cell '+etn+' that does not exist in extTeamNameList or hiddenTeamTabsList')
 
 	def showEvent(self,e=None):
 		# logging.info('sidebar showEvent called')
@@ -8313,44 +9230,14 @@ class teamTabsPopup(QWidget,Ui_teamTabsPopup):
 		self.teamsRowCount=min(listCount,maxRowCount)
 		self.teamsColumnCount=int((listCount+maxRowCount-1)/maxRowCount) # do the math - this works
 		# logging.info(' listCount='+str(listCount)+' maxRowCount='+str(maxRowCount)+' : setting rows='+str(rowCount)+' cols='+str(colCount))
-		self.ui.teamTabsTableWidget.setRowCount(self.teamsRowCount)
-		self.ui.teamTabsTableWidget.setColumnCount(self.teamsColumnCount)
 		if not self.parent.sidebarIsVisible:
 			self.move(-self.width(),self.y())
 
-		# 2. populate team table - done before determining total width, due to resizeColumnsToContents
+		# 2. populate team table - done before determining total width, due to resizeColumnsToContents;
+		#  the model only resets if the team list or the table shape has changed; otherwise, it only
+		#  emits dataChanged for any cells whose text (hidden state, hotkey) has changed
 
-		self.ui.teamTabsTableWidget.clear()
-		hotkeyRDict={v:k for k,v in self.parent.hotkeyDict.items()}
-		showTeamHotkeys=self.parent.ui.teamHotkeysWidget.isVisible()
-		for i in range(listCount):
-			col=int(i/self.teamsRowCount)
-			row=i-(col*self.teamsRowCount)
-			t=theList[i]
-			etn=getExtTeamName(t)
-			hotkey=hotkeyRDict.get(t,"")
-			# status=teamStatusDict.get(etn,None)
-			# if status is not None: # could be empty string
-			# self.ui.tabWidget.tabBar().tabButton(i,QTabBar.LeftSide).setStyleSheet(statusStyleDict[status])
-			twi=QTableWidgetItem(t)
-			twi.setWhatsThis(etn) # for use by setTeamTableColors
-			hidden=False
-			# modifications for hidden tabs:
-			#  - always italic
-			#  - light gray text if/when background is white; black text otherwise
-			#  - always wrap in square brackets []
-			#  - use bgHidden for background color, if specificed
-			if etn in self.parent.hiddenTeamTabsList:
-				hidden=True
-				twi.setText('['+t+']')
-			if showTeamHotkeys and hotkey:
-				twi.setText(hotkey+': '+twi.text())
-			if hidden:
-				f=twi.font()
-				f.setItalic(True)
-				twi.setFont(f)
-			# logging.info('i='+str(i)+'  row='+str(row)+'  col='+str(col)+'  text='+str(theList[i]))
-			self.ui.teamTabsTableWidget.setItem(row,col,twi)
+		layoutChanged=self.teamTabsTableModel.setTeams(theList,self.teamsRowCount,self.teamsColumnCount)
 		self.setTeamTableColors() #715 - handle colors and blinking in a separate function
 
 		# 3. populate summary table
@@ -8389,13 +9276,15 @@ class teamTabsPopup(QWidget,Ui_teamTabsPopup):
 
 		# 4. set sidebar fixed size based on team table size (and fixed summary table size)
 
-		self.ui.teamTabsTableWidget.resizeColumnsToContents()
-		teamTabsTableRequiredWidth=4 # initial size = borders
-		for n in range(self.teamsColumnCount):
-			teamTabsTableRequiredWidth+=self.ui.teamTabsTableWidget.columnWidth(n)+4
-		newWidth=max(self.initialWidth,teamTabsTableRequiredWidth)
-		newHeight=max(self.initialHeight,self.teamsRowCount*self.tttRowHeight+self.ttsHeight+18)
-		self.setFixedSize(newWidth,newHeight)
+		if layoutChanged:
+			self.ui.teamTabsTableView.resizeColumnsToContents()
+			teamTabsTableRequiredWidth=4 # initial size = borders
+			for n in range(self.teamsColumnCount):
+				teamTabsTableRequiredWidth+=self.ui.teamTabsTableView.columnWidth(n)+4
+			newWidth=max(self.initialWidth,teamTabsTableRequiredWidth)
+			newHeight=max(self.initialHeight,self.teamsRowCount*self.tttRowHeight+self.ttsHeight+18)
+			self.setFixedSize(newWidth,newHeight)
+		newHeight=self.height()
 
 		# 5. move sidebar to correct vertical position
 
@@ -8410,47 +9299,9 @@ class teamTabsPopup(QWidget,Ui_teamTabsPopup):
 		self.move(self.x(),y)
 
 	def setTeamTableColors(self):
-		# Walk through all cells; extTeamName for that cell is stored in the QTableWidgetItem.whatsThis.
-		# Use that to get the status and the age, and use those to determine the color based on blinkToggle.
-		for col in range(self.teamsColumnCount):
-			for row in range(self.teamsRowCount):
-				# logging.info('blink: col='+str(col)+' row='+str(row))
-				twi=self.ui.teamTabsTableWidget.item(row,col)
-				if twi: # None for empty cells
-		# logging.info('teamTabsPopup.blink')
-		# self.ui.teamTabsTableWidget.selectAll()
-		# logging.info('  selected:'+str(self.ui.teamTabsTableWidget.selectedItems()))
-		# for qti in self.ui.teamTabsTableWidget.selectedItems():
-					extTeamName=twi.whatsThis()
-					# logging.info(' blink: '+str(extTeamName))
-					hidden=False
-					if extTeamName in self.parent.hiddenTeamTabsList:
-						hidden=True
-					status=teamStatusDict.get(extTeamName,None)
-					age=teamTimersDict.get(extTeamName,0)
-					if self.parent.blinkToggle==1 and status not in ["At IC","Off Duty"]:
-						if age>=self.parent.timeoutRedSec:
-							status='TIMED_OUT_RED'
-						elif age>=self.parent.timeoutOrangeSec:
-							status='TIMED_OUT_ORANGE'
-					ad=statusAppearanceDict.get(status,{})
-					fgColor=ad.get('foreground',None)
-					bgColor=ad.get('background',None)
-					bgHidden=ad.get('bgHidden',None)
-					blink=ad.get('blink',False)
-					if hidden:
-						fgColor=QColor('#555')
-						bgColor=bgHidden
-					if blink and self.parent.blinkToggle==1:
-						fgColor=None
-						if hidden:
-							fgColor=QColor('#555')
-						bgColor=None
-					fgColor=fgColor or Qt.black
-					bgColor=bgColor or Qt.white
-					# logging.info('  status:'+str(status)+'  hidden:'+str(hidden)+'  blink:'+str(blink)+'  fgColor:'+str(fgColor)+'  bgColor:'+str(bgColor))
-					twi.setForeground(QBrush(fgColor))
-					twi.setBackground(QBrush(bgColor))
+		# called every second from updateTeamTimers; the model only emits dataChanged
+		#  for cells whose colors have actually changed
+		self.teamTabsTableModel.updateColors()
 
 
 class caltopoFolderPopup(QDialog):
@@ -8918,8 +9769,8 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 		self.setWindowFlags(Qt.WindowStaysOnTopHint)
 		self.setWindowFlags((self.windowFlags() | Qt.WindowStaysOnTopHint) & ~Qt.WindowMinMaxButtonsHint & ~Qt.WindowContextHelpButtonHint)
 ##		self.setAttribute(Qt.WA_DeleteOnClose)
-		self.ui.datumField.setEnabled(False) # since convert menu is not working yet, TMG 4-8-15
-		self.ui.formatField.setEnabled(False) # since convert menu is not working yet, TMG 4-8-15
+		# datum and format were disabled since convert menu was not working yet, TMG 4-8-15;
+		#  existing locations are now re-projected when they change - see MyWindow.reproject
 		self.adjustSize()
 		self.setFixedSize(self.size())
 		self.secondWorkingDirCB()
@@ -9917,6 +10768,387 @@ class customCompleterPopup(QListView):
 		super(customCompleterPopup,self).selectionChanged(selected,deselected)
 
 
+# token index over radioLog entries, for findDialog: each entry's search text (time : team : message,
+#  same as the popup text) is split into lower-case word tokens; a query only looks at the entries
+#  of the indexed tokens that contain each query token, so the cost depends on the number of matches
+#  rather than on the size of the log; entries are keyed by row identity, since rows are amended in place;
+#  the indexed tokens that contain a query token are found from an index of each token's substrings of
+#  up to 3 characters (n-grams), rather than by scanning every indexed token
+class logSearchIndex():
+	tokenMatchCacheSize=500
+	def __init__(self):
+		self.clear()
+
+	def clear(self):
+		self.entryDict={} # key = id(row); value = [row,searchText,lowerSearchText,tokenSet]
+		self.tokenDict={} # key = token; value = set of row ids
+		self.gramDict={} # key = substring of 1 to 3 characters; value = set of indexed tokens that contain it
+		self.tokenMatchCache={} # key = query token; value = set of indexed tokens that contain it; kept up to date as tokens are added or removed
+
+	def getGrams(self,token):
+		return set(token[i:i+n] for n in (1,2,3) for i in range(len(token)-n+1))
+
+	def addToken(self,token):
+		self.tokenDict[token]=set()
+		for gram in self.getGrams(token):
+			self.gramDict.setdefault(gram,set()).add(token)
+		for [queryToken,matchingTokens] in self.tokenMatchCache.items():
+			if queryToken in token:
+				matchingTokens.add(token)
+
+	def removeToken(self,token):
+		del self.tokenDict[token]
+		for gram in self.getGrams(token):
+			tokens=self.gramDict[gram]
+			tokens.discard(token)
+			if not tokens:
+				del self.gramDict[gram]
+		for matchingTokens in self.tokenMatchCache.values():
+			matchingTokens.discard(token)
+
+	# getMatchingTokens - the indexed tokens that contain the query token: for a query token of up to 3 characters,
+	#  that's its n-gram entry; for a longer one, check the tokens in the smallest entry of its 3-character n-grams
+	def getMatchingTokens(self,queryToken):
+		matchingTokens=self.tokenMatchCache.get(queryToken,None)
+		if matchingTokens is None:
+			if len(queryToken)<=3:
+				matchingTokens=set(self.gramDict.get(queryToken,set()))
+			else:
+				candidates=min([self.gramDict.get(queryToken[i:i+3],set()) for i in range(len(queryToken)-2)],key=len)
+				matchingTokens=set(t for t in candidates if queryToken in t)
+			if len(self.tokenMatchCache)>=self.tokenMatchCacheSize:
+				del self.tokenMatchCache[next(iter(self.tokenMatchCache))] # oldest query token
+			self.tokenMatchCache[queryToken]=matchingTokens
+		return matchingTokens
+
+	def getSearchText(self,row):
+		return row[0]+' : '+row[2]+' : '+row[3]
+
+	def update(self,row): # call for every added or amended row
+		self.remove(row)
+		text=self.getSearchText(row)
+		lowerText=text.lower()
+		tokens=set(re.findall(r'\w+',lowerText))
+		self.entryDict[id(row)]=[row,text,lowerText,tokens]
+		for token in tokens:
+			if token not in self.tokenDict:
+				self.addToken(token)
+			self.tokenDict[token].add(id(row))
+
+	def remove(self,row):
+		entry=self.entryDict.pop(id(row),None)
+		if entry:
+			for token in entry[3]:
+				ids=self.tokenDict.get(token,set())
+				ids.discard(id(row))
+				if not ids and token in self.tokenDict:
+					self.removeToken(token)
+
+	def getText(self,row):
+		return self.entryDict[id(row)][1]
+
+	# search - returns the matching rows (case-insensitive 'contains' match of the entire query, same as
+	#  the previous completer behavior), ranked by the number of query words that match whole words,
+	#  then in log order
+	def search(self,query):
+		q=query.lower()
+		if not q.strip():
+			return []
+		queryTokens=set(re.findall(r'\w+',q))
+		ids=None
+		# any entry containing the query must contain each query token inside one of its own tokens
+		for queryToken in queryTokens:
+			queryTokenIds=set()
+			for t in self.getMatchingTokens(queryToken):
+				queryTokenIds|=self.tokenDict[t]
+			if ids is None:
+				ids=queryTokenIds
+			else:
+				ids&=queryTokenIds
+			if not ids:
+				return []
+		if ids is None: # query has no word characters at all
+			ids=self.entryDict.keys()
+		results=[]
+		for rowId in ids:
+			[row,text,lowerText,tokens]=self.entryDict[rowId]
+			if q in lowerText:
+				results.append([-len(queryTokens&tokens),row[6],row])
+		results.sort(key=lambda x:(x[0],x[1] or 0)) # sec can be None for historical clue log entries
+		return [x[2] for x in results]
+
+
+# per-team index of radioLog entries, for amendEntry and newEntryProcessTeam: each team's entries
+#  are kept in log order (by sec, same as radioLog), along with that team's most recent 'FROM' entry,
+#  so those lookups only look at the entries for that team; keys are lower-case extTeamNames, to match
+#  the case-insensitive comparison used there; entries are keyed by row identity, since rows are amended in place
+class teamEntryIndex():
+	def __init__(self):
+		self.clear()
+
+	def clear(self):
+		self.teamEntriesDict={} # key = lower-case extTeamName; value = list of rows, in log order
+		self.teamLastFromDict={} # key = lower-case extTeamName; value = most recent 'FROM' row
+		self.rowKeyDict={} # key = id(row); value = key in teamEntriesDict
+
+	def getKey(self,team):
+		return getExtTeamName(team).lower()
+
+	def update(self,row): # call for every added or amended row
+		self.remove(row)
+		if not row[2]:
+			return
+		key=self.getKey(row[2])
+		entries=self.teamEntriesDict.setdefault(key,[])
+		# insert after any entries with the same or earlier sec, same as MyTableModel.findInsertIndex
+		sec=row[6]
+		if isinstance(sec,float):
+			lo=0
+			hi=len(entries)
+			while lo<hi:
+				mid=(lo+hi)//2
+				if sec<entries[mid][6]:
+					hi=mid
+				else:
+					lo=mid+1
+		else:
+			lo=len(entries)
+		entries.insert(lo,row)
+		self.rowKeyDict[id(row)]=key
+		self.updateLastFrom(key)
+
+	def remove(self,row):
+		key=self.rowKeyDict.pop(id(row),None)
+		if key is None:
+			return
+		entries=self.teamEntriesDict[key]
+		for n in range(len(entries)):
+			if entries[n] is row:
+				del entries[n]
+				break
+		if not entries:
+			del self.teamEntriesDict[key]
+		self.updateLastFrom(key)
+
+	def updateLastFrom(self,key):
+		self.teamLastFromDict.pop(key,None)
+		for entry in reversed(self.teamEntriesDict.get(key,[])):
+			if entry[1]=='FROM':
+				self.teamLastFromDict[key]=entry
+				break
+
+	def getEntries(self,team):
+		return self.teamEntriesDict.get(self.getKey(team),[])
+
+	def getLastFrom(self,team):
+		return self.teamLastFromDict.get(self.getKey(team),None)
+
+	def isMostRecent(self,row): # rows with no team are not indexed; treat them as not the most recent, same as the blank row at the end of radioLog
+		key=self.rowKeyDict.get(id(row),None)
+		return key is not None and self.teamEntriesDict[key][-1] is row
+
+
+# findRowIndex - index of the given row (by identity) in a list of rows that is in time order
+#  (radioLog, or a copy of it); binary search on sec, falling back to a linear search for rows
+#  whose sec is not a float, which are at the end
+def findRowIndex(rows,row):
+	sec=row[6]
+	if isinstance(sec,float):
+		lo=0
+		hi=len(rows)
+		while lo<hi:
+			mid=(lo+hi)//2
+			if rows[mid][6]<sec:
+				lo=mid+1
+			else:
+				hi=mid
+		while lo<len(rows) and rows[lo][6]==sec:
+			if rows[lo] is row:
+				return lo
+			lo+=1
+	for n in range(len(rows)-1,-1,-1):
+		if rows[n] is row:
+			return n
+	return -1
+
+# operational period index of radioLog entries, for printing: keeps the rows that start an operational
+#  period ('Radio Log Begins', 'Operational Period <x> Begins', and continued incident rows) in log order,
+#  each parsed once when added or amended, so the row ranges of an operational period can be found
+#  without walking and re-parsing the whole log
+class opPeriodIndex():
+	def __init__(self):
+		self.clear()
+
+	def clear(self):
+		self.markerList=[] # [row,opPeriod]; opPeriod is None for rows that don't change the OP number
+		self.markerIdSet=set()
+
+	# parseMarker - returns [isOpStartRow,opPeriod or None]; same tests as the previous print loop
+	def parseMarker(self,msg):
+		try:
+			if msg.startswith('Radio Log Begins - Continued incident'): # #523: handled continued incidents
+				return [True,int(msg.split(': Operational Period ')[1].split()[0])]
+			if msg.startswith("Operational Period") and msg.split()[3]=="Begins:":
+				return [True,int(msg.split()[2])]
+		except:
+			pass
+		if msg.startswith("Radio Log Begins:"):
+			return [True,None]
+		return [False,None]
+
+	def update(self,row): # call for every added or amended row
+		self.remove(row)
+		[isOpStartRow,opPeriod]=self.parseMarker(row[3])
+		if not isOpStartRow:
+			return
+		self.markerList.append([row,opPeriod])
+		self.markerIdSet.add(id(row))
+
+	def remove(self,row):
+		if id(row) not in self.markerIdSet:
+			return
+		self.markerIdSet.discard(id(row))
+		self.markerList=[x for x in self.markerList if x[0] is not row]
+
+	# getRanges - for the given list of rows (radioLog or a copy of it) returns [ranges,opStartRowIndices]:
+	#  the [start,end) index ranges of the rows in the requested operational period, and the indices of
+	#  the rows inside those ranges that start an operational period; rows before the first
+	#  'Operational Period <x> Begins' row are in operational period 1
+	def getRanges(self,rows,opPeriod):
+		ranges=[]
+		opStartRowIndices=[]
+		entryOpPeriod=1 # update this number when 'Operational Period <x> Begins' rows are found
+		start=0
+		markers=[[findRowIndex(rows,row),markerOpPeriod] for [row,markerOpPeriod] in list(self.markerList)]
+		markers.sort(key=lambda x:x[0]) # log order
+		for [n,markerOpPeriod] in markers:
+			if n<0: # not in rows
+				continue
+			if markerOpPeriod is not None:
+				if entryOpPeriod==opPeriod and n>start:
+					ranges.append([start,n])
+				entryOpPeriod=markerOpPeriod
+				start=n
+			if entryOpPeriod==opPeriod:
+				opStartRowIndices.append(n)
+		if entryOpPeriod==opPeriod and len(rows)>start:
+			ranges.append([start,len(rows)])
+		return [ranges,opStartRowIndices]
+
+
+# print job queue: each job is an immutable tuple describing what to print -
+#  ('clueReport',clueDataTuples), ('clueLog',opPeriod), or ('radioLog',opPeriod,teams,continuation) where
+#  teams is False (the whole log), True (all team logs) or a team name;
+#  submitting a job that is identical to one that is already queued (and not yet started) returns the
+#  queued job's id instead of adding a duplicate; each kind of job ('clueReport','clueLog','radioLog')
+#  is taken by its own worker thread, oldest first, so that a long radio log print doesn't hold up a
+#  clue report; the status of each job ('queued','running','done','failed','cancelled') is kept until
+#  finishedStatusCount more recent jobs have finished
+class printJobQueue():
+	kinds=['clueReport','clueLog','radioLog']
+	finishedStatusCount=100
+
+	def __init__(self):
+		self.condition=threading.Condition()
+		self.heapDict={kind:[] for kind in self.kinds} # key = kind; value = heap of (jobId,job); jobId is increasing, so oldest first
+		self.lastJobId=0
+		self.queuedJobDict={} # key = job; value = jobId; only jobs that have not been started yet
+		self.statusDict={} # key = jobId; value = [job,status]
+		self.finishedIdList=[]
+		self.unfinishedCount=0
+
+	def submit(self,job): # returns the job id
+		with self.condition:
+			jobId=self.queuedJobDict.get(job,None)
+			if jobId is not None:
+				logging.info('print job '+str(jobId)+' is already queued; not adding a duplicate: '+str(job))
+				return jobId
+			self.lastJobId+=1
+			jobId=self.lastJobId
+			heapq.heappush(self.heapDict[job[0]],(jobId,job))
+			self.queuedJobDict[job]=jobId
+			self.statusDict[jobId]=[job,'queued']
+			self.unfinishedCount+=1
+			logging.info('print job '+str(jobId)+' queued: '+str(job))
+			self.condition.notify_all()
+			return jobId
+
+	def get(self,kind): # blocks until a job of this kind is available; returns [jobId,job]
+		heap=self.heapDict[kind]
+		with self.condition:
+			while not heap:
+				self.condition.wait()
+			(jobId,job)=heapq.heappop(heap)
+			del self.queuedJobDict[job]
+			self.statusDict[jobId][1]='running'
+			return [jobId,job]
+
+	def taskDone(self,jobId,status='done'):
+		with self.condition:
+			self.setFinished(jobId,status)
+			self.condition.notify_all()
+
+	def setFinished(self,jobId,status): # caller must hold self.condition
+		self.statusDict[jobId][1]=status
+		self.unfinishedCount-=1
+		self.finishedIdList.append(jobId)
+		if len(self.finishedIdList)>self.finishedStatusCount:
+			del self.statusDict[self.finishedIdList.pop(0)]
+
+	def getStatus(self,jobId): # returns None if the job id is unknown, or finished too long ago
+		with self.condition:
+			return self.statusDict.get(jobId,[None,None])[1]
+
+	def getUnfinishedCount(self): # queued plus running
+		with self.condition:
+			return self.unfinishedCount
+
+	# join - wait until all submitted jobs have finished; returns False if timeout (seconds) expired first
+	def join(self,timeout=None):
+		with self.condition:
+			return self.condition.wait_for(lambda:self.unfinishedCount==0,timeout)
+
+	# drain - cancel all jobs that have not been started yet; returns the cancelled jobs
+	def drain(self):
+		with self.condition:
+			cancelled=[]
+			for heap in self.heapDict.values():
+				while heap:
+					(jobId,job)=heapq.heappop(heap)
+					self.setFinished(jobId,'cancelled')
+					cancelled.append(job)
+			self.queuedJobDict={}
+			self.condition.notify_all()
+			return cancelled
+
+
+# print watermarks of radioLog entries, for continuation printing: every added or amended row gets the
+#  next change number; each printed radio log - keyed by (opPeriod,teams) where teams is False, True,
+#  or a team name, same as printLog - remembers the change number it was printed at, its page count,
+#  and its pdf file(s): the full print followed by any continuations printed since then
+class printWatermarkIndex():
+	def __init__(self):
+		self.clear()
+
+	def clear(self):
+		self.changeCount=0
+		self.rowChangeDict={} # key = id(row); value = change number of the latest add or amend
+		self.watermarkDict={} # key = (opPeriod,teams); value = [change number,page count,pdf file names]
+
+	def update(self,row): # call for every added or amended row
+		self.changeCount+=1
+		self.rowChangeDict[id(row)]=self.changeCount
+
+	def getChange(self,row): # 0 for rows that were never added or amended, e.g. the blank row at the end
+		return self.rowChangeDict.get(id(row),0)
+
+	def getWatermark(self,key):
+		return self.watermarkDict.get(key,None)
+
+	def setWatermark(self,key,watermark):
+		self.watermarkDict[key]=watermark
+
+
 class findDialog(QWidget,Ui_findDialog):
 	def __init__(self,parent):
 		self.parent=parent
@@ -9925,20 +11157,17 @@ class findDialog(QWidget,Ui_findDialog):
 		self.ui.setupUi(self)
 		self.setFixedSize(self.size())
 		self.teamTabIndexBeforeFind=1
-		self.ui.findField.textChanged.connect(self.updateCountLabel)
-
-	def showEvent(self,e):
-		logging.info('opening findDialog')
-		self.teamTabIndexBeforeFind=self.parent.ui.tabWidget.currentIndex()
-		self.theList=[entry[0]+' : '+entry[2]+' : '+entry[3] for entry in self.parent.radioLog]
-		self.completer=QCompleter(self.theList)
-		self.completer.setFilterMode(Qt.MatchContains)
-		# performance speedups: see https://stackoverflow.com/questions/33447843
+		self.results=[] # radioLog rows that match the current findField text, in popup order
+		# the completer is built once; its model holds only the current results from
+		#  parent.radioLogSearchIndex, so the completer itself does no filtering
+		self.completerModel=QStringListModel()
+		self.completer=QCompleter(self.completerModel,self)
+		self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
 		self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-		self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
 		self.customPopup=customCompleterPopup(self)
 		self.completer.setPopup(self.customPopup)
 		self.completer.popup().installEventFilter(self)
+		# performance speedups: see https://stackoverflow.com/questions/33447843
 		self.completer.popup().setUniformItemSizes(True)
 		self.completer.popup().setLayoutMode(QListView.Batched)
 		self.completer.popup().setMouseTracking(True)
@@ -9950,6 +11179,22 @@ class findDialog(QWidget,Ui_findDialog):
 		#  ever see the problem
 		self.completer.setMaxVisibleItems(30)
 		self.ui.findField.setCompleter(self.completer)
+		# textEdited rather than textChanged: highlighting a popup row also changes the text
+		self.ui.findField.textEdited.connect(self.search)
+		self.ui.findField.textChanged.connect(self.updateCountLabel)
+
+	def showEvent(self,e):
+		logging.info('opening findDialog')
+		self.teamTabIndexBeforeFind=self.parent.ui.tabWidget.currentIndex()
+
+	def search(self,text):
+		self.results=self.parent.radioLogSearchIndex.search(text)
+		self.completerModel.setStringList([self.parent.radioLogSearchIndex.getText(row) for row in self.results])
+		if self.results:
+			self.completer.complete()
+		else:
+			self.completer.popup().hide()
+		self.updateCountLabel()
 
 	def mouseEnter(self,i):
 		# select and highlight the hovered row in the popup:
@@ -9958,7 +11203,7 @@ class findDialog(QWidget,Ui_findDialog):
 		self.processChangedSelection(i)
 
 	def updateCountLabel(self,*args):
-		count=self.completer.completionCount()
+		count=len(self.results)
 		i=self.customPopup.currentIndex().row() # initially -1 if no row is selected
 		# Note that after the first time any popup row has been selected,
 		#  moving up (from the first row) or down (from the last row) back to the QLineEdit field, such that no rows are selected,
@@ -9983,10 +11228,10 @@ class findDialog(QWidget,Ui_findDialog):
 		self.customPopup.resize(self.width()-25,self.customPopup.height())
 		self.updateCountLabel()
 		# select the correct row in the main tableView
-		idx=self.theList.index(i.data())
+		row=self.results[i.row()]
+		idx=findRowIndex(self.parent.radioLog,row) # by identity, in case of identical entries
 		self.parent.ui.tableView.selectRow(idx)
-		completerRowText=i.data()
-		[entryTime,teamName,entryText]=completerRowText.split(' : ')[0:3]
+		[entryTime,teamName,entryText]=[row[0],row[2],row[3]]
 		if teamName: # only if it's a valid team name
 			extTeamName=getExtTeamName(teamName)
 			tabIndex=self.parent.extTeamNameList.index(extTeamName)
@@ -9997,7 +11242,10 @@ class findDialog(QWidget,Ui_findDialog):
 			self.parent.ui.tabWidget.setCurrentIndex(tabIndex)
 
 			# select and highlight the correct row in the team's tableView, based on time and text
-			model=self.parent.ui.tableViewList[tabIndex].model()
+			teamTable=self.parent.materializeTeamTable(tabIndex)
+			if not teamTable:
+				return
+			model=teamTable.model()
 			teamTableIndicesByTime=model.match(model.index(0,0),Qt.DisplayRole,entryTime,-1) # -1 = return all matches
 			teamTableRowsByTime=[i.row() for i in teamTableIndicesByTime]
 			logging.info('  match rows by time '+str(entryTime)+':'+str(teamTableRowsByTime))
@@ -10019,7 +11267,7 @@ class findDialog(QWidget,Ui_findDialog):
 			# logging.info('  match indices:'+str(teamTableIndices))
 			# logging.info('  match rows:'+str([i.row() for i in teamTableIndices]))
 			# logging.info('  first row:'+str(model.itemData(model.index(0,0))))
-			self.parent.ui.tableViewList[tabIndex].selectRow(i.row())
+			teamTable.selectRow(i.row())
 
 	def closeEvent(self,e):
 		# logging.info('  closeEvent')
@@ -10033,7 +11281,7 @@ class findDialog(QWidget,Ui_findDialog):
 		self.parent.ui.tableView.clearSelection()
 		self.parent.ui.tableView.scrollToBottom()
 		self.parent.ui.tabWidget.setCurrentIndex(self.teamTabIndexBeforeFind)
-		if len(self.parent.ui.tableViewList)>1:
+		if len(self.parent.ui.tableViewList)>1 and self.parent.ui.tableViewList[self.teamTabIndexBeforeFind]:
 			self.parent.ui.tableViewList[self.teamTabIndexBeforeFind].clearSelection()
 			self.parent.ui.tableViewList[self.teamTabIndexBeforeFind].scrollToBottom()
 
@@ -10103,6 +11351,154 @@ class findDialog(QWidget,Ui_findDialog):
 			return False
 
 
+# cross-session search [Ctrl-Shift-F]: query parent.searchSessions by text, team, date range and incident name;
+#  double-click a result (or select it and click Open) to open its source session file at that row
+class sessionSearchDialog(QDialog):
+	def __init__(self,parent):
+		QDialog.__init__(self,parent)
+		self.parent=parent
+		self.setWindowTitle('Search All Sessions')
+		self.setWindowFlags(Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog)
+		self.setStyleSheet(globalStyleSheet)
+		self.results=[] # dicts from searchSessions, in table row order
+		self.viewer=None
+		self.textField=QLineEdit()
+		self.textField.setPlaceholderText('Text')
+		self.teamField=QLineEdit()
+		self.teamField.setPlaceholderText('Team')
+		self.incidentField=QLineEdit()
+		self.incidentField.setPlaceholderText('Incident name')
+		self.dateCheckBox=QCheckBox('From')
+		self.startDateEdit=QDateEdit(QDate.currentDate().addMonths(-1))
+		self.startDateEdit.setCalendarPopup(True)
+		self.startDateEdit.setEnabled(False)
+		self.endDateEdit=QDateEdit(QDate.currentDate())
+		self.endDateEdit.setCalendarPopup(True)
+		self.endDateEdit.setEnabled(False)
+		self.dateCheckBox.toggled.connect(self.startDateEdit.setEnabled)
+		self.dateCheckBox.toggled.connect(self.endDateEdit.setEnabled)
+		self.searchButton=QPushButton('Search')
+		self.searchButton.setDefault(True)
+		self.openButton=QPushButton('Open')
+		self.statusLabel=QLabel('')
+		self.resultsTable=QTableWidget(0,6)
+		self.resultsTable.setHorizontalHeaderLabels(['Incident','Date','Time','Team','Message','Kind'])
+		self.resultsTable.setSelectionBehavior(QAbstractItemView.SelectRows)
+		self.resultsTable.setSelectionMode(QAbstractItemView.SingleSelection)
+		self.resultsTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
+		self.resultsTable.verticalHeader().setVisible(False)
+		self.resultsTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+		self.resultsTable.horizontalHeader().setSectionResizeMode(4,QHeaderView.Stretch)
+		fieldsLayout=QHBoxLayout()
+		fieldsLayout.addWidget(self.textField,3)
+		fieldsLayout.addWidget(self.teamField,1)
+		fieldsLayout.addWidget(self.incidentField,2)
+		fieldsLayout.addWidget(self.dateCheckBox)
+		fieldsLayout.addWidget(self.startDateEdit)
+		fieldsLayout.addWidget(QLabel('To'))
+		fieldsLayout.addWidget(self.endDateEdit)
+		fieldsLayout.addWidget(self.searchButton)
+		bottomLayout=QHBoxLayout()
+		bottomLayout.addWidget(self.statusLabel,1)
+		bottomLayout.addWidget(self.openButton)
+		layout=QVBoxLayout(self)
+		layout.addLayout(fieldsLayout)
+		layout.addWidget(self.resultsTable)
+		layout.addLayout(bottomLayout)
+		self.setLayout(layout)
+		self.resize(1000,600)
+		self.searchButton.clicked.connect(self.search)
+		self.openButton.clicked.connect(self.openSelectedResult)
+		self.resultsTable.cellDoubleClicked.connect(self.openResult)
+
+	def search(self):
+		startSec=None
+		endSec=None
+		if self.dateCheckBox.isChecked():
+			startSec=QDateTime(self.startDateEdit.date(),QTime(0,0)).toSecsSinceEpoch()
+			endSec=QDateTime(self.endDateEdit.date().addDays(1),QTime(0,0)).toSecsSinceEpoch() # through the end of the 'To' date
+		maxResults=1000
+		self.results=self.parent.searchSessions(text=self.textField.text(),team=self.teamField.text().strip() or None,
+				startSec=startSec,endSec=endSec,incidentName=self.incidentField.text().strip() or None,maxResults=maxResults)
+		logging.info('session search for text="'+self.textField.text()+'" team="'+self.teamField.text()+'" incident="'+self.incidentField.text()+'": '+str(len(self.results))+' result(s)')
+		self.resultsTable.setUpdatesEnabled(False)
+		self.resultsTable.setRowCount(len(self.results))
+		for n in range(len(self.results)):
+			result=self.results[n]
+			date=time.strftime('%m/%d/%Y',time.localtime(result['sec'])) if result['sec'] else ''
+			values=[result['incidentName'] or '',date,result['time'],result['team'],result['message'],'Clue Log' if result['kind']=='clueLog' else 'Radio Log']
+			for col in range(len(values)):
+				item=QTableWidgetItem(values[col])
+				item.setToolTip(result['fileName'])
+				self.resultsTable.setItem(n,col,item)
+		self.resultsTable.setUpdatesEnabled(True)
+		msg=str(len(self.results))+' result(s)'
+		if len(self.results)>=maxResults:
+			msg+=' (showing the first '+str(maxResults)+')'
+		if self.parent.sessionSearchIndexing or not self.parent.sessionSearchIndexLoaded:
+			msg+='; the index is being updated, so some sessions may not be included yet'
+		self.statusLabel.setText(msg)
+
+	def openSelectedResult(self):
+		rows=self.resultsTable.selectionModel().selectedRows()
+		if rows:
+			self.openResult(rows[0].row())
+
+	def openResult(self,row,col=None):
+		result=self.results[row]
+		logging.info('opening session search result: '+result['fileName']+' line '+str(result['lineNumber']))
+		self.viewer=sessionViewerDialog(self,result['fileName'],result['lineNumber'],result['incidentName'] or os.path.basename(result['fileName']))
+		self.viewer.show()
+		self.viewer.raise_()
+
+
+# read-only view of one saved radiolog or clue log csv file, scrolled to and selecting the given csv line;
+#  the file is shown as it was saved (without comment lines), so the current session is not changed
+class sessionViewerDialog(QDialog):
+	def __init__(self,parent,fileName,lineNumber,title):
+		QDialog.__init__(self,parent)
+		self.setWindowTitle(title+' - '+fileName)
+		self.setWindowFlags(Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog)
+		self.setStyleSheet(globalStyleSheet)
+		if '_clueLog' in fileName:
+			headers=['#','Description','Team','Time','Date','OP','Location','Instructions']
+		else:
+			headers=['Time','To/From','Team','Message','Radio Location','Status']
+		rows=[]
+		selectedRow=None
+		try:
+			with open(fileName,'r') as csvFile:
+				csvReader=csv.reader(csvFile)
+				for row in csvReader:
+					if not row or row[0].startswith('#'):
+						continue
+					if csvReader.line_num==lineNumber:
+						selectedRow=len(rows)
+					rows.append(row)
+		except Exception as e:
+			logging.info('could not read '+fileName+' for the session viewer: '+str(e))
+			rows=[]
+			headers=['Error']
+			rows.append(['Could not read '+fileName+': '+str(e)])
+		self.table=QTableWidget(len(rows),len(headers))
+		self.table.setHorizontalHeaderLabels(headers)
+		self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+		self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+		self.table.setWordWrap(True)
+		self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+		self.table.horizontalHeader().setSectionResizeMode(min(3,len(headers)-1),QHeaderView.Stretch)
+		for n in range(len(rows)):
+			for col in range(min(len(headers),len(rows[n]))):
+				self.table.setItem(n,col,QTableWidgetItem(rows[n][col]))
+		layout=QVBoxLayout(self)
+		layout.addWidget(self.table)
+		self.setLayout(layout)
+		self.resize(1000,600)
+		if selectedRow is not None:
+			self.table.selectRow(selectedRow)
+			self.table.scrollToItem(self.table.item(selectedRow,0),QAbstractItemView.PositionAtCenter)
+
+
 class printDialog(QDialog,Ui_printDialog):
 	def __init__(self,parent):
 		QDialog.__init__(self)
@@ -10111,6 +11507,11 @@ class printDialog(QDialog,Ui_printDialog):
 		self.ui.setupUi(self)
 		self.setStyleSheet(globalStyleSheet)
 		self.ui.opPeriodComboBox.addItem(str(self.parent.opPeriod))
+		# continuation: only print the radio log entries added or amended since the previous print of each log
+		self.continuationField=QCheckBox('Only new or amended entries since the last print',self)
+		self.continuationField.setFont(self.ui.teamRadioLogsField.font())
+		self.continuationField.setIconSize(self.ui.teamRadioLogsField.iconSize())
+		self.ui.verticalLayout_3.insertWidget(self.ui.verticalLayout_3.indexOf(self.ui.teamRadioLogsField)+1,self.continuationField)
 		self.setWindowFlags((self.windowFlags() | Qt.WindowStaysOnTopHint) & ~Qt.WindowMinMaxButtonsHint & ~Qt.WindowContextHelpButtonHint)
 		# self.setFixedSize(self.size())
 
@@ -10157,12 +11558,13 @@ class printDialog(QDialog,Ui_printDialog):
 
 	def accept(self):
 		opPeriod=self.ui.opPeriodComboBox.currentText()
+		continuation=self.continuationField.isChecked()
 		if self.ui.radioLogField.isChecked():
 			logging.info("PRINT radio log")
-			self.parent.printLog(opPeriod)
+			self.parent.printLog(opPeriod,continuation=continuation)
 		if self.ui.teamRadioLogsField.isChecked():
 			logging.info("PRINT team radio logs")
-			self.parent.printTeamLogs(opPeriod)
+			self.parent.printTeamLogs(opPeriod,continuation=continuation)
 		if self.ui.clueLogField.isChecked():
 			logging.info("PRINT clue log")
 # 			logging.info("  printDialog.accept.clueLog.trace1")
@@ -10281,9 +11683,8 @@ class newEntryWindow(QDialog,Ui_newEntryWindow):
 			}
 		""")
 
-		self.timer=QTimer(self)
-		self.timer.start(1000)
-		self.timer.timeout.connect(self.autoCleanup)
+		# entry countdowns (lastModAge) and auto-cleanup are driven by the main window's
+		#  one-second teamTimer, through tick, rather than by one timer per widget
 	
 	def raiseWindowAndChildren(self):
 		self.raise_()
@@ -10468,7 +11869,12 @@ class newEntryWindow(QDialog,Ui_newEntryWindow):
 	# cleanup rules:
 	# if subject dialog or clue dialog is open, do not increment the tab's idle timer
 	# if there is any text in the tab's message field, or if the cleanup checkbox is False, ignore the idle timer or set it to zero on every timer count (never auto-close the tab)
-	def autoCleanup(self): # this function is called every second by the timer
+	def tick(self): # called every second by the main window's teamTimer
+		for widget in newEntryWidget.instances:
+			widget.updateTimer()
+		self.autoCleanup()
+
+	def autoCleanup(self): # this function is called every second by tick
 		if self.ui.autoCleanupCheckBox.isChecked():
 			for tab in newEntryWidget.instances:
 				# logging.info("lastModAge:"+str(tab.lastModAge))
@@ -10517,19 +11923,97 @@ class newEntryWindow(QDialog,Ui_newEntryWindow):
 ##class newEntryWidget(QDialog,Ui_newEntryDialog):
 class newEntryWidget(QWidget,Ui_newEntryWidget):
 	instances=[]
+	# registry of open 'FROM' entries, so that updateTeamTimers (hold check) and fsParse
+	#  (existing entry check) don't need to scan all instances; maintained by updateRegistry
+	#  on open, on close, and whenever the team or to/from field changes
+	fromExtTeamNameDict={} # key = extTeamName; value = list of widgets
+	fromCallsignDict={} # key = lower-case callsign with spaces removed (#452); value = list of widgets
+	fromDeviceDict={} # key = (fleet,dev); value = list of widgets
+	registryCount=0 # to preserve creation order when combining lookups
+	# status hints from message text, in search order (the more final messages first);
+	#  note, these hints can be trumped by clicking the status button AFTER typing
+	statusKeywordList=[
+		["at ic","At IC"],
+		["requesting transport","Waiting for Transport"],
+		["enroute to ic","In Transit"],
+		["starting assignment","Working"],
+		["completed assignment",""],
+		["departing ic","In Transit"],
+		["standby","STANDBY"],
+		["hold position","STANDBY"],
+		["requesting deputy","STANDBY"],
+		["10-8","Available"],
+		["10-97","Working"],
+		["10-10","Off Duty"]]
+	locatedKeywords=['located','found'] # define these separately because they also apply to 'subject located'
+	clueKeywords=locatedKeywords+['clue','interview'] # keywords that trigger the 'looks like a clue' popup
+	# all of the above keywords, compiled into one pattern, so that each check is a single pass
+	#  over the message; the lookahead allows overlapping matches; longest keywords first, so
+	#  that a keyword is not hidden by a shorter keyword starting at the same position
+	keywordRegex=re.compile('(?=('+'|'.join([re.escape(k) for k in sorted(set([x[0] for x in statusKeywordList]+clueKeywords+['subject','evac']),key=len,reverse=True)])+'))')
+	keywordDebounceMsec=250 # run the keyword checks once per pause in typing, rather than on every keystroke
 ##	newEntryDialogPositionList=[]
 ##	newEntryDialogUsedPositionList=[]
 ##	for n in range(50):
 ##		newEntryDialogPositionList.append([newEntryDialog_x0+n*newEntryDialog_dx,newEntryDialog_y0+n*newEntryDialog_dy])
 ##		newEntryDialogUsedPositionList.append(False)
 ##	def __init__(self,parent,position,sec,formattedLocString='',fleet='',dev='',origLocString='',amendFlag=False,amendRow=None):
-	def __init__(self,parent,sec=0,formattedLocString='',fleet='',dev='',origLocString='',amendFlag=False,amendRow=None,isMostRecentForCallsign=False):
+	def __init__(self,parent,sec=0,formattedLocString='',fleet='',dev='',origLocString='',amendFlag=False,amendRow=None,isMostRecentForCallsign=False,pooled=False):
 		QDialog.__init__(self)
 
 		self.ui=Ui_newEntryWidget()
+		self.parent=parent
+		self.throbAnimation=None
+
+		# the expensive part of the build (setupUi, palettes, animations, completer) is done here;
+		#  everything that is specific to one entry is done in activate, so that widgets can be
+		#  built ahead of time (pooled=True) and kept in the parent's newEntryWidgetPool until needed
+		self.ui.setupUi(self)
+
+		blockerPalette=QPalette()
+		blockerPalette.setColor(QPalette.Background,QColor(255,255,255))
+		self.ui.groupBlocker.setPalette(blockerPalette)
+
+		self.setStyleSheet(globalStyleSheet)
+
+		# self.hideChangeCallsignGroup()
+		# self.ui.changeCallsignGroupBox.setVisible(False)
+		# self.ui.firstCallGroupBox.setVisible(False)
+
+		self.changeCallsignGroupAnimation=QPropertyAnimation(self.ui.changeCallsignGroupBox,b'pos')
+		self.changeCallsignGroupAnimation.setDuration(150)
+		self.firstCallGroupAnimation=QPropertyAnimation(self.ui.firstCallGroupBox,b'pos')
+		self.firstCallGroupAnimation.setDuration(150)
+
+		self.callsignGroupBoxShown='init' # to force 'none' to hide the group boxes on this first call
+		self.callsignGroupBoxesShowHide(show='none',animate=False,source='from newEntryWidget init')
+
+		self.setAttribute(Qt.WA_DeleteOnClose) # so that closeEvent gets called when closed by GUI
+		self.palette=QPalette()
+		self.setAutoFillBackground(True)
+
+		self.messageKeywordTimer=QTimer(self)
+		self.messageKeywordTimer.setSingleShot(True)
+		self.messageKeywordTimer.setInterval(newEntryWidget.keywordDebounceMsec)
+		self.messageKeywordTimer.timeout.connect(self.processMessageKeywords)
 
-		logging.info('newEntryWidget __init__ called: formattedLocString='+str(formattedLocString)+' fleet='+str(fleet)+' dev='+str(dev)+' origLocString='+str(origLocString)+' amendFlag='+str(amendFlag)+' amendRow='+str(amendRow)+' isMostRecentForCallsign='+str(isMostRecentForCallsign))
-		self.throbTimer=None
+		self.completer=QCompleter(self.parent.callsignCompletionWordList)
+		# performance speedups: see https://stackoverflow.com/questions/33447843
+		self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+		self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
+		self.completer.popup().setUniformItemSizes(True)
+		self.completer.popup().setLayoutMode(QListView.Batched)
+		completerFont=self.ui.teamField.font()
+		completerFont.setPointSize(int(completerFont.pointSize()*0.60))
+		completerFont.setBold(False)
+		self.completer.popup().setFont(completerFont)
+		self.ui.teamField.setCompleter(self.completer)
+
+		if not pooled:
+			self.activate(sec,formattedLocString,fleet,dev,origLocString,amendFlag,amendRow,isMostRecentForCallsign)
+
+	def activate(self,sec=0,formattedLocString='',fleet='',dev='',origLocString='',amendFlag=False,amendRow=None,isMostRecentForCallsign=False):
+		logging.info('newEntryWidget activate called: formattedLocString='+str(formattedLocString)+' fleet='+str(fleet)+' dev='+str(dev)+' origLocString='+str(origLocString)+' amendFlag='+str(amendFlag)+' amendRow='+str(amendRow)+' isMostRecentForCallsign='+str(isMostRecentForCallsign))
 		self.amendFlag=amendFlag
 		self.amendRow=amendRow
 		self.attachedCallsignList=[]
@@ -10539,7 +12023,6 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		self.origLocString=origLocString
 		self.fleet=fleet
 		self.dev=dev
-		self.parent=parent
 		self.isMostRecentForCallsign=isMostRecentForCallsign
 		self.insideQuickText=False
 		self.prevActionWasQuickText=False
@@ -10559,59 +12042,25 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 
 		self.newCallsignFromCCD=None
 		if fleet:
-			self.originalCallsign=parent.getCallsign(fleet,dev)
+			self.originalCallsign=self.parent.getCallsign(fleet,dev)
 		elif dev:
-			self.originalCallsign=parent.getCallsign(dev)
+			self.originalCallsign=self.parent.getCallsign(dev)
 		else:
 			self.originalCallsign=None
 		if amendFlag:
-			row=parent.radioLog[amendRow]
+			row=self.parent.radioLog[amendRow]
 			self.sec=row[6]
 			self.formattedLocString=row[4]
 ##		newEntryDialog.newEntryDialogUsedPositionList[self.position]=True
 		newEntryWidget.instances.append(self)
-		self.ui.setupUi(self)
-
-		blockerPalette=QPalette()
-		blockerPalette.setColor(QPalette.Background,QColor(255,255,255))
-		self.ui.groupBlocker.setPalette(blockerPalette)
-
-		self.setStyleSheet(globalStyleSheet)
-
-		# self.hideChangeCallsignGroup()
-		# self.ui.changeCallsignGroupBox.setVisible(False)
-		# self.ui.firstCallGroupBox.setVisible(False)
-
-		self.changeCallsignGroupAnimation=QPropertyAnimation(self.ui.changeCallsignGroupBox,b'pos')
-		self.changeCallsignGroupAnimation.setDuration(150)
-		self.firstCallGroupAnimation=QPropertyAnimation(self.ui.firstCallGroupBox,b'pos')
-		self.firstCallGroupAnimation.setDuration(150)
-
-		self.callsignGroupBoxShown='init' # to force 'none' to hide the group boxes on this first call
-		self.callsignGroupBoxesShowHide(show='none',animate=False,source='from newEntryWidget init')
-
-		self.setAttribute(Qt.WA_DeleteOnClose) # so that closeEvent gets called when closed by GUI
-		self.palette=QPalette()
-		self.setAutoFillBackground(True)
+		newEntryWidget.registryCount+=1
+		self.registrySeq=newEntryWidget.registryCount
+		self.registryKeys=[] # [dict,key] pairs this widget is currently registered under
 		self.clueDialogOpen=False # only allow one clue dialog at a time per newEntryWidget
 		self.subjectLocatedDialogOpen=False
-		self.locatedKeywords=['located','found'] # define these separately because they also apply to 'subject located'
-		self.clueKeywords=self.locatedKeywords+['clue','interview'] # keywords that trigger the 'looks like a clue' popup
 		self.cluePopupShown=False
 		self.interviewPopupShown=False
 
-		self.completer=QCompleter(self.parent.callsignCompletionWordList)
-		# performance speedups: see https://stackoverflow.com/questions/33447843
-		self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-		self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
-		self.completer.popup().setUniformItemSizes(True)
-		self.completer.popup().setLayoutMode(QListView.Batched)
-		completerFont=self.ui.teamField.font()
-		completerFont.setPointSize(int(completerFont.pointSize()*0.60))
-		completerFont.setBold(False)
-		self.completer.popup().setFont(completerFont)
-		self.ui.teamField.setCompleter(self.completer)
-
 # 		logging.info(" new entry widget opened.  allteamslist:"+str(self.parent.allTeamsList))
 		if len(self.parent.allTeamsList)<2:
 			self.ui.teamComboBox.setEnabled(False)
@@ -10659,6 +12108,9 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		self.ui.teamField.textChanged.connect(self.setStatusFromTeam)
 		self.ui.teamField.textChanged.connect(self.updateTabLabel)
 		self.ui.to_fromField.currentIndexChanged.connect(self.updateTabLabel)
+		self.ui.teamField.textChanged.connect(self.updateRegistry)
+		self.ui.to_fromField.currentIndexChanged.connect(self.updateRegistry)
+		self.updateRegistry()
 		self.ui.messageField.textChanged.connect(self.messageTextChanged)
 		self.ui.statusButtonGroup.buttonClicked.connect(self.setStatusFromButton)
 
@@ -10689,9 +12141,6 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		#  during the continue period.
 		self.parent.newEntryWindow.ui.tabWidget.currentWidget().ui.messageField.deselect()
 
-		self.timer=QTimer(self)
-		self.timer.start(1000)
-		self.timer.timeout.connect(self.updateTimer)
 		
 		self.relayed=None
 		# store field values in case relayed checkbox is toggled accidentally
@@ -10785,25 +12234,8 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 			self.parent.pendingActivationChange=False # clear it here always, since it was just checked
 			self.ui.teamField.setToolTip('') # tooltip gets in the way when field is focused
 
-	def throb(self,n=0):
-		# this function calls itself recursivly 25 times to throb the background blue->white
-# 		logging.info("throb:n="+str(n))
-		self.palette.setColor(QPalette.Background,QColor(n*10,n*10,255))
-		self.setPalette(self.palette)
-		if n<25:
-			#fix #333: make throbTimer a normal timer and then call throbTimer.setSingleShot,
-			# so we can just stop it using .stop() when the widget is closed
-			# to avert 'wrapped C/C++ object .. has been deleted'
-# 			self.throbTimer=QTimer.singleShot(15,lambda:self.throb(n+1))
-			self.throbTimer=QTimer()
-			self.throbTimer.timeout.connect(lambda:self.throb(n+1))
-			self.throbTimer.setSingleShot(True)
-			self.throbTimer.start(15)
-		else:
-# 			logging.info("throb complete")
-			self.throbTimer=None
-			self.palette.setColor(QPalette.Background,QColor(255,255,255))
-			self.setPalette(self.palette)
+	def throb(self):
+		throbWidget(self)
 
 	def updateTimer(self):
 		# # pause all timers if there are any clue or subject or changeCallsign dialogs open
@@ -10917,6 +12349,7 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		self.ui.teamField.setSelection(5,1)
 
 	def accept(self):
+		self.flushMessageKeywords() # in case the operator accepts before the typing pause
 		if not self.clueDialogOpen and not self.subjectLocatedDialogOpen:
 			# getValues return value: [time,to_from,team,message,self.formattedLocString,status,self.sec,self.fleet,self.dev,self.origLocString]
 			logging.info("Accepted")
@@ -10975,7 +12408,7 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 					tmpTxt=" "+self.parent.radioLog[self.amendRow][1]+" "+self.parent.radioLog[self.amendRow][2]
 					# if the old team tab is now empty, remove it
 					if prevTeam!=newTeam:
-						prevEntryCount=len([entry for entry in self.parent.radioLog if entry[2]==prevTeam])
+						prevEntryCount=len(self.parent.radioLogTeamIndex.getEntries(prevTeam))
 						logging.info("number of entries for the previous team:"+str(prevEntryCount))
 						if prevEntryCount==1:
 							prevExtTeamName=getExtTeamName(prevTeam)
@@ -11000,15 +12433,21 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 				self.parent.radioLog[self.amendRow][2]=niceTeamName
 				self.parent.radioLog[self.amendRow][3]=self.ui.messageField.text()+"\n[AMENDED "+time.strftime('%H%M')+"; WAS"+tmpTxt+": '"+lastMsg+"']"+olderMsgs
 				self.parent.radioLog[self.amendRow][5]=status
+				self.parent.radioLogSearchIndex.update(self.parent.radioLog[self.amendRow])
+				self.parent.radioLogTeamIndex.update(self.parent.radioLog[self.amendRow])
+				self.parent.radioLogOpPeriodIndex.update(self.parent.radioLog[self.amendRow])
+				self.parent.radioLogPrintWatermarks.update(self.parent.radioLog[self.amendRow])
 				# use to_from value "AMEND" and blank msg text to make sure team timer does not reset
-				self.parent.newEntryProcessTeam(niceTeamName,status,"AMEND","",self.amendFlag)
+				self.parent.newEntryProcessTeam(niceTeamName,status,"AMEND","",self.amendFlag,entry=self.parent.radioLog[self.amendRow])
 				
 				# reapply the filter on team tables, in case callsign was changed
 				for t in self.parent.ui.tableViewList[1:]:
-					t.model().invalidateFilter()
+					if t: # None if not built yet
+						t.model().invalidateFilter()
 			else:
 				val=self.getValues()
 				val[3]=prefix+val[3]
+				newValuesList=[]
 				# make note of callsign change, if the previous callsign already has any saved entries
 				#  (that check must be done here instead of in the CCD, in case of repeated CCD calls);
 				#  was the change made from CCD (change-and-remember), or typed in (one-time)?
@@ -11039,11 +12478,12 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 							oldCallsignEntry[3]+=', previously associated with this callsign, but now associated with callsign "'+str(self.newCallsignFromCCD)+'"; used as a one-time callsign change for a new entry from "'+str(val[2])+'"; see concurrent message from "'+str(val[2])+'"]'
 					else:
 						oldCallsignEntry[3]+=', still associated with this callsign, but used in a one-time callsign change for "'+str(val[2])+'"; see concurrent message from that callsign]'
-					self.parent.newEntry(oldCallsignEntry)
+					newValuesList.append(oldCallsignEntry)
 				# unhiding=cse in self.hiddenCallsignList
 				# logging.info('hiddenCallsignList='+str(self.hiddenCallsignList)+'  unhiding='+str(unhiding))
 				# self.parent.newEntry(val,self.amendFlag,unhiding=unhiding)
-				self.parent.newEntry(val,self.amendFlag)
+				newValuesList.append(val)
+				self.parent.newEntries(newValuesList,self.amendFlag) # one model insert for both entries
 	
 			# make entries for attached callsigns
 			# values array format: [time,to_from,team,message,locString,status,sec,fleet,dev]
@@ -11151,11 +12591,11 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 			return
 		else:
 			# logging.info('newEntryWidget.closeEvent t3')
-			self.timer.stop()
+			self.messageKeywordTimer.stop()
 			# fix #333: stop mid-throb to avert runtime error
-			#  but only if the throbTimer was actually started
-			if self.throbTimer:
-				self.throbTimer.stop()
+			#  but only if the throb animation was actually started
+			if self.throbAnimation:
+				self.throbAnimation.stop()
 			# if there is a pending GET request (locator), send it now with the
 			#  specified callsign
 			# self.parent.sendPendingGet(self.ui.teamField.text())
@@ -11163,9 +12603,34 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 	##		self.parent.newEntryWindow.removeTab(self.parent.newEntryWindow.ui.tabWidget.indexOf(self))
 			self.parent.newEntryWindow.removeTab(self)
 			newEntryWidget.instances.remove(self)
+			self.updateRegistry(remove=True)
 ##		else:
 ##			event.ignore()
 
+	def updateRegistry(self,*args,remove=False):
+		# unregister from the previous keys, then register under the current keys if this is a 'FROM' entry;
+		#  any team whose hold state may have changed is marked dirty, for the next updateTeamTimers tick
+		for [d,key] in self.registryKeys:
+			widgets=d.get(key,[])
+			if self in widgets:
+				widgets.remove(self)
+			if not widgets:
+				d.pop(key,None)
+			if d is newEntryWidget.fromExtTeamNameDict:
+				self.parent.teamTabsDirtySet.add(key)
+		self.registryKeys=[]
+		if remove or self.ui.to_fromField.currentText()!="FROM":
+			return
+		t=self.ui.teamField.text()
+		if t:
+			self.registryKeys.append([newEntryWidget.fromExtTeamNameDict,getExtTeamName(t)])
+			self.registryKeys.append([newEntryWidget.fromCallsignDict,t.lower().replace(' ','')])
+		self.registryKeys.append([newEntryWidget.fromDeviceDict,(self.fleet,self.dev)])
+		for [d,key] in self.registryKeys:
+			d.setdefault(key,[]).append(self)
+			if d is newEntryWidget.fromExtTeamNameDict:
+				self.parent.teamTabsDirtySet.add(key)
+
 	def setStatusFromTeam(self):
 ##		self.timer.start(newEntryDialogTimeoutSeconds*1000) # reset the timeout
 		extTeamName=getExtTeamName(self.ui.teamField.text())
@@ -11477,13 +12942,31 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 			prev=self.ui.messageField.text()
 			self.prevActionWasQuickText=self.insideQuickText # avoid recursion loop
 			self.ui.messageField.setText(prev[:-1]+' '+prev[-1])
+		# quick text (and other programmatic changes) are processed right away; typing is
+		#  processed once the operator pauses (or when the entry is accepted - see accept)
+		if self.insideQuickText or not self.ui.messageField.hasFocus():
+			self.messageKeywordTimer.stop()
+			self.processMessageKeywords()
+		else:
+			self.messageKeywordTimer.start()
+		self.ui.messageField.deselect()
+		self.prevActionWasQuickText=self.insideQuickText # avoid recursion loop
+
+	def flushMessageKeywords(self):
+		# run any pending (debounced) keyword checks now
+		if self.messageKeywordTimer.isActive():
+			self.messageKeywordTimer.stop()
+			self.processMessageKeywords()
+
+	def processMessageKeywords(self):
 		message=self.ui.messageField.text().lower()
+		foundKeywords=set(newEntryWidget.keywordRegex.findall(message))
 		extTeamName=getExtTeamName(self.ui.teamField.text())
 		prevStatus=""
 		if extTeamName in teamStatusDict:
 			prevStatus=teamStatusDict[extTeamName]
 		newStatus="" #  need to actively set it back to blank if neeeded, since this function is called on every text change
-		# use an if/elif/else clause, which requires a search order; use the more final messages first
+		# use the search order of statusKeywordList; use the more final messages first
 		# note, these hints can be trumped by clicking the status button AFTER typing
 		
 		# multiple things have to be in place to have a new status text here actually
@@ -11493,42 +12976,23 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		#     so that it never gets clicked and is not visible, but, it must exist)
 		# 2. the clicked() signal from that button must have a reciever of
 		#     newEntryWidget.quickTextAction()
-		if "at ic" in message:
-			newStatus="At IC"
-		elif "requesting transport" in message:
-			newStatus="Waiting for Transport"
-		elif "enroute to ic" in message:
-			newStatus="In Transit"
-		elif "starting assignment" in message:
-			newStatus="Working"
-		elif "completed assignment" in message:
-			newStatus=""
-		elif "departing ic" in message:
-			newStatus="In Transit"
-		elif "standby" in message:
-			newStatus="STANDBY"
-		elif "hold position" in message:
-			newStatus="STANDBY"
-		elif "requesting deputy" in message:
-			newStatus="STANDBY"
-		elif "10-8" in message:
-			newStatus="Available"
-		elif "10-97" in message:
-			newStatus="Working"
-		elif "10-10" in message:
-			newStatus="Off Duty"
-		elif prevStatus=="Available" and "evac" in message:
-			newStatus="In Transit"
+		for [keyword,status] in newEntryWidget.statusKeywordList:
+			if keyword in foundKeywords:
+				newStatus=status
+				break
 		else:
-			newStatus=prevStatus
+			if prevStatus=="Available" and "evac" in foundKeywords:
+				newStatus="In Transit"
+			else:
+				newStatus=prevStatus
 		
 		#577 #578 - check for text that looks like a clue or interview, and show popup as needed
 		#642 - don't show the popup if subject located dialog is open
 
 		#676 - 'found/located subject', 'subject [name] found/located' are unambiguous: open the subject located dialog immediately
-		if 'subject' in message and not self.subjectLocatedDialogOpen:
+		if 'subject' in foundKeywords and not self.subjectLocatedDialogOpen:
 			for keyword in self.locatedKeywords:
-				if keyword in message:
+				if keyword in foundKeywords:
 					# if self.cluePopupShown:
 					# 	self.cluePopup.reject()
 					try:
@@ -11548,7 +13012,7 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		if not self.cluePopupShown and not self.subjectLocatedDialogOpen:
 			msg=None
 			for keyword in self.clueKeywords:
-				if keyword in message:
+				if keyword in foundKeywords:
 					msg='Since you typed "'+keyword+'", it looks like you meant to click "LOCATED A CLUE".\n\nDo you want to open a clue report now?\n\n(If so, click \'Yes\' or press Shift-Enter or Ctrl-Enter, and everything typed so far will be copied to the Clue Description field.)\n\n(If not, click \'No\' or press the \'Escape\' key to close this popup and continue the message.)\n\n(If you also type \'subject\', the Subject Located form will open automatically.)'
 			if msg:
 				logging.info('"Looks like a clue" popup shown; message so far: "'+message+'"')
@@ -11670,7 +13134,6 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 					# logging.info('setting tmpNewStatus to '+newStatus)
 					self.tmpNewStatus=newStatus
 		self.ui.messageField.deselect()
-		self.prevActionWasQuickText=self.insideQuickText # avoid recursion loop
 
 	def warnNoStatusChange(self):
 		box=QMessageBox(QMessageBox.Warning,"Warning","For safety reasons, changing the status from an older message (not the most recent message for this callsign) is disabled.\n\nTo change the status right now, you would need to create a new entry, or amend the most recent entry for this callsign.",
@@ -11685,6 +13148,7 @@ class newEntryWidget(QWidget,Ui_newEntryWidget):
 		
 	def setStatusFromButton(self):
 ##		self.timer.start(newEntryDialogTimeoutSeconds*1000) # reset the timeout
+		self.flushMessageKeywords() # so a pending keyword check can't override the clicked status afterwards
 		clickedStatus=self.ui.statusButtonGroup.checkedButton().text()
 		extTeamName=getExtTeamName(self.ui.teamField.text())
 		# teamStatusDict[extTeamName]=clickedStatus
@@ -11739,7 +13203,7 @@ class clueDialog(QDialog,Ui_clueDialog):
 		self.ui.setupUi(self)
 		self.setStyleSheet(globalStyleSheet)
 		self.ui.timeField.setText(t)
-		self.ui.dateField.setText(time.strftime("%x"))
+		self.ui.dateField.setText(time.strftime(clueDateFormat))
 		self.ui.callsignField.setText(callsign)
 		self.ui.radioLocField.setText(re.sub(' +','\n',radioLoc)) # split over two lines; shorter lines are better for lat/lon
 		self.ui.clueNumberField.setText(str(newClueNumber))
@@ -11805,25 +13269,8 @@ class clueDialog(QDialog,Ui_clueDialog):
 			self.parent.parent.activationChange()
 
 	#683 - throb - copied from newEntryWidget.throb()
-	def throb(self,n=0):
-		# this function calls itself recursivly 25 times to throb the background blue->white
-# 		logging.info("throb:n="+str(n))
-		self.palette.setColor(QPalette.Background,QColor(n*10,n*10,255))
-		self.setPalette(self.palette)
-		if n<25:
-			#fix #333: make throbTimer a normal timer and then call throbTimer.setSingleShot,
-			# so we can just stop it using .stop() when the widget is closed
-			# to avert 'wrapped C/C++ object .. has been deleted'
-# 			self.throbTimer=QTimer.singleShot(15,lambda:self.throb(n+1))
-			self.throbTimer=QTimer()
-			self.throbTimer.timeout.connect(lambda:self.throb(n+1))
-			self.throbTimer.setSingleShot(True)
-			self.throbTimer.start(15)
-		else:
-# 			logging.info("throb complete")
-			self.throbTimer=None
-			self.palette.setColor(QPalette.Background,QColor(255,255,255))
-			self.setPalette(self.palette)
+	def throb(self):
+		throbWidget(self)
 
 	def customFocusOutEvent(self,widget):
 		if 'interview' in widget.toPlainText().lower():
@@ -12060,7 +13507,7 @@ class nonRadioClueDialog(QDialog,Ui_nonRadioClueDialog):
 		self.ui.setupUi(self)
 		self.setStyleSheet(globalStyleSheet)
 		self.ui.timeField.setText(t)
-		self.ui.dateField.setText(time.strftime("%x"))
+		self.ui.dateField.setText(time.strftime(clueDateFormat))
 		self.ui.clueNumberField.setText(str(newClueNumber))
 		self.parent=parent
 		# self.setWindowFlags(Qt.WindowStaysOnTopHint)
@@ -12100,25 +13547,8 @@ class nonRadioClueDialog(QDialog,Ui_nonRadioClueDialog):
 			self.parent.activationChange()
 		
 	#683 - throb - copied from newEntryWidget.throb()
-	def throb(self,n=0):
-		# this function calls itself recursivly 25 times to throb the background blue->white
-# 		logging.info("throb:n="+str(n))
-		self.palette.setColor(QPalette.Background,QColor(n*10,n*10,255))
-		self.setPalette(self.palette)
-		if n<25:
-			#fix #333: make throbTimer a normal timer and then call throbTimer.setSingleShot,
-			# so we can just stop it using .stop() when the widget is closed
-			# to avert 'wrapped C/C++ object .. has been deleted'
-# 			self.throbTimer=QTimer.singleShot(15,lambda:self.throb(n+1))
-			self.throbTimer=QTimer()
-			self.throbTimer.timeout.connect(lambda:self.throb(n+1))
-			self.throbTimer.setSingleShot(True)
-			self.throbTimer.start(15)
-		else:
-# 			logging.info("throb complete")
-			self.throbTimer=None
-			self.palette.setColor(QPalette.Background,QColor(255,255,255))
-			self.setPalette(self.palette)
+	def throb(self):
+		throbWidget(self)
 
 	def customFocusOutEvent(self,widget):
 		if 'interview' in widget.toPlainText().lower():
@@ -12282,14 +13712,20 @@ class clueLogDialog(QDialog,Ui_clueLogDialog):
 		self.ui.tableView.verticalHeader().sectionClicked.connect(self.headerClicked)
 		self.ui.addNonRadioClueButton.clicked.connect(self.parent.addNonRadioClue)
 		self.ui.printButton.clicked.connect(self.printClueLogCB)
+		# the print button's menu also offers clue reports for a range of clue numbers
+		self.printMenu=QMenu(self)
+		self.printMenu.addAction('Print Clue Log...').triggered.connect(self.printClueLogCB)
+		self.printMenu.addAction('Print Clue Reports...').triggered.connect(self.printClueReportsCB)
+		self.ui.printButton.setMenu(self.printMenu)
+		self.ui.printButton.setPopupMode(QToolButton.MenuButtonPopup)
 
 		self.ui.tableView.setSelectionMode(QAbstractItemView.NoSelection)
 		self.ui.tableView.setFocusPolicy(Qt.NoFocus)
 
 	def showEvent(self,event):
+		self.ui.tableView.setFont(self.parent.fonts.getFont('limited'))
 		self.ui.tableView.resizeRowsToContents()
 		self.ui.tableView.scrollToBottom()
-		self.ui.tableView.setStyleSheet("font-size:"+str(self.parent.limitedFontSize)+"pt")
 
 	def resizeEvent(self,event):
 		self.ui.tableView.resizeRowsToContents()
@@ -12316,6 +13752,28 @@ class clueLogDialog(QDialog,Ui_clueLogDialog):
 		else:
 			self.parent.printClueLogDialog.show()
 
+	def printClueReportsCB(self):
+		clueNumbers=[int(clue[0]) for clue in self.parent.clueLog if str(clue[0]).isdigit()]
+		if len(clueNumbers)==0:
+			crit=QMessageBox(QMessageBox.Critical,"No Clues to Print","There are no clues to print.",QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+			crit.show()
+			crit.raise_()
+			crit.exec_()
+			return
+		[text,ok]=QInputDialog.getText(self,"Print Clue Reports","Clue numbers to print (for example: 3-7):",QLineEdit.Normal,str(min(clueNumbers))+'-'+str(max(clueNumbers)))
+		if not ok:
+			return
+		try:
+			parts=[int(x) for x in text.replace(' ','').split('-')]
+			[first,last]=[parts[0],parts[-1]]
+		except:
+			crit=QMessageBox(QMessageBox.Critical,"Invalid Clue Numbers","'"+text+"' is not a clue number or range of clue numbers.",QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+			crit.show()
+			crit.raise_()
+			crit.exec_()
+			return
+		self.parent.printClueReportRange(min(first,last),max(first,last))
+
 	def toggleRaise(self):
 		if self.isVisible():
 			self.hide()
@@ -12333,7 +13791,7 @@ class subjectLocatedDialog(QDialog,Ui_subjectLocatedDialog):
 		self.ui.setupUi(self)
 		self.setStyleSheet(globalStyleSheet)
 		self.ui.timeField.setText(t)
-		self.ui.dateField.setText(time.strftime("%x"))
+		self.ui.dateField.setText(time.strftime(clueDateFormat))
 		self.ui.callsignField.setText(callsign)
 		self.ui.radioLocField.setText(re.sub(' +','\n',radioLoc))
 		self.parent=parent
@@ -12399,25 +13857,8 @@ class subjectLocatedDialog(QDialog,Ui_subjectLocatedDialog):
 			self.parent.parent.activationChange()
 
 	#683 - throb - copied from newEntryWidget.throb()
-	def throb(self,n=0):
-		# this function calls itself recursivly 25 times to throb the background blue->white
-# 		logging.info("throb:n="+str(n))
-		self.palette.setColor(QPalette.Background,QColor(n*10,n*10,255))
-		self.setPalette(self.palette)
-		if n<25:
-			#fix #333: make throbTimer a normal timer and then call throbTimer.setSingleShot,
-			# so we can just stop it using .stop() when the widget is closed
-			# to avert 'wrapped C/C++ object .. has been deleted'
-# 			self.throbTimer=QTimer.singleShot(15,lambda:self.throb(n+1))
-			self.throbTimer=QTimer()
-			self.throbTimer.timeout.connect(lambda:self.throb(n+1))
-			self.throbTimer.setSingleShot(True)
-			self.throbTimer.start(15)
-		else:
-# 			logging.info("throb complete")
-			self.throbTimer=None
-			self.palette.setColor(QPalette.Background,QColor(255,255,255))
-			self.setPalette(self.palette)
+	def throb(self):
+		throbWidget(self)
 
 	def accept(self):
 		location=self.ui.locationField.text()
@@ -13327,6 +14768,135 @@ class teamNotesDialog(QDialog,Ui_teamNotesDialog):
 			notes=str(self.parent.teamNotesDict.get(self.extTeamName,'No notes for '+self.niceTeamName))
 			self.ui.notesField.setPlainText(notes)
 
+# model for the sidebar team table: teams are laid out top-to-bottom, then left-to-right
+class teamTabsTableModel(QAbstractTableModel):
+	def __init__(self,parent=None,*args):
+		QAbstractTableModel.__init__(self,parent,*args)
+		self.parent=parent
+		self.teams=[] # nice team names, in display order
+		self.texts=[] # displayed text for each team, including hidden brackets and hotkey prefix
+		self.colors=[] # [fgColor,bgColor] for each team, as last emitted
+		self.rows=0
+		self.cols=0
+		self.italicFont=QFont()
+		self.italicFont.setItalic(True)
+
+	def rowCount(self,parent=QModelIndex()):
+		return self.rows
+
+	def columnCount(self,parent=QModelIndex()):
+		return self.cols
+
+	def teamIndex(self,index):
+		if not index.isValid():
+			return -1
+		i=index.column()*self.rows+index.row()
+		if i<len(self.teams):
+			return i
+		return -1 # empty cell
+
+	def modelIndex(self,i):
+		return self.createIndex(i%self.rows,int(i/self.rows))
+
+	def extTeamNameAt(self,index):
+		i=self.teamIndex(index)
+		if i<0:
+			return None
+		return getExtTeamName(self.teams[i])
+
+	def buildText(self,t):
+		txt=t
+		# modifications for hidden tabs:
+		#  - always italic
+		#  - light gray text if/when background is white; black text otherwise
+		#  - always wrap in square brackets []
+		#  - use bgHidden for background color, if specificed
+		if getExtTeamName(t) in self.parent.hiddenTeamTabsList:
+			txt='['+txt+']'
+		if self.showTeamHotkeys:
+			hotkey=self.hotkeyRDict.get(t,"")
+			if hotkey:
+				txt=hotkey+': '+txt
+		return txt
+
+	def buildColors(self,t):
+		# use the status and the age to determine the color based on blinkToggle
+		extTeamName=getExtTeamName(t)
+		hidden=extTeamName in self.parent.hiddenTeamTabsList
+		status=teamStatusDict.get(extTeamName,None)
+		age=getTeamSecondsSinceContact(extTeamName)
+		if self.parent.blinkToggle==1 and status not in ["At IC","Off Duty"]:
+			if age>=self.parent.timeoutRedSec:
+				status='TIMED_OUT_RED'
+			elif age>=self.parent.timeoutOrangeSec:
+				status='TIMED_OUT_ORANGE'
+		ad=statusAppearanceDict.get(status,{})
+		fgColor=ad.get('foreground',None)
+		bgColor=ad.get('background',None)
+		bgHidden=ad.get('bgHidden',None)
+		blink=ad.get('blink',False)
+		if hidden:
+			fgColor=QColor('#555')
+			bgColor=bgHidden
+		if blink and self.parent.blinkToggle==1:
+			fgColor=None
+			if hidden:
+				fgColor=QColor('#555')
+			bgColor=None
+		fgColor=QColor(fgColor or Qt.black)
+		bgColor=QColor(bgColor or Qt.white)
+		return [fgColor,bgColor]
+
+	# setTeams - returns True if the table was reset (team list or shape changed) or any text changed
+	def setTeams(self,teams,rows,cols):
+		self.hotkeyRDict={v:k for k,v in self.parent.hotkeyDict.items()}
+		self.showTeamHotkeys=self.parent.ui.teamHotkeysWidget.isVisible()
+		texts=[self.buildText(t) for t in teams]
+		if teams!=self.teams or rows!=self.rows or cols!=self.cols:
+			self.beginResetModel()
+			self.teams=list(teams)
+			self.texts=texts
+			self.colors=[self.buildColors(t) for t in teams]
+			self.rows=rows
+			self.cols=cols
+			self.endResetModel()
+			return True
+		changed=False
+		for i in range(len(texts)):
+			if texts[i]!=self.texts[i]:
+				self.texts[i]=texts[i]
+				index=self.modelIndex(i)
+				self.dataChanged.emit(index,index,[Qt.DisplayRole,Qt.FontRole])
+				changed=True
+		return changed
+
+	def updateColors(self):
+		for i in range(len(self.teams)):
+			colors=self.buildColors(self.teams[i])
+			if colors!=self.colors[i]:
+				self.colors[i]=colors
+				index=self.modelIndex(i)
+				self.dataChanged.emit(index,index,[Qt.ForegroundRole,Qt.BackgroundRole])
+
+	def data(self,index,role=Qt.DisplayRole):
+		i=self.teamIndex(index)
+		if i<0:
+			return QVariant()
+		if role==Qt.DisplayRole:
+			return self.texts[i]
+		elif role==Qt.ForegroundRole:
+			return QBrush(self.colors[i][0])
+		elif role==Qt.BackgroundRole:
+			return QBrush(self.colors[i][1])
+		elif role==Qt.FontRole:
+			if getExtTeamName(self.teams[i]) in self.parent.hiddenTeamTabsList:
+				return self.italicFont
+		return QVariant()
+
+	def flags(self,index):
+		return Qt.ItemIsEnabled|Qt.ItemIsSelectable
+
+
 class clueTableModel(QAbstractTableModel):
 	header_labels=['#','DESCRIPTION','TEAM','TIME','DATE','O.P.','LOCATION','INSTRUCTIONS','RADIO LOC.','']
 	def __init__(self,datain,parent=None,*args):
@@ -13424,6 +14994,50 @@ class MyTableModel(QAbstractTableModel):
 	def flags(self,index):
 		return Qt.ItemIsEnabled|Qt.ItemIsSelectable|Qt.ItemIsEditable
 
+	# findInsertIndex - binary search for the index at which an entry with the given sec should be inserted:
+	#  after any existing entries with the same or earlier sec, so the 1e10 blank row stays at the bottom;
+	#  an entry whose sec is not a float goes at the very end, same as the previous linear search
+	def findInsertIndex(self,sec):
+		if not isinstance(sec,float):
+			return len(self.arraydata)
+		lo=0
+		hi=len(self.arraydata)
+		while lo<hi:
+			mid=(lo+hi)//2
+			if sec<self.arraydata[mid][6]:
+				hi=mid
+			else:
+				lo=mid+1
+		return lo
+
+	# insertEntries - merge a batch of entries into arraydata (the radioLog list, modified in place) in time order;
+	#  if the whole batch lands in one place (the usual case) emit one contiguous insert, otherwise one reset
+	def insertEntries(self,entries,emit=True):
+		if not entries:
+			return
+		entries=sorted(entries,key=lambda entry:entry[6] if isinstance(entry[6],float) else float('inf')) # stable: equal sec keeps the given order
+		indices=[self.findInsertIndex(entry[6]) for entry in entries]
+		if indices[0]==indices[-1]:
+			i=indices[0]
+			if emit:
+				self.beginInsertRows(QModelIndex(),i,i+len(entries)-1)
+			self.arraydata[i:i]=entries
+			if emit:
+				self.endInsertRows()
+		else:
+			if emit:
+				self.beginResetModel()
+			merged=[]
+			prev=0
+			for n in range(len(entries)):
+				merged+=self.arraydata[prev:indices[n]]
+				merged.append(entries[n])
+				prev=indices[n]
+			merged+=self.arraydata[prev:]
+			self.arraydata[:]=merged
+			if emit:
+				self.endResetModel()
+
 
 class CustomTableItemDelegate(QStyledItemDelegate):
 	def __init__(self,parent=None):
@@ -13740,5 +15354,6 @@ def main():
 	sys.exit(app.exec_())
 
 if __name__ == "__main__":
+	multiprocessing.freeze_support() # needed for the print worker processes in the frozen executable
 	sys.excepthook = handle_exception
 	main()
@@ -0,0 +1,254 @@
+# #############################################################################
+#
+#  radiologPrint.py - radio log pdf building blocks for radiolog.py
+#
+#   these only take plain data and import no Qt modules, so that the print worker
+#   processes (see MyWindow.renderRadioLogSections in radiolog.py) load just this
+#   module and reportlab, rather than all of radiolog.py
+#
+#  http://github.com/ncssar/radiolog
+#
+# #############################################################################
+
+import os
+import time
+import logging
+import logging.handlers
+from reportlab.lib import colors,utils
+from reportlab.lib.pagesizes import letter,landscape
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Image, Spacer, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet,ParagraphStyle
+from reportlab.lib.units import inch
+
+iconsDir=os.path.join(os.path.dirname(os.path.realpath(__file__)),'icons')
+
+radioLogPrintHeaders=['TIME','T/F','TEAM','MESSAGE','RADIO LOC.','STATUS'] # same as the first columns of MyTableModel.header_labels
+
+# initPrintWorker - runs in each print worker process when it starts: send this process's log records
+#  to logQueue, where the main process's QueueListener passes them on with printWorkerLogHandler
+def initPrintWorker(logQueue):
+	qh=logging.handlers.QueueHandler(logQueue)
+	qh.setFormatter(logging.Formatter('%(message)s')) # the main process's handlers add the rest
+	logging.basicConfig(level=logging.INFO,handlers=[qh],force=True)
+
+# runs in the main process: pass log records from the print worker processes to the current log handlers,
+#  so they go to the session log file even if the handlers have been replaced since the workers started
+class printWorkerLogHandler(logging.Handler):
+	def emit(self,record):
+		logging.getLogger().handle(record)
+
+# log render context - everything about a printed log (radio log, team logs, or clue log) that does not
+#  change from page to page or from table to table: created once per print (or once per worker process
+#  section), so that the logo image is read, and the styles, operator header image and 'Printed' time
+#  are built, only once; the static part of the page header (logo, agency, incident, op period,
+#  printed time and all table lines) is drawn once per pdf as a form object, which each page then
+#  reuses - only the page number cell is drawn for each page
+class logRenderContext():
+	headerColWidthsWithLogo=[x*inch for x in [0.8,4.2,2.5,2.5]]
+	headerColWidthsNoLogo=[x*inch for x in [0.0,5,2.5,2.5]]
+	headerRowHeights=[x*inch for x in [0.3,0.3]]
+
+	def __init__(self,formNameText,opPeriod,agencyNameForPrint,incidentName,printLogoFileName,useOperatorLogin=False,boldInfoCells=True,firstPageNumber=1):
+		self.formNameText=formNameText
+		self.firstPageNumber=firstPageNumber # continuations are numbered from the page after the previous print
+		self.opPeriod=opPeriod
+		self.agencyNameForPrint=agencyNameForPrint
+		self.incidentName=incidentName
+		self.useOperatorLogin=useOperatorLogin
+		self.boldInfoCells=boldInfoCells # radio logs use bold for the incident and page cells; clue logs don't
+		self.printedText="Printed: "+time.strftime("%a %b %d, %Y  %H:%M")
+		self.styles=getSampleStyleSheet()
+		self.styles.add(ParagraphStyle(
+			name='operator',
+			parent=self.styles['Normal'],
+			backColor='lightgrey'
+			))
+		self.operatorHeader='Op.'
+		if useOperatorLogin:
+			operatorImageFile=os.path.join(iconsDir,'user_icon_80px.png')
+			if os.path.isfile(operatorImageFile):
+				logging.info('operator image file found: '+operatorImageFile)
+				self.operatorHeader=Image(operatorImageFile,width=0.16*inch,height=0.16*inch)
+			else:
+				logging.info('operator image file not found: '+operatorImageFile)
+		self.printLogoFileName=None
+		self.logoSize=None # [width,height]
+		if os.path.isfile(printLogoFileName):
+			logging.info("valid logo file "+printLogoFileName)
+			imgReader=utils.ImageReader(printLogoFileName)
+			imgW,imgH=imgReader.getSize()
+			imgAspect=imgH/float(imgW)
+			self.printLogoFileName=printLogoFileName
+			self.logoSize=[0.54*inch/float(imgAspect),0.54*inch]
+		self.headerColWidths=self.headerColWidthsWithLogo if self.logoSize else self.headerColWidthsNoLogo
+		self.formCanvas=None # the canvas that the header form object has been defined on
+		self.radioLogTableStyles={} # key = True for the first chunk of a table, False for the rest
+		self.frameHeight=0
+		self.availHeight=0 # space left on the current page; see buildRadioLogPrintTables
+
+	# setDocTemplate - call before building the table flowables for a new pdf; the frame height is
+	#  reduced by the frame padding, and by a little more to allow for rounding in the row height estimates
+	def setDocTemplate(self,doc):
+		self.frameHeight=doc.height-12-0.1*inch
+		self.availHeight=self.frameHeight
+
+	def getHeaderTable(self):
+		img=None
+		if self.logoSize:
+			img=Image(self.printLogoFileName,width=self.logoSize[0],height=self.logoSize[1])
+		headerTable=[
+				[img,self.agencyNameForPrint,"Incident: "+self.incidentName,""], # the page cell is drawn on each page
+				["","","Operational Period: "+str(self.opPeriod),self.printedText]]
+		t=Table(headerTable,colWidths=self.headerColWidths,rowHeights=self.headerRowHeights)
+		style=[('FONT',(1,0),(1,1),'Helvetica-Bold')]
+		if self.boldInfoCells:
+			style.append(('FONT',(2,0),(3,0),'Helvetica-Bold'))
+		style+=[('FONTSIZE',(1,0),(1,1),18),
+				('SPAN',(0,0),(0,1)),
+				('SPAN',(1,0),(1,1)),
+				('LEADING',(1,0),(1,1),20)]
+		if self.logoSize:
+			style+=[('TOPADDING',(1,0),(1,0),0),
+					('BOTTOMPADDING',(1,1),(1,1),4),
+					('VALIGN',(0,0),(-1,-1),"MIDDLE"),
+					('ALIGN',(0,0),(0,1),"CENTER")]
+		else:
+			style.append(('VALIGN',(1,0),(-1,-1),"MIDDLE"))
+		style+=[('ALIGN',(1,0),(1,-1),"CENTER"),
+				('BOX',(0,0),(-1,-1),2,colors.black),
+				('BOX',(2,0),(-1,-1),2,colors.black),
+				('INNERGRID',(2,0),(3,1),0.5,colors.black)]
+		t.setStyle(TableStyle(style))
+		return t
+
+	def drawHeaderFooter(self,canvas,doc):
+		canvas.saveState()
+		x=doc.leftMargin
+		y=doc.pagesize[1]-sum(self.headerRowHeights)-0.5*inch # enforce a 0.5 inch top margin regardless of paper size
+		if self.formCanvas is not canvas: # first page of this pdf
+			canvas.beginForm('logHeader')
+			t=self.getHeaderTable()
+			t.wrapOn(canvas,doc.width,doc.height)
+			t.drawOn(canvas,x,y)
+			canvas.endForm()
+			self.formCanvas=canvas
+		canvas.doForm('logHeader')
+		pageCell=Table([[self.formNameText+" - Page "+str(self.firstPageNumber-1+canvas.getPageNumber())]],colWidths=self.headerColWidths[3:],rowHeights=self.headerRowHeights[0:1])
+		pageCellStyle=[('VALIGN',(0,0),(-1,-1),"MIDDLE")]
+		if self.boldInfoCells:
+			pageCellStyle.append(('FONT',(0,0),(-1,-1),'Helvetica-Bold'))
+		pageCell.setStyle(TableStyle(pageCellStyle))
+		pageCell.wrapOn(canvas,doc.width,doc.height)
+		pageCell.drawOn(canvas,x+sum(self.headerColWidths[0:3]),y+self.headerRowHeights[1])
+		canvas.restoreState()
+
+	# radio log table styles are built once; the first row after the headers is bold only in the
+	#  first chunk of a table (the 'Radio Log Begins' row)
+	def getRadioLogTableStyle(self,firstChunk=True):
+		if firstChunk not in self.radioLogTableStyles:
+			boldRows=1 if firstChunk else 0
+			self.radioLogTableStyles[firstChunk]=TableStyle([('FONT',(0,0),(-1,-1),'Helvetica'),
+							('FONT',(0,0),(-1,boldRows),'Helvetica-Bold'),
+							('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
+						('BOX', (0,0), (-1,-1), 2, colors.black),
+						('BOX', (0,0), (-1,0), 2, colors.black)])
+		return self.radioLogTableStyles[firstChunk]
+
+def getRadioLogPrintRows(rows,context):
+	styles=context.styles
+	useOperatorLogin=context.useOperatorLogin
+	headers=radioLogPrintHeaders[:]
+	if useOperatorLogin:
+		headers.append(context.operatorHeader)
+	radioLogPrint=[headers]
+	for row in rows:
+		style=styles['Normal']
+		if 'RADIO OPERATOR LOGGED IN' in row[3]:
+			style=styles['operator']
+		printRow=[row[0],row[1],row[2],Paragraph(row[3],style),Paragraph(row[4],styles['Normal']),Paragraph(row[5],styles['Normal'])]
+		if useOperatorLogin:
+			if len(row)>10:
+				printRow.append(row[10])
+			else:
+				printRow.append('')
+		radioLogPrint.append(printRow)
+	return radioLogPrint
+
+def getRadioLogColWidths(useOperatorLogin):
+	if useOperatorLogin:
+		return [x*inch for x in [0.5,0.6,1.25,5.2,1.25,0.9,0.3]]
+	else:
+		return [x*inch for x in [0.5,0.6,1.25,5.5,1.25,0.9]]
+
+def buildRadioLogPrintTable(radioLogPrint,context,firstChunk=True):
+	t=Table(radioLogPrint,repeatRows=1,colWidths=getRadioLogColWidths(context.useOperatorLogin))
+	t.setStyle(context.getRadioLogTableStyle(firstChunk))
+	return t
+
+# getPrintRowHeight - estimated height of a table row, the same way the table will lay it out with
+#  the default cell style: 10pt font with 12pt leading, 6pt left and right padding, 3pt top and bottom padding
+def getPrintRowHeight(printRow,colWidths):
+	height=0
+	for [cell,colWidth] in zip(printRow,colWidths):
+		if isinstance(cell,str):
+			h=12*len(cell.split('\n'))
+		else: # Paragraph or Image
+			h=cell.wrap(colWidth-12,1e6)[1]
+		height=max(height,h)
+	return height+6
+
+# buildRadioLogPrintTables - split a radio log table into page-sized chunks, each with the header row,
+#  with a page break after each chunk that fills a page; one long table would be split by reportlab
+#  at each page, and each split lays out all of the remaining rows again, so the time to build the pdf
+#  would grow with the square of the number of rows; chunks are laid out once, and each chunk's
+#  flowables can be released as soon as its page is done
+# the space left on the current page is kept in context.availHeight, so that consecutive tables (team logs)
+#  are packed onto pages the same way; spaceBefore is added above the table unless it starts a new page
+def buildRadioLogPrintTables(radioLogPrint,context,spaceBefore=0):
+	colWidths=getRadioLogColWidths(context.useOperatorLogin)
+	headers=radioLogPrint[0]
+	headerHeight=getPrintRowHeight(headers,colWidths)
+	flowables=[]
+	chunk=None
+	chunkCount=0
+	for printRow in radioLogPrint[1:] or [None]:
+		rowHeight=getPrintRowHeight(printRow,colWidths) if printRow else 0
+		if chunk is None: # first row of the table
+			if context.availHeight<context.frameHeight: # not at the top of a page
+				if context.availHeight>=spaceBefore+headerHeight+rowHeight:
+					if spaceBefore:
+						flowables.append(Spacer(0,spaceBefore))
+						context.availHeight-=spaceBefore
+				else:
+					flowables.append(PageBreak())
+					context.availHeight=context.frameHeight
+			chunk=[headers]
+			context.availHeight-=headerHeight
+		elif context.availHeight<rowHeight: # this page is full; the rest of the rows start on the next page
+			flowables.append(buildRadioLogPrintTable(chunk,context,firstChunk=chunkCount==0))
+			flowables.append(PageBreak())
+			chunkCount+=1
+			chunk=[headers]
+			context.availHeight=context.frameHeight-headerHeight
+		if printRow:
+			chunk.append(printRow)
+			context.availHeight-=rowHeight
+	flowables.append(buildRadioLogPrintTable(chunk,context,firstChunk=chunkCount==0))
+	return flowables
+
+def getRadioLogDocTemplate(pdfName):
+	# note the topMargin is based on what looks good; you would think that a 0.6 table plus a 0.5 hard
+	# margin (see t.drawOn above) would require a 1.1 margin here, but, not so.
+	return SimpleDocTemplate(pdfName, pagesize=landscape(letter),leftMargin=0.5*inch,rightMargin=0.5*inch,topMargin=1.03*inch,bottomMargin=0.5*inch) # or pagesize=letter
+
+# renderRadioLogSection - runs in a print worker process (or in the print thread, if there is no pool):
+#  render one team's log to its own pdf;
+#  section = [pdfName,team,rows,opPeriod,useOperatorLogin,agencyNameForPrint,incidentName,printLogoFileName]
+#  returns [pdfName,page count]
+def renderRadioLogSection(section):
+	[pdfName,team,rows,opPeriod,useOperatorLogin,agencyNameForPrint,incidentName,printLogoFileName]=section
+	doc=getRadioLogDocTemplate(pdfName)
+	context=logRenderContext("Team: "+team,opPeriod,agencyNameForPrint,incidentName,printLogoFileName,useOperatorLogin)
+	context.setDocTemplate(doc)
+	doc.build(buildRadioLogPrintTables(getRadioLogPrintRows(rows,context),context),onFirstPage=context.drawHeaderFooter,onLaterPages=context.drawHeaderFooter)
+	return [pdfName,doc.page]
@@ -34,39 +34,30 @@ class Ui_teamTabsPopup(object):
         self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame)
         self.verticalLayout_3.setContentsMargins(3, 3, 3, 3)
         self.verticalLayout_3.setObjectName("verticalLayout_3")
-        self.teamTabsTableWidget = QtWidgets.QTableWidget(self.frame)
+        self.teamTabsTableView = QtWidgets.QTableView(self.frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.teamTabsTableWidget.sizePolicy().hasHeightForWidth())
-        self.teamTabsTableWidget.setSizePolicy(sizePolicy)
+        sizePolicy.setHeightForWidth(self.teamTabsTableView.sizePolicy().hasHeightForWidth())
+        self.teamTabsTableView.setSizePolicy(sizePolicy)
         font = QtGui.QFont()
         font.setPointSize(10)
-        self.teamTabsTableWidget.setFont(font)
-        self.teamTabsTableWidget.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.teamTabsTableWidget.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.teamTabsTableWidget.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.teamTabsTableWidget.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.teamTabsTableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.teamTabsTableWidget.setTabKeyNavigation(False)
-        self.teamTabsTableWidget.setProperty("showDropIndicator", False)
-        self.teamTabsTableWidget.setDragDropOverwriteMode(False)
-        self.teamTabsTableWidget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.teamTabsTableWidget.setObjectName("teamTabsTableWidget")
-        self.teamTabsTableWidget.setColumnCount(1)
-        self.teamTabsTableWidget.setRowCount(1)
-        item = QtWidgets.QTableWidgetItem()
-        self.teamTabsTableWidget.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.teamTabsTableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setFlags(QtCore.Qt.ItemIsEnabled)
-        self.teamTabsTableWidget.setItem(0, 0, item)
-        self.teamTabsTableWidget.horizontalHeader().setVisible(False)
-        self.teamTabsTableWidget.verticalHeader().setVisible(False)
-        self.teamTabsTableWidget.verticalHeader().setDefaultSectionSize(25)
-        self.teamTabsTableWidget.verticalHeader().setMinimumSectionSize(25)
-        self.verticalLayout_3.addWidget(self.teamTabsTableWidget)
+        self.teamTabsTableView.setFont(font)
+        self.teamTabsTableView.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.teamTabsTableView.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.teamTabsTableView.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.teamTabsTableView.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
+        self.teamTabsTableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.teamTabsTableView.setTabKeyNavigation(False)
+        self.teamTabsTableView.setProperty("showDropIndicator", False)
+        self.teamTabsTableView.setDragDropOverwriteMode(False)
+        self.teamTabsTableView.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.teamTabsTableView.setObjectName("teamTabsTableView")
+        self.teamTabsTableView.horizontalHeader().setVisible(False)
+        self.teamTabsTableView.verticalHeader().setVisible(False)
+        self.teamTabsTableView.verticalHeader().setDefaultSectionSize(25)
+        self.teamTabsTableView.verticalHeader().setMinimumSectionSize(25)
+        self.verticalLayout_3.addWidget(self.teamTabsTableView)
         self.teamTabsSummaryTableWidget = QtWidgets.QTableWidget(self.frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -160,13 +151,6 @@ class Ui_teamTabsPopup(object):
     def retranslateUi(self, teamTabsPopup):
         _translate = QtCore.QCoreApplication.translate
         teamTabsPopup.setWindowTitle(_translate("teamTabsPopup", "Dialog"))
-        item = self.teamTabsTableWidget.verticalHeaderItem(0)
-        item.setText(_translate("teamTabsPopup", "starter"))
-        item = self.teamTabsTableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("teamTabsPopup", "starter"))
-        __sortingEnabled = self.teamTabsTableWidget.isSortingEnabled()
-        self.teamTabsTableWidget.setSortingEnabled(False)
-        self.teamTabsTableWidget.setSortingEnabled(__sortingEnabled)
         item = self.teamTabsSummaryTableWidget.verticalHeaderItem(0)
         item.setText(_translate("teamTabsPopup", "At IC"))
         item = self.teamTabsSummaryTableWidget.verticalHeaderItem(1)